@@ -0,0 +1,191 @@
+"""Micro-benchmarks for the numeric kernels, with stored baselines.
+
+Run from the repository root:
+
+    python scripts/benchmark.py             # compare against the baseline
+    python scripts/benchmark.py --update    # record a new baseline
+
+Each kernel is first checked against the original inline formulas (the
+per-temperature Shomate and Antoine expressions and the 0.239006 calorie
+factor the pages used before the engines existed), using the constants the
+pages hard-coded. It is then timed at 1, 1e3 and 1e6 points, taking the
+best of several repeats. The run exits with status 1 on any mismatch, or
+when a case is more than ``--threshold`` (default 25%) slower than its
+baseline in scripts/benchmark_baseline.json. Baselines are machine
+specific: record them on the machine that runs the comparison.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from webbook import datastore  # noqa: E402
+from webbook.quantity import QuantityColumn  # noqa: E402
+from webbook.tables import TABLE_BUILDERS  # noqa: E402
+
+BASELINE_PATH = os.path.join(ROOT, "scripts", "benchmark_baseline.json")
+SIZES = (1, 1_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.25
+# Slowdowns smaller than this are treated as timer noise.
+NOISE_FLOOR = 10e-6
+# Evaluation order may differ from the inline formulas by a few ulps.
+RTOL = 1e-10
+ATOL = 1e-12
+
+# Constants as they were written inline in the pages.
+GAS_LOW = (20.44403, 1.051745, -1.098514, 0.377924, 0.010645, 310.2930, 187.7302, 316.3903)
+GAS_HIGH = (-2.107549, 9.311953, -0.557522, -0.020498, 29.30064, 353.6459, 190.4707, 316.3903)
+LIQUID = (26.32602, 1.041373e-10, -6.121360e-11, 1.094033e-11, 2.995196e-12, -7.234262, 74.86891, 0.615002)
+WHITE = (16.45576, 43.28892, -58.73876, 25.60646, -0.086728, -6.657121, 49.97160, 0.000000)
+ANTOINE = (5.03591, 2819.239, 6.399)
+J_TO_CAL = 0.239006
+
+
+def reference_shomate(T, A, B, C, D, E, F, G, H):
+    t = T / 1000
+    Cp = A + B * t + C * t**2 + D * t**3 + E / t**2
+    H_val = A * t + B * t**2 / 2 + C * t**3 / 3 + D * t**4 / 4 - E / t + F - H
+    S_val = A * np.log(t) + B * t + C * t**2 / 2 + D * t**3 / 3 - E / (2 * t**2) + G
+    return np.array([Cp, H_val, S_val])
+
+
+def reference_gas(T):
+    return np.where(T <= 2200, reference_shomate(T, *GAS_LOW), reference_shomate(T, *GAS_HIGH))
+
+
+def reference_pressure(T):
+    A, B, C = ANTOINE
+    return 10 ** (A - (B / (T + C)))
+
+
+def reference_temperature(P):
+    A, B, C = ANTOINE
+    return B / (A - np.log10(P)) - C
+
+
+def _inputs(size, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "gas": rng.uniform(1180.008, 6000, size),
+        "liquid": rng.uniform(317.3, 1180.008, size),
+        "solid": rng.uniform(298, 317.3, size),
+        "antoine_T": rng.uniform(349.8, 553.0, size),
+        "antoine_P": reference_pressure(rng.uniform(349.8, 553.0, size)),
+        "energies": rng.uniform(-1000, 1000, size),
+    }
+
+
+def cases(size):
+    """(name, kernel, reference) triples; each kernel is a zero-argument callable."""
+    data = _inputs(size)
+    gas = datastore.shomate("P", "gas")
+    liquid = datastore.shomate("P", "liquid")
+    solids = datastore.shomate_phases("P", "solid")
+    white = solids.names.index("White Phase")
+    antoine = datastore.antoine("P")
+    energies = QuantityColumn.from_arrays(data["energies"], ["kJ/mol"] * size)
+    return [
+        ("shomate_gas", lambda: np.array(gas.evaluate(data["gas"])), lambda: reference_gas(data["gas"])),
+        ("shomate_liquid", lambda: np.array(liquid.evaluate(data["liquid"])), lambda: reference_shomate(data["liquid"], *LIQUID)),
+        ("shomate_solids", lambda: np.array(solids.evaluate(data["solid"]))[:, white], lambda: reference_shomate(data["solid"], *WHITE)),
+        ("antoine_pressure", lambda: antoine.pressure(data["antoine_T"]), lambda: reference_pressure(data["antoine_T"])),
+        ("antoine_temperature", lambda: antoine.temperature(data["antoine_P"]), lambda: reference_temperature(data["antoine_P"])),
+        ("unit_conversion", lambda: energies.to("kcal/mol").values, lambda: data["energies"] * J_TO_CAL),
+    ]
+
+
+def best_time(func, budget=1.0, repeats=7):
+    """Best per-call time over ``repeats`` batches sized to roughly ``budget`` seconds in total."""
+    start = time.perf_counter()
+    func()
+    once = max(time.perf_counter() - start, 1e-7)
+    number = max(1, int(budget / repeats / once))
+    best = math.inf
+    # Like timeit, keep the garbage collector out of the measurements.
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            best = min(best, (time.perf_counter() - start) / number)
+    finally:
+        gc.enable()
+    return best
+
+
+def run():
+    results, mismatches = {}, []
+    for size in SIZES:
+        for name, kernel, reference in cases(size):
+            if not np.allclose(kernel(), reference(), rtol=RTOL, atol=ATOL):
+                mismatches.append(f"{name}[{size}]")
+            seconds = best_time(kernel)
+            results[f"{name}[{size}]"] = {"seconds": seconds, "points_per_second": size / seconds}
+    for (page, option), (builder, unit_aware) in TABLE_BUILDERS.items():
+        for use_calories in ((False, True) if unit_aware else (False,)):
+            label = f"table:{page}/{option or '-'}{' (cal)' if use_calories else ''}"
+            results[label] = {"seconds": best_time(lambda: builder(use_calories), budget=0.5)}
+    return results, mismatches
+
+
+def environment():
+    return {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(), "processor": platform.processor()}
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    print(f"{'case':<70} {'time':>12} {'baseline':>12} {'change':>8}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        line = f"{name:<70} {result['seconds'] * 1e6:>10.1f}µs"
+        if base:
+            change = result["seconds"] / base["seconds"] - 1
+            line += f" {base['seconds'] * 1e6:>10.1f}µs {change:>+7.0%}"
+            if change > threshold and result["seconds"] - base["seconds"] > NOISE_FLOOR:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    results, mismatches = run()
+    for name in mismatches:
+        print(f"MISMATCH: {name} differs from the reference formula")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.update and not mismatches:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump({"environment": environment(), "results": results}, handle, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return
+    if mismatches or regressions:
+        print(f"{len(mismatches)} mismatch(es), {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
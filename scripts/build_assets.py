@@ -0,0 +1,90 @@
+"""Builds resized, content-hashed WebP/JPEG variants of everything in images/.
+
+Run from the repository root after adding or changing an image:
+
+    python scripts/build_assets.py
+
+Outputs go to static/img together with manifest.json, which the app reads
+at runtime. Stale variants from earlier builds are removed.
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from webbook.assets import MANIFEST_PATH, OUTPUT_DIR, SIZE_WIDTHS, SOURCE_DIR, sizes_for  # noqa: E402
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 6}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+
+def _flatten(image):
+    """JPEG has no alpha channel, so transparent images go on a white background."""
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def _encode(image, fmt):
+    pil_format, options = FORMATS[fmt]
+    buffer = io.BytesIO()
+    (image if fmt == "webp" else _flatten(image)).save(buffer, format=pil_format, **options)
+    return buffer.getvalue()
+
+
+def build_image(path, written):
+    source = Image.open(path)
+    source.load()
+    if source.mode == "P":
+        source = source.convert("RGBA")
+    stem = os.path.splitext(os.path.basename(path))[0]
+    entry = {}
+    for size in sizes_for(path):
+        # Never upscale: widths above the source width collapse to the source width.
+        widths = sorted({min(width, source.width) for width in SIZE_WIDTHS[size]})
+        entry[size] = {fmt: {} for fmt in FORMATS}
+        for width in widths:
+            height = round(source.height * width / source.width)
+            resized = source if width == source.width else source.resize((width, height), Image.LANCZOS)
+            for fmt in FORMATS:
+                data = _encode(resized, fmt)
+                digest = hashlib.sha256(data).hexdigest()[:10]
+                name = f"{stem}-{width}w-{digest}.{'jpg' if fmt == 'jpeg' else fmt}"
+                with open(os.path.join(OUTPUT_DIR, name), "wb") as handle:
+                    handle.write(data)
+                written.add(name)
+                entry[size][fmt][str(width)] = name
+    return entry
+
+
+def main():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    written = set()
+    manifest = {}
+    for filename in sorted(os.listdir(SOURCE_DIR)):
+        if filename.lower().endswith(IMAGE_EXTENSIONS):
+            path = f"{SOURCE_DIR}/{filename}"
+            manifest[path] = build_image(path, written)
+            print(f"built {path}")
+    for filename in os.listdir(OUTPUT_DIR):
+        if filename != os.path.basename(MANIFEST_PATH) and filename not in written:
+            os.remove(os.path.join(OUTPUT_DIR, filename))
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    print(f"wrote {MANIFEST_PATH} ({len(written)} files)")
+
+
+if __name__ == "__main__":
+    main()
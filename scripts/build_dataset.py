@@ -0,0 +1,90 @@
+"""Builds the versioned Arrow reference dataset from data/source/*.csv.
+
+Run from the repository root after editing a source CSV:
+
+    python scripts/build_dataset.py
+
+Writes uncompressed Arrow IPC files (so they can be memory-mapped and read
+zero-copy) plus manifest.json to data/<DATA_VERSION>/. Bump DATA_VERSION in
+webbook/datastore.py when the schema changes.
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from webbook.datastore import DATA_DIR, DATA_VERSION, SOURCE_DIR  # noqa: E402
+from webbook.quantity import QuantityColumn  # noqa: E402
+from webbook.shomate import parse_range  # noqa: E402
+
+# Column types per source table. "quantity" expands "value" (with "unit")
+# into value/uncertainty/decimals/trailing_point; "range" adds t_min/t_max.
+TABLES = {
+    "shomate": {"float": list("ABCDEFGH"), "range": "temperature_range"},
+    "antoine": {"float": ["A", "B", "C"], "range": "temperature_range"},
+    "thermo_properties": {"quantity": True},
+    "reaction_enthalpies": {"quantity": True},
+    "ion_energetics": {"float": ["value"]},
+    "electron_affinities": {"quantity": True},
+    "ionization_energy_determinations": {"quantity": True},
+    "ionization_energies": {"int": ["atomic_number"], "float": ["ionization_energy_ev", "uncertainty_ev"]},
+    "line_holdings": {"int": ["lines", "lines_with_transition_probabilities", "lines_with_level_designations"]},
+    "level_holdings": {"int": ["levels"]},
+    "xps": {"float": ["binding_energy_ev"]},
+    "line_lists": {"float": ["wavelength_nm", "aki"]},
+}
+
+
+def build_table(name, spec):
+    df = pd.read_csv(os.path.join(SOURCE_DIR, f"{name}.csv"), dtype=str, keep_default_na=False)
+    for column in spec.get("float", []):
+        df[column] = pd.to_numeric(df[column].where(df[column] != "")).astype("float64")
+    for column in spec.get("int", []):
+        df[column] = df[column].astype("int64")
+    if "range" in spec:
+        bounds = [parse_range(text) for text in df[spec["range"]]]
+        df["t_min"] = [low for low, _ in bounds]
+        df["t_max"] = [high for _, high in bounds]
+    if spec.get("quantity"):
+        column = QuantityColumn.parse(df["value"], df["unit"])
+        position = df.columns.get_loc("value")
+        df = df.drop(columns="value")
+        for offset, (key, values) in enumerate([
+            ("value", column.values),
+            ("uncertainty", column.uncertainties),
+            ("decimals", column.decimals.astype("int8")),
+            ("trailing_point", column.trailing_point),
+        ]):
+            df.insert(position + offset, key, values)
+    # Text columns stay strings even when a source has no rows yet.
+    fields = [
+        pa.field(column, pa.string()) if df[column].dtype == object else pa.field(column, pa.from_numpy_dtype(df[column].dtype))
+        for column in df.columns
+    ]
+    return pa.Table.from_pandas(df, schema=pa.schema(fields), preserve_index=False)
+
+
+def main():
+    os.makedirs(DATA_DIR, exist_ok=True)
+    tables = {}
+    for name, spec in TABLES.items():
+        table = build_table(name, spec)
+        path = os.path.join(DATA_DIR, f"{name}.arrow")
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        with open(path, "rb") as handle:
+            digest = hashlib.sha256(handle.read()).hexdigest()
+        tables[name] = {"rows": table.num_rows, "columns": table.column_names, "sha256": digest}
+        print(f"wrote {path} ({table.num_rows} rows)")
+    with open(os.path.join(DATA_DIR, "manifest.json"), "w", encoding="utf-8") as handle:
+        json.dump({"version": DATA_VERSION, "tables": tables}, handle, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
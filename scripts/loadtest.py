@@ -0,0 +1,300 @@
+"""Concurrent-session load test against one locally started app server.
+
+Run from the repository root:
+
+    python scripts/loadtest.py --levels 1,2,4,8 --rounds 3
+
+For each concurrency level the script starts a fresh ``streamlit run``
+server (one replica) and connects N websocket clients to it. Each client
+speaks the browser's protocol: it sends ``rerun_script`` back messages with
+the current widget states and waits for ``script_finished``. A change to a
+widget inside a fragment reruns only that fragment, as in the browser. All
+sessions share the server's process, GIL and caches, so the numbers are
+per-replica throughput under real contention. Each session repeats a
+realistic flow ``--rounds`` times: switching pages from the sidebar,
+switching Other Data sections, toggling calorie units and typing
+temperatures.
+
+For each concurrency level the report gives:
+- throughput (reruns/s)
+- p50/p95/p99 rerun latency (request sent to script_finished received)
+- CPU use of the server process (100% is one core)
+- peak RSS of the server process
+
+Use ``--json`` to save the results so later runs can be compared against them.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import numpy as np
+import psutil
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.NumberInput_pb2 import NumberInput
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "PHOSPHOROUS WEBBOOK.py")
+RUN_TIMEOUT = 120
+STARTUP_TIMEOUT = 60
+WIDGETS = ("radio", "selectbox", "checkbox", "number_input")
+
+# (action, argument) steps; every step is followed by one rerun.
+FLOW = [
+    ("page", "Home"),
+    ("page", "Other Data"),
+    ("section", "Gas phase thermochemistry data"),
+    ("temperature", 1500.0),
+    ("calories", True),
+    ("temperature", 2500.0),
+    ("calories", False),
+    ("section", "Condensed phase thermochemistry data"),
+    ("temperature", 600.0),
+    ("section", "Gas phase ion energetics data"),
+    ("calories", True),
+    ("page", "Atomic Spectra Data"),
+    ("page", "X-ray Photoelectron Spectroscopy Database"),
+    ("page", "About the Element"),
+]
+
+
+class Session:
+    """One simulated browser tab: its websocket, the widgets on screen and their states."""
+
+    def __init__(self, url):
+        self.url = url
+        self.page_hash = ""
+        self.widgets = {}  # widget id -> (kind, proto, fragment id)
+        self.states = {}  # widget id -> WidgetState the user has set
+        self.latencies = []
+        self.errors = []
+
+    async def connect(self):
+        self.connection = await websocket_connect(self.url, subprotocols=["streamlit"])
+
+    def close(self):
+        self.connection.close()
+
+    async def rerun(self, fragment_id=""):
+        message = BackMsg()
+        client_state = message.rerun_script
+        client_state.page_script_hash = self.page_hash
+        client_state.fragment_id = fragment_id
+        client_state.widget_states.widgets.extend(
+            state for widget_id, state in self.states.items() if widget_id in self.widgets
+        )
+        start = time.perf_counter()
+        await self.connection.write_message(message.SerializeToString(), binary=True)
+        seen = await asyncio.wait_for(self._read_run(), RUN_TIMEOUT)
+        self.latencies.append(time.perf_counter() - start)
+        # A fragment run only re-sends the fragment's elements.
+        self.widgets = {**self.widgets, **seen} if fragment_id else seen
+
+    async def _read_run(self):
+        seen = {}
+        while True:
+            raw = await self.connection.read_message()
+            if raw is None:
+                raise ConnectionError("The server closed the connection")
+            message = ForwardMsg()
+            message.ParseFromString(raw)
+            kind = message.WhichOneof("type")
+            if kind == "new_session" and not self.page_hash:
+                self.page_hash = message.new_session.main_script_hash
+            elif kind == "delta" and message.delta.WhichOneof("type") == "new_element":
+                element = message.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type in WIDGETS:
+                    widget = getattr(element, element_type)
+                    seen[widget.id] = (element_type, widget, message.delta.fragment_id)
+                elif element_type == "exception":
+                    self.errors.append(f"{element.exception.type}: {element.exception.message}")
+            elif kind == "script_finished":
+                return seen
+
+    def _find(self, kind, matches):
+        for widget_id, (widget_kind, widget, fragment_id) in self.widgets.items():
+            if widget_kind == kind and matches(widget.label):
+                return widget_id, widget, fragment_id
+        raise LookupError(f"No {kind} matching the flow step on screen")
+
+    async def apply(self, action, value):
+        if action == "page":
+            widget_id, widget, fragment_id = self._find("radio", lambda label: label.startswith("Hello"))
+            state = WidgetState(id=widget_id, int_value=list(widget.options).index(value))
+        elif action == "section":
+            widget_id, widget, fragment_id = self._find("selectbox", lambda label: label == "Select an option:")
+            state = WidgetState(id=widget_id, int_value=list(widget.options).index(value))
+        elif action == "calories":
+            widget_id, widget, fragment_id = self._find("checkbox", lambda label: "calorie" in label)
+            state = WidgetState(id=widget_id, bool_value=value)
+        elif action == "temperature":
+            widget_id, widget, fragment_id = self._find("number_input", lambda label: label.startswith("Enter Temperature"))
+            value = min(max(value, widget.min if widget.has_min else value), widget.max if widget.has_max else value)
+            if widget.data_type == NumberInput.INT:
+                state = WidgetState(id=widget_id, int_value=int(value))
+            else:
+                state = WidgetState(id=widget_id, double_value=value)
+        else:
+            raise ValueError(f"Unknown action {action!r}")
+        self.states[widget_id] = state
+        await self.rerun(fragment_id)
+
+
+async def session(url, rounds):
+    """One simulated user; returns (rerun latencies in seconds, error messages)."""
+    user = Session(url)
+    try:
+        await user.connect()
+        await user.rerun()
+        for _ in range(rounds):
+            for action, value in FLOW:
+                await user.apply(action, value)
+    except Exception as error:  # keep going with the other sessions
+        user.errors.append(f"{type(error).__name__}: {error}")
+    finally:
+        if hasattr(user, "connection"):
+            user.close()
+    return user.latencies, user.errors
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server():
+    """Starts ``streamlit run`` on a free port and waits for its health check."""
+    port = _free_port()
+    # The metrics exporter and batch API would collide with a running app.
+    env = {**os.environ, "WEBBOOK_METRICS_PORT": "0", "WEBBOOK_API_PORT": "0"}
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", SCRIPT,
+            "--server.headless=true", "--server.address=127.0.0.1", f"--server.port={port}",
+            "--browser.gatherUsageStats=false",
+        ],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.read() == b"ok":
+                    return server, port
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("The app server did not start")
+
+
+class ResourceSampler:
+    """Samples CPU time and RSS of the server process in the background."""
+
+    def __init__(self, pid, interval=0.05):
+        self.process = psutil.Process(pid)
+        self.interval = interval
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _cpu(self):
+        times = self.process.cpu_times()
+        return times.user + times.system
+
+    def _sample(self):
+        while not self._stop.is_set():
+            try:
+                self.peak_rss = max(self.peak_rss, self.process.memory_info().rss)
+            except psutil.NoSuchProcess:
+                return
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._start_cpu = self._cpu()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.wall_seconds = time.perf_counter() - self._wall
+        self.cpu_seconds = self._cpu() - self._start_cpu
+
+
+async def _sessions(url, sessions, rounds):
+    return await asyncio.gather(*(session(url, rounds) for _ in range(sessions)))
+
+
+def run_level(sessions, rounds):
+    # A fresh server per level, so every level starts from cold caches.
+    server, port = start_server()
+    try:
+        with ResourceSampler(server.pid) as sampler:
+            results = asyncio.run(_sessions(f"ws://127.0.0.1:{port}/_stcore/stream", sessions, rounds))
+    finally:
+        server.terminate()
+        server.wait()
+    latencies = np.array([t for result, _ in results for t in result]) * 1000
+    errors = [e for _, errs in results for e in errs]
+    percentiles = np.percentile(latencies, [50, 95, 99]) if len(latencies) else [np.nan] * 3
+    return {
+        "sessions": sessions,
+        "reruns": int(len(latencies)),
+        "errors": errors,
+        "seconds": round(sampler.wall_seconds, 3),
+        "throughput": round(len(latencies) / sampler.wall_seconds, 2),
+        "p50_ms": round(float(percentiles[0]), 1),
+        "p95_ms": round(float(percentiles[1]), 1),
+        "p99_ms": round(float(percentiles[2]), 1),
+        "cpu_percent": round(100 * sampler.cpu_seconds / sampler.wall_seconds, 1),
+        "peak_rss_mb": round(sampler.peak_rss / 2**20, 1),
+    }
+
+
+def print_report(results):
+    header = f"{'sessions':>8} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'CPU %':>7} {'RSS MB':>8} {'errors':>7}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['sessions']:>8} {r['reruns']:>7} {r['throughput']:>8.2f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+            f"{r['p99_ms']:>8.1f} {r['cpu_percent']:>7.1f} {r['peak_rss_mb']:>8.1f} {len(r['errors']):>7}"
+        )
+    for r in results:
+        for error in sorted(set(r["errors"])):
+            print(f"[{r['sessions']} sessions] {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", default="1,2,4,8", help="comma-separated numbers of concurrent sessions")
+    parser.add_argument("--rounds", type=int, default=2, help="times each session repeats the flow")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    results = []
+    for level in (int(n) for n in args.levels.split(",")):
+        results.append(run_level(level, args.rounds))
+        print(f"{level} sessions done", file=sys.stderr)
+    print_report(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"flow": FLOW, "rounds": args.rounds, "results": results}, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
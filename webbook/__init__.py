@@ -0,0 +1 @@
+"""Calculation engines shared by the Phosphorus Web Book pages."""
@@ -0,0 +1,58 @@
+"""Vectorized Antoine vapor-pressure equation, log10(P) = A - B / (T + C)."""
+
+import numpy as np
+
+from webbook.shomate import OUT_OF_RANGE_MODES
+
+
+class AntoineEquation:
+    """Antoine coefficients with their valid temperature range.
+
+    Both directions accept scalars or arrays. Points outside the valid range
+    (or non-positive pressures) are handled according to ``out_of_range``:
+    ``"raise"`` raises ValueError, ``"nan"`` returns NaN and ``"clip"``
+    evaluates them anyway.
+    """
+
+    def __init__(self, A, B, C, t_min, t_max, out_of_range="nan"):
+        if out_of_range not in OUT_OF_RANGE_MODES:
+            raise ValueError(f"out_of_range must be one of {OUT_OF_RANGE_MODES}")
+        self.A, self.B, self.C = float(A), float(B), float(C)
+        self.t_min, self.t_max = float(t_min), float(t_max)
+        self.out_of_range = out_of_range
+
+    @property
+    def temperature_range(self):
+        return self.t_min, self.t_max
+
+    @property
+    def pressure_range(self):
+        return float(self._pressure(self.t_min)), float(self._pressure(self.t_max))
+
+    def in_range(self, temperatures):
+        T = np.asarray(temperatures, dtype=float)
+        return (T >= self.t_min) & (T <= self.t_max)
+
+    def _pressure(self, T):
+        return 10 ** (self.A - self.B / (T + self.C))
+
+    def _apply_mask(self, values, valid, out_of_range):
+        mode = out_of_range or self.out_of_range
+        if mode == "clip" or np.all(valid):
+            return values
+        if mode == "raise":
+            raise ValueError(f"Temperature outside the valid range ({self.t_min} - {self.t_max} K)")
+        return np.where(valid, values, np.nan)
+
+    def pressure(self, temperatures, out_of_range=None):
+        """Vapor pressure for every temperature (same units as the coefficients)."""
+        T = np.asarray(temperatures, dtype=float)
+        return self._apply_mask(self._pressure(T), self.in_range(T), out_of_range)
+
+    def temperature(self, pressures, out_of_range=None):
+        """Temperature at which the vapor pressure equals each of ``pressures``."""
+        P = np.asarray(pressures, dtype=float)
+        positive = P > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            T = self.B / (self.A - np.log10(np.where(positive, P, np.nan))) - self.C
+        return self._apply_mask(T, positive & self.in_range(T), out_of_range)
@@ -0,0 +1,299 @@
+"""Local batch JSON API over the web book's calculation engines.
+
+Run it as its own process, with one or more workers:
+
+    python -m webbook.api --port 8600 --processes 4
+
+It can also run inside the Streamlit server: when ``WEBBOOK_API_PORT`` is
+set, the entry script imports this module and ``serve()`` starts the API
+once per process on 127.0.0.1, on its own tornado event loop in a daemon
+thread. The module is not imported otherwise, so the app's cold start
+does not pay for numpy, pyarrow and the engines. Either way the API uses
+the same engines as the pages: the memory-mapped tables and lru-cached
+Shomate/Antoine sets from ``webbook.datastore``. Inside the Streamlit
+process it also sees the species and Antoine sets registered by the
+fitting tool.
+
+Endpoints (JSON bodies; non-finite inputs and results, e.g. out of range,
+become null):
+
+- POST /api/v1/shomate: ``{"temperatures": [...], "phases": [{"species":
+  "P", "state": "solid", "phase": "White Phase"}, ...], "units": "SI"}``
+  returns Cp, H° - H°298 and S° for every phase and temperature.
+- POST /api/v1/antoine: ``{"temperatures": [...]}`` or ``{"pressures":
+  [...]}``, with an optional ``"set"`` naming a fitted set.
+- POST /api/v1/reactions: ``{"reactions": {"name": {"P(s, White Phase)":
+  -1, "P(s, Black Phase)": 1}}, "temperatures": [...]}`` returns ΔrH, ΔrS,
+  ΔrG and log K.
+- GET /api/v1/constants/<table>?units=calorie&section=gas: rows of a
+  reference table. Quantity columns are converted, and the other query
+  arguments filter on equal column values.
+- GET /api/v1/health
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+import pyarrow as pa
+import tornado.httpserver
+import tornado.ioloop
+import tornado.netutil
+import tornado.process
+import tornado.web
+
+from webbook import datastore, metrics
+from webbook.fitting import BUILT_IN_ANTOINE, antoine_sets
+from webbook.quantity import CALORIE_FACTOR, UNIT_SYSTEMS
+from webbook.reactions import ReactionSet
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8600
+MAX_POINTS = 1_000_000
+
+_server_lock = threading.Lock()
+_server_port = None
+
+
+def _array(values, name):
+    array = np.asarray(values if values is not None else [], dtype=float).reshape(-1)
+    if not len(array):
+        raise ValueError(f'"{name}" must be a non-empty list of numbers')
+    if len(array) > MAX_POINTS:
+        raise ValueError(f'"{name}" has {len(array):,} values; the limit is {MAX_POINTS:,}')
+    return array
+
+
+def _json_list(values):
+    """Array -> list with NaN and ±inf as None (JSON has neither)."""
+    values = np.asarray(values, dtype=float)
+    return np.where(np.isfinite(values), values, None).tolist()
+
+
+def _entries(values, name, kind):
+    """Checks that every entry of a request list or mapping is a JSON object."""
+    if not all(isinstance(value, dict) for value in values):
+        raise ValueError(f'Every entry of "{name}" must be a {kind} object')
+
+
+def _system(units):
+    if units not in UNIT_SYSTEMS:
+        raise ValueError(f'"units" must be one of {", ".join(UNIT_SYSTEMS)}')
+    return units
+
+
+class BaseHandler(tornado.web.RequestHandler):
+    """JSON in, JSON out. Subclasses implement ``calculate(body)`` for POST.
+
+    ValueError, KeyError and TypeError raised while calculating (bad
+    input, unknown species or sets) become 400 responses with an "error"
+    message.
+    """
+
+    def set_default_headers(self):
+        self.set_header("Content-Type", "application/json")
+
+    def post(self):
+        try:
+            body = json.loads(self.request.body or b"{}")
+        except json.JSONDecodeError as error:
+            raise tornado.web.HTTPError(400, f"Invalid JSON: {error}") from error
+        if not isinstance(body, dict):
+            raise tornado.web.HTTPError(400, "The request body must be a JSON object")
+        self.respond(self.guarded(self.calculate, body))
+
+    def guarded(self, func, *args):
+        try:
+            return func(*args)
+        except (ValueError, KeyError, TypeError) as error:
+            message = error.args[0] if isinstance(error, KeyError) and error.args else str(error)
+            raise tornado.web.HTTPError(400, message) from error
+
+    def respond(self, payload):
+        self.finish(json.dumps(payload, ensure_ascii=False, allow_nan=False))
+
+    def write_error(self, status_code, **kwargs):
+        error = kwargs.get("exc_info", (None, None, None))[1]
+        message = error.log_message if isinstance(error, tornado.web.HTTPError) and error.log_message else self._reason
+        self.finish(json.dumps({"error": message}, ensure_ascii=False))
+
+
+class HealthHandler(BaseHandler):
+    def get(self):
+        self.respond({"status": "ok", "data_version": datastore.DATA_VERSION})
+
+
+class ShomateHandler(BaseHandler):
+    def calculate(self, body):
+        T = _array(body.get("temperatures"), "temperatures")
+        phases = body.get("phases") or []
+        if not phases:
+            raise ValueError('"phases" must list at least one {"species", "state", "phase"} object')
+        _entries(phases, "phases", '{"species", "state", "phase"}')
+        calorie = _system(body.get("units", "SI")) == "calorie"
+        factor = CALORIE_FACTOR if calorie else 1.0
+        metrics.calculation("api_shomate")
+
+        results = []
+        for phase in phases:
+            shomate = datastore.shomate(phase.get("species"), phase.get("state"), phase.get("phase"))
+            Cp, H_val, S_val = shomate.evaluate(T, out_of_range="nan")
+            results.append({
+                **phase,
+                "cp": _json_list(Cp * factor),
+                "enthalpy": _json_list(H_val * factor),
+                "entropy": _json_list(S_val * factor),
+            })
+        entropy_unit, energy_unit = ("cal/mol*K", "kcal/mol") if calorie else ("J/mol*K", "kJ/mol")
+        return {
+            "temperatures": _json_list(T),
+            "units": {"cp": entropy_unit, "enthalpy": energy_unit, "entropy": entropy_unit},
+            "results": results,
+        }
+
+
+class AntoineHandler(BaseHandler):
+    def calculate(self, body):
+        name = body.get("set", BUILT_IN_ANTOINE)
+        sets = antoine_sets()
+        if name not in sets:
+            raise KeyError(f"Unknown Antoine set {name!r}; available: {', '.join(sets)}")
+        antoine = sets[name]
+        metrics.calculation("api_antoine")
+        if "temperatures" in body:
+            T = _array(body["temperatures"], "temperatures")
+            return {"set": name, "temperatures": _json_list(T), "pressures": _json_list(antoine.pressure(T, out_of_range="nan"))}
+        P = _array(body.get("pressures"), "pressures")
+        return {"set": name, "pressures": _json_list(P), "temperatures": _json_list(antoine.temperature(P, out_of_range="nan"))}
+
+
+class ReactionsHandler(BaseHandler):
+    def calculate(self, body):
+        T = _array(body.get("temperatures"), "temperatures")
+        equations = body.get("reactions") or {}
+        if not equations:
+            raise ValueError('"reactions" must map reaction names to {species label: coefficient}')
+        if not isinstance(equations, dict):
+            raise ValueError('"reactions" must be a JSON object')
+        _entries(equations.values(), "reactions", "{species label: coefficient}")
+        calorie = _system(body.get("units", "SI")) == "calorie"
+        factor = CALORIE_FACTOR if calorie else 1.0
+        metrics.calculation("api_reactions")
+
+        reaction_set = ReactionSet(equations)
+        values = reaction_set.evaluate(T)
+        results = {}
+        for row, name in enumerate(reaction_set.names):
+            results[name] = {
+                quantity: _json_list(values[quantity][row] * (1.0 if quantity == "log K" else factor))
+                for quantity in values
+            }
+        energy_unit, entropy_unit = ("kcal/mol", "cal/mol*K") if calorie else ("kJ/mol", "J/mol*K")
+        return {
+            "temperatures": _json_list(T),
+            "units": {"ΔrH": energy_unit, "ΔrS": entropy_unit, "ΔrG": energy_unit, "log K": ""},
+            "results": results,
+        }
+
+
+class ConstantsHandler(BaseHandler):
+    def get(self, name):
+        if name not in datastore.manifest()["tables"]:
+            raise tornado.web.HTTPError(404, f"Unknown table {name!r}")
+        self.respond(self.guarded(self.calculate, name))
+
+    def calculate(self, name):
+        system = _system(self.get_query_argument("units", "SI"))
+        columns = datastore.load(name).schema
+        filters = {}
+        for key in self.request.query_arguments:
+            if key == "units":
+                continue
+            if key not in columns.names:
+                raise KeyError(f"Unknown column {key!r}; {name} has {', '.join(columns.names)}")
+            # A value that does not parse as the column type raises ArrowInvalid, a ValueError
+            filters[key] = pa.scalar(self.get_query_argument(key)).cast(columns.field(key).type)
+        table = datastore.select(name, **filters)
+        metrics.calculation("api_constants")
+
+        rows = table.drop_columns([c for c in ("decimals", "trailing_point") if c in table.column_names])
+        data = {
+            column: _json_list(rows[column].to_numpy(zero_copy_only=False))
+            if pa.types.is_floating(rows.schema.field(column).type)
+            else rows[column].to_pylist()
+            for column in rows.column_names
+        }
+        # Only tables whose "value" was expanded into quantity columns (see build_dataset) can convert
+        if "trailing_point" in table.column_names:
+            column = datastore.quantities(table).to_system(system)
+            data["value"] = _json_list(column.values)
+            data["uncertainty"] = _json_list(column.uncertainties)
+            data["unit"] = list(column.units)
+        return {"table": name, "units": system, "rows": [dict(zip(data, row)) for row in zip(*data.values())]}
+
+
+def make_app():
+    return tornado.web.Application([
+        (r"/api/v1/health", HealthHandler),
+        (r"/api/v1/shomate", ShomateHandler),
+        (r"/api/v1/antoine", AntoineHandler),
+        (r"/api/v1/reactions", ReactionsHandler),
+        (r"/api/v1/constants/(\w+)", ConstantsHandler),
+    ])
+
+
+def _run(sockets, ready):
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    server = tornado.httpserver.HTTPServer(make_app())
+    server.add_sockets(sockets)
+    ready.set()
+    tornado.ioloop.IOLoop.current().start()
+
+
+def serve(port=None):
+    """Starts the API in a background thread unless this process already has one.
+
+    The port defaults to ``WEBBOOK_API_PORT``; unset or 0 leaves it off.
+    """
+    global _server_port
+    if port is None:
+        port = int(os.environ.get("WEBBOOK_API_PORT", 0))
+    with _server_lock:
+        if _server_port is not None or not port:
+            return _server_port
+        try:
+            sockets = tornado.netutil.bind_sockets(port, address="127.0.0.1")
+        except OSError as error:
+            logger.warning("Batch API not started on port %d: %s", port, error)
+            port = 0
+        else:
+            ready = threading.Event()
+            threading.Thread(target=_run, args=(sockets, ready), name="webbook-api", daemon=True).start()
+            ready.wait()
+        _server_port = port
+        return port
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--address", default="127.0.0.1")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes sharing the socket (0 = one per CPU)")
+    args = parser.parse_args()
+
+    sockets = tornado.netutil.bind_sockets(args.port, address=args.address)
+    if args.processes != 1:
+        tornado.process.fork_processes(args.processes)
+    server = tornado.httpserver.HTTPServer(make_app())
+    server.add_sockets(sockets)
+    logger.warning("Batch API listening on http://%s:%d/api/v1/", args.address, args.port)
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == "__main__":
+    main()
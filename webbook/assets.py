@@ -0,0 +1,101 @@
+"""Pre-sized image variants served as static files.
+
+``scripts/build_assets.py`` writes resized, content-hashed WebP and JPEG
+copies of everything in ``images/`` to ``static/img`` together with a
+manifest. Pages then reference those files by URL (Streamlit serves
+``static/`` at ``app/static/`` when ``server.enableStaticServing`` is on)
+instead of inlining base64 data into every rerun. Images missing from the
+manifest fall back to the original file.
+"""
+
+import base64
+import functools
+import json
+import mimetypes
+import os
+
+import streamlit as st
+
+SOURCE_DIR = "images"
+OUTPUT_DIR = os.path.join("static", "img")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+URL_PREFIX = "app/static/img/"
+
+# Widths the pages actually display, including 2x variants for HiDPI screens.
+SIZE_WIDTHS = {
+    "full": (480, 960, 1600),
+    "column": (320, 640, 960),
+    "thumb": (100, 200),
+}
+SIZE_HINTS = {
+    "full": "100vw",
+    "column": "50vw",
+    "thumb": "100px",
+}
+# Images shown in a two-column layout or as table thumbnails; the rest are full width.
+IMAGE_SIZES = {
+    "images/6.jpg": ("thumb",),
+    "images/7.jpg": ("thumb",),
+    "images/8.jpg": ("thumb",),
+    "images/fertilizer.jpg": ("column",),
+    "images/animal.jpg": ("column",),
+    "images/detergenet.jpeg": ("column",),
+    "images/food.jpg": ("column",),
+    "images/metal.jpeg": ("column",),
+    "images/water.jpeg": ("column",),
+    "images/special.jpeg": ("column",),
+    "images/toothpaste.jpeg": ("column",),
+    "images/fireworks.jpeg": ("column",),
+}
+
+
+def sizes_for(path):
+    return IMAGE_SIZES.get(path, ("full",))
+
+
+@functools.lru_cache(maxsize=1)
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {}
+
+
+def _srcset(variants):
+    return ", ".join(f"{URL_PREFIX}{name} {width}w" for width, name in sorted(variants.items(), key=lambda item: int(item[0])))
+
+
+@functools.lru_cache(maxsize=None)
+def _inline_url(path):
+    with open(path, "rb") as handle:
+        encoded = base64.b64encode(handle.read()).decode()
+    mime = mimetypes.guess_type(path)[0] or "image/jpeg"
+    return f"data:{mime};base64,{encoded}"
+
+
+def image_html(path, size="full", style="", attributes=""):
+    """Returns a <picture> element for ``path`` with WebP and JPEG srcsets.
+
+    Falls back to an inline data URL when the image has not been built.
+    """
+    entry = load_manifest().get(path, {}).get(size)
+    if entry is None:
+        if not os.path.exists(path):
+            return "Image not found"
+        return f'<img src="{_inline_url(path)}" style="{style}" {attributes}>'
+    jpeg = entry["jpeg"]
+    fallback = URL_PREFIX + jpeg[max(jpeg, key=int)]
+    return (
+        f'<picture><source type="image/webp" srcset="{_srcset(entry["webp"])}" sizes="{SIZE_HINTS[size]}">'
+        f'<img src="{fallback}" srcset="{_srcset(jpeg)}" sizes="{SIZE_HINTS[size]}" '
+        f'style="{style}" loading="lazy" {attributes}></picture>'
+    )
+
+
+def show_image(path, size="full"):
+    """Displays an image at container width from its pre-built variants."""
+    if path not in load_manifest():
+        st.image(path, use_container_width=True)
+        return
+    st.markdown(image_html(path, size, style="width: 100%; height: auto;"), unsafe_allow_html=True)
@@ -0,0 +1,133 @@
+"""Chunked bulk evaluation of Shomate properties and Saha grids with streamed CSV/Parquet output."""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 250_000
+# Exports are streamed to disk, but st.download_button then reads the finished
+# file into Streamlit's in-memory media store, one copy per session. At about
+# 65 bytes per CSV row, 1M rows keeps that copy to ~65 MB.
+MAX_POINTS = 1_000_000
+
+
+def count_range_points(start, stop, step):
+    """Number of points in the inclusive grid start, start+step, ..., <= stop."""
+    if step <= 0:
+        raise ValueError("Step must be positive")
+    if stop < start:
+        raise ValueError("Stop must not be below start")
+    return int(math.floor((stop - start) / step + 1e-9)) + 1
+
+
+def range_chunks(start, stop, step, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields the start/stop/step grid in chunks without building it all at once."""
+    total = count_range_points(start, stop, step)
+    if total > MAX_POINTS:
+        raise ValueError(f"Grid has {total:,} points; the limit is {MAX_POINTS:,}")
+    for offset in range(0, total, chunk_size):
+        n = min(chunk_size, total - offset)
+        yield start + step * np.arange(offset, offset + n, dtype=float)
+
+
+def csv_chunks(file, chunk_size=DEFAULT_CHUNK_SIZE, limit=None):
+    """Yields the first column of an uploaded CSV as float chunks.
+
+    Non-numeric cells (such as a header row) are dropped. More than
+    ``limit`` values raise ValueError.
+    """
+    total = 0
+    for frame in pd.read_csv(file, usecols=[0], header=None, chunksize=chunk_size):
+        values = pd.to_numeric(frame.iloc[:, 0], errors="coerce").to_numpy(dtype=float)
+        values = values[~np.isnan(values)]
+        total += len(values)
+        if limit is not None and total > limit:
+            raise ValueError(f"The file has more than {limit:,} values; the limit is {limit:,}")
+        if len(values):
+            yield values
+
+
+def csv_pairs(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Reads the first two columns of an uploaded CSV as float arrays, dropping non-numeric rows."""
+    xs, ys = [], []
+    for frame in pd.read_csv(file, usecols=[0, 1], header=None, chunksize=chunk_size):
+        values = frame.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        values = values[~np.isnan(values).any(axis=1)]
+        xs.append(values[:, 0])
+        ys.append(values[:, 1])
+    return np.concatenate(xs or [np.empty(0)]), np.concatenate(ys or [np.empty(0)])
+
+
+def property_frames(shomate, temperature_chunks, units):
+    """Evaluates Cp, H° - H°298 and S° chunk by chunk.
+
+    ``units`` is a (heat capacity, enthalpy) pair of labels. Temperatures
+    outside the coefficient range come back as NaN rather than aborting the
+    whole export.
+    """
+    cp_unit, h_unit = units
+    for T in temperature_chunks:
+        Cp, H_val, S_val = shomate.evaluate(T, out_of_range="nan")
+        yield pd.DataFrame({
+            "Temperature (K)": T,
+            f"Heat Capacity ({cp_unit})": Cp,
+            f"Enthalpy ({h_unit})": H_val,
+            f"Entropy ({cp_unit})": S_val,
+        })
+
+
+def saha_frames(balance, temperatures, densities, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stage fractions and mean charge over a T x ne grid, a block of temperatures at a time.
+
+    Rows run over electron density fastest, so each chunk holds whole
+    temperature rows.
+    """
+    step = max(1, chunk_size // len(densities))
+    for start in range(0, len(temperatures), step):
+        T = temperatures[start:start + step]
+        fractions = balance.fractions(T, densities)
+        data = {
+            "Temperature (K)": np.repeat(T, len(densities)),
+            "Electron Density (cm⁻³)": np.tile(densities, len(T)),
+        }
+        for ion, fraction in zip(balance.ions, fractions):
+            data[ion] = fraction.ravel()
+        data["Mean Charge"] = balance.mean_charge(fractions).ravel()
+        yield pd.DataFrame(data)
+
+
+def write_csv(frames, path):
+    """Appends each frame to a CSV file; returns the number of rows written."""
+    rows = 0
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        for i, frame in enumerate(frames):
+            frame.to_csv(handle, index=False, header=(i == 0))
+            rows += len(frame)
+    return rows
+
+
+def write_parquet(frames, path):
+    """Writes each frame as a Parquet row group; returns the number of rows written."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for frame in frames:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(frame)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+WRITERS = {
+    "CSV": (write_csv, "csv", "text/csv"),
+    "Parquet": (write_parquet, "parquet", "application/vnd.apache.parquet"),
+}
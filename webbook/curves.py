@@ -0,0 +1,117 @@
+"""Property curves evaluated on fine grids and downsampled before display.
+
+The grid resolution is chosen by the user (up to millions of points); only
+``downsample.POINT_BUDGET`` points per curve are sent to the browser. Results
+are cached with ``st.cache_data`` per coefficient set, grid and method, so
+moving another widget does not re-evaluate the curve. The Monte Carlo
+confidence bands (see webbook.uncertainty) are cached the same way, per set
+of input uncertainties and number of draws.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from webbook import downsample, metrics, uncertainty
+from webbook.antoine import AntoineEquation
+from webbook.quantity import CALORIE_FACTOR
+from webbook.reactions import ReactionSet
+from webbook.shomate import PiecewiseShomate
+
+RESOLUTIONS = [100, 1_000, 10_000, 100_000, 1_000_000, 5_000_000]
+
+
+def curve_grid(low, high, points, breakpoints=()):
+    """Evenly spaced temperatures plus each inner breakpoint and the point just above it.
+
+    The extra pair makes a change of coefficient set show up as a step at the
+    exact breakpoint instead of a slope between two grid points.
+    """
+    grid = np.linspace(low, high, points)
+    edges = np.asarray([bp for bp in breakpoints if low < bp < high], dtype=float)
+    if len(edges):
+        grid = np.union1d(grid, np.concatenate([edges, np.nextafter(edges, np.inf)]))
+    return grid
+
+
+def _downsampled(x, y, method, x_label, y_label):
+    keep = downsample.METHODS[method](x, y)
+    return pd.DataFrame({x_label: x[keep], y_label: y[keep]}), len(x)
+
+
+@metrics.cached("shomate_cp_curve", max_entries=64, show_spinner=False)
+def shomate_cp_curve(breakpoints, coefficients, points, method):
+    """Downsampled Cp(T) over the whole range of a piecewise set, and the full grid size.
+
+    ``breakpoints`` and ``coefficients`` are tuples so they can form the cache key.
+    """
+    shomate = PiecewiseShomate(breakpoints, coefficients)
+    low, high = shomate.temperature_range
+    temperatures = curve_grid(low, high, points, breakpoints[1:-1])
+    return _downsampled(temperatures, shomate.cp(temperatures), method, "Temperature (K)", "Heat Capacity")
+
+
+@metrics.cached("antoine_curve", max_entries=64, show_spinner=False)
+def antoine_curve(A, B, C, t_min, t_max, points, method):
+    """Downsampled vapor pressure over the valid range, and the full grid size."""
+    antoine = AntoineEquation(A, B, C, t_min, t_max)
+    temperatures = curve_grid(t_min, t_max, points)
+    return _downsampled(temperatures, antoine.pressure(temperatures), method, "Temperature (K)", "Vapor Pressure (atm)")
+
+
+def _band_frame(x_label, x, labels, result):
+    """One row per x with mean, standard deviation and quantile columns for each labelled output."""
+    frame = pd.DataFrame({x_label: x})
+    for row, label in enumerate(labels):
+        frame[f"{label} mean"] = result["mean"][row]
+        frame[f"{label} std"] = result["std"][row]
+        for q, values in zip(uncertainty.DEFAULT_QUANTILES, result["quantiles"][:, row]):
+            frame[f"{label} {100 * q:g}%"] = values
+    return frame
+
+
+@metrics.cached("shomate_bands", max_entries=16, show_spinner="Sampling...")
+def shomate_bands(breakpoints, coefficients, points, draws, sigma_T, cp_rel, sigma_S):
+    """Monte Carlo mean, std and 2.5/50/97.5% quantiles of Cp, H° - H°298 and S° over the range."""
+    shomate = PiecewiseShomate(breakpoints, coefficients)
+    temperatures = np.linspace(*shomate.temperature_range, points)
+    model = uncertainty.shomate_model(shomate, temperatures, sigma_T, cp_rel, sigma_S)
+    result = uncertainty.propagate(model, draws, 3 * points)
+    return _band_frame("Temperature (K)", temperatures, ["Heat Capacity", "Enthalpy", "Entropy"], result)
+
+
+@metrics.cached("antoine_bands", max_entries=16, show_spinner="Sampling...")
+def antoine_bands(A, B, C, t_min, t_max, points, draws, sigma_T, sigma_C):
+    """Monte Carlo mean, std and 2.5/50/97.5% quantiles of the vapor pressure over the valid range."""
+    antoine = AntoineEquation(A, B, C, t_min, t_max)
+    temperatures = np.linspace(t_min, t_max, points)
+    model = uncertainty.antoine_model(antoine, temperatures, "P from T", sigma_T, sigma_C)
+    result = uncertainty.propagate(model, draws, points)
+    result = {key: values[None] if key != "quantiles" else values[:, None] for key, values in result.items()}
+    return _band_frame("Temperature (K)", temperatures, ["Vapor Pressure"], result)
+
+
+@metrics.cached("reaction_bands", max_entries=16, show_spinner="Sampling...")
+def reaction_bands(equations, t_min, t_max, points, draws, use_calories):
+    """Monte Carlo bands of ΔrH, ΔrS, ΔrG and log K for every reaction, sampling the data-table ± values.
+
+    Columns are labelled "<reaction>: <quantity>".
+    """
+    reaction_set = ReactionSet(equations)
+    temperatures = np.linspace(t_min, t_max, points)
+    model = uncertainty.reaction_model(reaction_set, temperatures, uncertainty.dataset_sigmas())
+    result = uncertainty.propagate(model, draws, 4 * len(reaction_set.names) * points)
+    factor = np.array([CALORIE_FACTOR, CALORIE_FACTOR, CALORIE_FACTOR, 1.0]) if use_calories else np.ones(4)
+    scaled = {
+        "mean": result["mean"] * factor[:, None, None],
+        "std": result["std"] * factor[:, None, None],
+        "quantiles": result["quantiles"] * factor[None, :, None, None],
+    }
+    # Flatten (quantity, reaction) into one label per output row
+    labels = [f"{name}: {quantity}" for quantity in uncertainty.REACTION_QUANTITIES for name in reaction_set.names]
+    flat = {
+        "mean": scaled["mean"].reshape(len(labels), points),
+        "std": scaled["std"].reshape(len(labels), points),
+        "quantiles": scaled["quantiles"].reshape(-1, len(labels), points),
+    }
+    return _band_frame("Temperature (K)", temperatures, labels, flat)
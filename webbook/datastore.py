@@ -0,0 +1,105 @@
+"""Versioned, memory-mapped reference data shared by every session.
+
+The reference tables (Shomate and Antoine constants, thermochemical
+properties, reaction enthalpies, ion energetics, ionization energies and
+XPS lines) live as uncompressed Arrow IPC files under ``data/<version>/``,
+built from the CSV sources in ``data/source`` by ``scripts/build_dataset.py``.
+
+Each file is memory-mapped and read zero-copy once per process; the
+resulting ``pyarrow.Table`` objects are immutable, so all sessions share
+them without copying. Quantity columns are stored pre-parsed as
+``value``/``uncertainty``/``decimals``/``trailing_point`` plus ``unit``.
+"""
+
+import functools
+import json
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from webbook.antoine import AntoineEquation
+from webbook.quantity import QuantityColumn
+from webbook.shomate import COEFFICIENT_NAMES, PiecewiseShomate, ShomateEngine
+
+DATA_VERSION = "v1"
+DATA_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+DATA_DIR = os.path.join(DATA_ROOT, DATA_VERSION)
+SOURCE_DIR = os.path.join(DATA_ROOT, "source")
+
+
+@functools.lru_cache(maxsize=1)
+def manifest():
+    with open(os.path.join(DATA_DIR, "manifest.json"), encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+@functools.lru_cache(maxsize=None)
+def load(name):
+    """Memory-maps ``data/<version>/<name>.arrow`` and returns it as a read-only table."""
+    source = pa.memory_map(os.path.join(DATA_DIR, f"{name}.arrow"), "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def select(name, **filters):
+    """Rows of a table whose columns equal the given values."""
+    table = load(name)
+    if not filters:
+        return table
+    mask = None
+    for column, value in filters.items():
+        condition = pc.equal(table[column], value)
+        mask = condition if mask is None else pc.and_(mask, condition)
+    return table.filter(mask)
+
+
+def numbers(table, column):
+    """A numeric column as a NumPy array (zero-copy when the column has no nulls)."""
+    return table[column].to_numpy()
+
+
+def quantities(table):
+    """The pre-parsed quantity columns of ``table`` as a QuantityColumn."""
+    return QuantityColumn(
+        values=numbers(table, "value"),
+        uncertainties=numbers(table, "uncertainty"),
+        units=np.array(table["unit"].to_pylist(), dtype=object),
+        decimals=numbers(table, "decimals").astype(int),
+        trailing_point=numbers(table, "trailing_point"),
+    )
+
+
+def _coefficients(table):
+    return np.column_stack([numbers(table, key) for key in COEFFICIENT_NAMES])
+
+
+@functools.lru_cache(maxsize=None)
+def shomate(species, state, phase=None):
+    """Piecewise Shomate set for one species/state (and phase, for solids)."""
+    filters = {"species": species, "state": state}
+    if phase is not None:
+        filters["phase"] = phase
+    table = select("shomate", **filters)
+    if table.num_rows == 0:
+        raise KeyError(f"No Shomate data for {filters}")
+    if len(set(table["phase"].to_pylist())) > 1:
+        raise ValueError(f"{species} {state} has several phases; pass phase=")
+    t_min, t_max = numbers(table, "t_min"), numbers(table, "t_max")
+    order = np.argsort(t_min)
+    breakpoints = np.append(t_min[order], t_max[order][-1])
+    return PiecewiseShomate(breakpoints, _coefficients(table)[order], name=table["phase"][0].as_py())
+
+
+@functools.lru_cache(maxsize=None)
+def shomate_phases(species, state):
+    """Single-segment phases of a state (e.g. the solid allotropes) as one engine."""
+    table = select("shomate", species=species, state=state)
+    return ShomateEngine(_coefficients(table), names=table["phase"].to_pylist())
+
+
+@functools.lru_cache(maxsize=None)
+def antoine(species):
+    table = select("antoine", species=species)
+    row = {key: table[key][0].as_py() for key in ("A", "B", "C", "t_min", "t_max")}
+    return AntoineEquation(row["A"], row["B"], row["C"], row["t_min"], row["t_max"])
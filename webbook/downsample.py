@@ -0,0 +1,68 @@
+"""Shape-preserving downsampling of dense curves before they are sent to the browser.
+
+Both methods return sorted indices into the input arrays, always keeping the
+first and last point:
+
+* ``lttb`` (Largest-Triangle-Three-Buckets) keeps, per bucket, the point that
+  spans the largest triangle with the previously kept point and the mean of
+  the next bucket. It follows the visual shape closely.
+* ``minmax`` keeps the minimum and maximum of every bucket, so no spike or
+  step (such as a change of Shomate segment) is lost.
+"""
+
+import numpy as np
+
+# About two points per horizontal pixel of a full-width chart.
+POINT_BUDGET = 2000
+
+
+def _bucket_edges(n, buckets):
+    """Edges splitting the interior points 1..n-2 into ``buckets`` contiguous runs."""
+    return np.unique(np.linspace(1, n - 1, buckets + 1).astype(np.intp))
+
+
+def lttb(x, y, budget=POINT_BUDGET):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if budget >= n or budget < 3:
+        return np.arange(n)
+
+    edges = _bucket_edges(n, budget - 2)
+    counts = np.diff(edges)
+    # Mean of each bucket; the bucket after the last one is the final point.
+    mean_x = np.append(np.add.reduceat(x[:n - 1], edges[:-1]) / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:n - 1], edges[:-1]) / counts, y[-1])
+
+    selected = [0]
+    previous = 0
+    for bucket, (start, stop) in enumerate(zip(edges[:-1], edges[1:])):
+        px, py = x[previous], y[previous]
+        area = np.abs((px - mean_x[bucket + 1]) * (y[start:stop] - py) - (px - x[start:stop]) * (mean_y[bucket + 1] - py))
+        previous = start + int(np.argmax(area))
+        selected.append(previous)
+    selected.append(n - 1)
+    return np.asarray(selected, dtype=np.intp)
+
+
+def minmax(x, y, budget=POINT_BUDGET):
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if budget >= n or budget < 4:
+        return np.arange(n)
+
+    edges = _bucket_edges(n, (budget - 2) // 2)
+    interior = y[:n - 1]
+    counts = np.diff(edges)
+    bucket_of = np.repeat(np.arange(len(counts)), counts)
+    picks = [np.array([0, n - 1])]
+    for reduce in (np.minimum, np.maximum):
+        extremes = reduce.reduceat(interior, edges[:-1])
+        hits = np.flatnonzero(interior[edges[0]:edges[-1]] == np.repeat(extremes, counts)) + edges[0]
+        # First hit in every bucket
+        _, first = np.unique(bucket_of[hits - edges[0]], return_index=True)
+        picks.append(hits[first])
+    return np.unique(np.concatenate(picks))
+
+
+METHODS = {"LTTB": lttb, "Min/max": minmax}
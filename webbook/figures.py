@@ -0,0 +1,141 @@
+"""Matplotlib figures rendered once and cached as PNG bytes.
+
+Figures are built with the object-oriented ``matplotlib.figure.Figure`` API
+rather than pyplot, so there is no global figure state shared between
+session threads and nothing to close: each Figure is garbage collected once
+its PNG has been written. ``st.cache_data(max_entries=...)`` keeps memory
+bounded.
+"""
+
+import io
+
+import numpy as np
+import streamlit as st
+
+from webbook import metrics, startup
+from webbook.shomate import ShomateEngine
+
+
+@metrics.cached("solid_cp_png", max_entries=32, show_spinner=False)
+def solid_cp_png(names, coefficients, t_min, t_max, points, cp_unit):
+    """PNG of Cp(T) for the given solid phases.
+
+    ``names``/``coefficients`` are tuples (one A..H row per phase) so the
+    phase set, unit system and grid together form the cache key.
+    """
+    with startup.page_imports("Other Data: solid phase plot"):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+    engine = ShomateEngine(coefficients, names=names)
+    temperatures = np.linspace(t_min, t_max, points)
+
+    fig = Figure(figsize=(8, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    # Compute Cp for every phase in one call (phases x temperatures) and plot
+    for phase, Cp_values in zip(engine.names, engine.cp(temperatures)):
+        ax.plot(temperatures, Cp_values, label=phase)
+
+    ax.set_xlabel("Temperature (K)")
+    ax.set_ylabel(f"Heat Capacity ({cp_unit})")
+    ax.set_title("Heat Capacity Variation for Solid Phases")
+    ax.legend()
+    ax.grid(True)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=100)
+    return buffer.getvalue()
+
+
+@metrics.cached("saha_png", max_entries=32, show_spinner=False)
+def saha_png(quantity, t_min, t_max, t_points, log_ne_min, log_ne_max, ne_points):
+    """PNG heatmap of one stage fraction (or "Mean Charge") over the T x ne grid."""
+    with startup.page_imports("Atomic Spectra Data: ionization balance plot"):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+    from webbook.saha import load_balance
+
+    balance = load_balance()
+    temperatures = np.linspace(t_min, t_max, t_points)
+    densities = np.logspace(log_ne_min, log_ne_max, ne_points)
+    fractions = balance.fractions(temperatures, densities)
+    if quantity == "Mean Charge":
+        values, label, limits = balance.mean_charge(fractions), "Mean charge", (0, len(balance.ions) - 1)
+    else:
+        values, label, limits = fractions[balance.ions.index(quantity)], f"{quantity} fraction", (0, 1)
+
+    fig = Figure(figsize=(8, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    # Rows are densities and columns temperatures
+    image = ax.imshow(
+        values.T,
+        origin="lower",
+        aspect="auto",
+        extent=(t_min, t_max, log_ne_min, log_ne_max),
+        vmin=limits[0],
+        vmax=limits[1],
+        cmap="viridis",
+    )
+    fig.colorbar(image, ax=ax, label=label)
+    ax.set_xlabel("Temperature (K)")
+    ax.set_ylabel("log₁₀ Electron Density (cm⁻³)")
+    ax.set_title(f"Saha Ionization Balance: {label}")
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=100)
+    return buffer.getvalue()
+
+
+@metrics.cached("phase_stability_png", max_entries=32, show_spinner=False)
+def phase_stability_png(t_min, t_max, points, energy_unit, energy_factor):
+    """PNG of G - G_min per condensed phase, with the stable-phase band below it."""
+    with startup.page_imports("Other Data: phase stability plot"):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+    from webbook.phases import condensed_phases
+
+    stability = condensed_phases()
+    temperatures = np.linspace(t_min, t_max, points)
+    G = stability.gibbs(temperatures) * energy_factor
+    lowest = np.nanmin(np.where(np.isnan(G).all(axis=0), 0.0, G), axis=0)
+    stable = stability.stable_phase(temperatures)
+
+    fig = Figure(figsize=(8, 6))
+    FigureCanvasAgg(fig)
+    ax, band = fig.subplots(2, 1, sharex=True, gridspec_kw={"height_ratios": [4, 1]})
+    colors = {}
+    for phase, values in zip(stability.names, G):
+        (line,) = ax.plot(temperatures, values - lowest, label=phase)
+        colors[phase] = line.get_color()
+    ax.set_ylabel(f"G - G_min ({energy_unit})")
+    ax.set_title("Relative Gibbs Energy of the Condensed Phases")
+    ax.legend()
+    ax.grid(True)
+
+    # One coloured span per run of the same stable phase
+    edges = np.flatnonzero(np.diff(stable)) + 1
+    for run in np.split(np.arange(len(temperatures)), edges):
+        index = stable[run[0]]
+        if index < 0:
+            continue
+        band.axvspan(temperatures[run[0]], temperatures[run[-1]], color=colors[stability.names[index]], alpha=0.6)
+    for transition in stability.transitions(t_min, t_max):
+        band.axvline(transition["temperature"], color="black", linewidth=1)
+        band.annotate(
+            f"{transition['temperature']:.1f} K",
+            (transition["temperature"], 0.5),
+            xytext=(3, 0),
+            textcoords="offset points",
+            va="center",
+        )
+    band.set_yticks([])
+    band.set_ylabel("Stable")
+    band.set_xlabel("Temperature (K)")
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=100)
+    return buffer.getvalue()
@@ -0,0 +1,175 @@
+"""Least-squares fits of Antoine and Shomate coefficients to measurements.
+
+Both fits call ``scipy.optimize.least_squares`` with residuals computed
+over the whole array at once and analytic Jacobians, so a few hundred
+thousand points take well under a second.
+
+- Antoine: the residual is A - B/(T + C) - log10(P). The Jacobian columns
+  are 1, -1/(T + C) and B/(T + C)^2. The starting point is the linear fit
+  with C = 0.
+- Shomate: Cp is linear in A..E, so each segment's Jacobian is simply its
+  basis matrix [1, t, t^2, t^3, 1/t^2]. Cp data cannot fix F, G and H, so
+  they are set from reference values. H is ΔfH°298, F makes
+  H° - H°298 = 0 at 298.15 K, and G makes S°(298.15 K) = S°298, both taken
+  from the first segment's polynomial. Every later segment gets F and G
+  that keep H° and S° continuous at its lower breakpoint.
+
+Fitted sets can be registered: Antoine sets with ``register_antoine``
+(listed by ``antoine_sets`` next to the built-in one), and Shomate sets
+with ``webbook.reactions.register_species``.
+"""
+
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from webbook import datastore
+from webbook.antoine import AntoineEquation
+from webbook.shomate import PiecewiseShomate
+
+REFERENCE_TEMPERATURE = 298.15
+BUILT_IN_ANTOINE = "P (NIST)"
+
+_lock = threading.Lock()
+_antoine_registered = {}
+
+
+@dataclass(frozen=True)
+class FitResult:
+    """A fitted AntoineEquation or PiecewiseShomate with its residuals (fitted minus measured).
+
+    ``temperatures`` are the points the fit used, one per residual: rows
+    that were dropped (non-finite, non-positive or outside the
+    breakpoints) are not included.
+    """
+
+    model: object
+    temperatures: np.ndarray
+    residuals: np.ndarray
+    success: bool
+    message: str
+
+    @property
+    def rms(self):
+        return float(np.sqrt(np.mean(self.residuals**2)))
+
+    @property
+    def max_abs(self):
+        return float(np.max(np.abs(self.residuals)))
+
+
+def _measurements(x, y):
+    x = np.asarray(x, dtype=float).reshape(-1)
+    y = np.asarray(y, dtype=float).reshape(-1)
+    if x.shape != y.shape:
+        raise ValueError("Temperatures and measured values must have the same length")
+    keep = np.isfinite(x) & np.isfinite(y)
+    return x[keep], y[keep]
+
+
+def fit_antoine(temperatures, pressures):
+    """Fits log10(P) = A - B / (T + C); residuals are in log10(P)."""
+    # scipy is imported on the first fit, not when a page lists the fitted sets
+    from scipy.optimize import least_squares
+
+    T, P = _measurements(temperatures, pressures)
+    keep = (P > 0) & (T > 0)
+    T, log_p = T[keep], np.log10(P[keep])
+    if len(T) < 3:
+        raise ValueError("Need at least 3 points with positive T and P")
+
+    # Linear fit with C = 0 as the starting point
+    (A, B), *_ = np.linalg.lstsq(np.column_stack([np.ones_like(T), -1.0 / T]), log_p, rcond=None)
+
+    def residuals(params):
+        A, B, C = params
+        return A - B / (T + C) - log_p
+
+    def jacobian(params):
+        _, B, C = params
+        inverse = 1.0 / (T + C)
+        return np.column_stack([np.ones_like(T), -inverse, B * inverse**2])
+
+    # T + C must stay positive over the data
+    lower = [-np.inf, -np.inf, -T.min() + 1e-6]
+    result = least_squares(residuals, [A, B, 0.0], jac=jacobian, bounds=(lower, np.inf), x_scale="jac")
+    antoine = AntoineEquation(*result.x, T.min(), T.max())
+    return FitResult(antoine, T, result.fun, bool(result.success), result.message)
+
+
+def _cp_basis(t):
+    return np.column_stack([np.ones_like(t), t, t * t, t**3, 1.0 / (t * t)])
+
+
+def _enthalpy_polynomial(coefficients, t):
+    A, B, C, D, E = coefficients
+    return A * t + B * t**2 / 2 + C * t**3 / 3 + D * t**4 / 4 - E / t
+
+
+def _entropy_polynomial(coefficients, t):
+    A, B, C, D, E = coefficients
+    return A * np.log(t) + B * t + C * t**2 / 2 + D * t**3 / 3 - E / (2 * t**2)
+
+
+def fit_shomate(temperatures, heat_capacities, breakpoints=None, formation_enthalpy=0.0, entropy=0.0, name=None):
+    """Fits A..E per segment to Cp data and derives F, G, H from the reference values.
+
+    ``breakpoints`` are the segment edges (default: the data's own range).
+    Points on an inner breakpoint belong to the lower segment, as in
+    ``PiecewiseShomate``. ``formation_enthalpy`` (ΔfH°298, kJ/mol) and
+    ``entropy`` (S°298, J/mol K) fix the integration constants. Residuals
+    are in the Cp unit, in the order of ``FitResult.temperatures``.
+    """
+    from scipy.optimize import least_squares
+
+    T, Cp = _measurements(temperatures, heat_capacities)
+    if breakpoints is None:
+        breakpoints = [T.min(), T.max()]
+    breakpoints = np.asarray(breakpoints, dtype=float)
+    if np.any(np.diff(breakpoints) <= 0):
+        raise ValueError("Breakpoints must be strictly increasing")
+    inside = (T >= breakpoints[0]) & (T <= breakpoints[-1])
+    T, Cp = T[inside], Cp[inside]
+    segment = np.searchsorted(breakpoints[1:-1], T, side="left")
+
+    coefficients = np.zeros((len(breakpoints) - 1, 8))
+    residuals = np.empty_like(Cp)
+    success, messages = True, []
+    for k in range(len(coefficients)):
+        rows = segment == k
+        if rows.sum() < 5:
+            raise ValueError(f"Segment {breakpoints[k]:g} - {breakpoints[k + 1]:g} K needs at least 5 points")
+        basis = _cp_basis(T[rows] / 1000.0)
+        target = Cp[rows]
+        start, *_ = np.linalg.lstsq(basis, target, rcond=None)
+        result = least_squares(lambda c: basis @ c - target, start, jac=lambda c: basis, x_scale="jac")
+        coefficients[k, :5] = result.x
+        residuals[rows] = result.fun
+        success &= bool(result.success)
+        messages.append(result.message)
+
+    t_ref = REFERENCE_TEMPERATURE / 1000.0
+    coefficients[:, 7] = formation_enthalpy
+    coefficients[0, 5] = formation_enthalpy - _enthalpy_polynomial(coefficients[0, :5], t_ref)
+    coefficients[0, 6] = entropy - _entropy_polynomial(coefficients[0, :5], t_ref)
+    for k in range(1, len(coefficients)):
+        t_edge = breakpoints[k] / 1000.0
+        below, above = coefficients[k - 1], coefficients[k]
+        above[5] = below[5] + _enthalpy_polynomial(below[:5], t_edge) - _enthalpy_polynomial(above[:5], t_edge)
+        above[6] = below[6] + _entropy_polynomial(below[:5], t_edge) - _entropy_polynomial(above[:5], t_edge)
+
+    shomate = PiecewiseShomate(breakpoints, coefficients, name=name)
+    return FitResult(shomate, T, residuals, success, "; ".join(dict.fromkeys(messages)))
+
+
+def register_antoine(label, antoine):
+    """Adds (or replaces) an Antoine set for the vapor-pressure calculator, for all sessions."""
+    with _lock:
+        _antoine_registered[label] = antoine
+
+
+def antoine_sets():
+    """Label -> AntoineEquation: the built-in phosphorus set followed by registered fits."""
+    with _lock:
+        return {BUILT_IN_ANTOINE: datastore.antoine("P"), **_antoine_registered}
@@ -0,0 +1,95 @@
+"""Atomic line lists with wavelength-range queries.
+
+Lines of every ion stage are held in one array sorted by wavelength, so a
+range query is two binary searches. The ion and transition-probability
+filters are then applied only to the lines inside that range. Line lists are
+read from the ``line_lists`` table of the memory-mapped dataset, which is
+built from ``data/source/line_lists.csv`` (for example, NIST ASD exports).
+That file ships with only a header, and the Atomic Spectra page shows the
+Line Lists section only once it has rows.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+from webbook import datastore
+
+_ROMAN = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100}
+
+
+def ion_stage(ion):
+    """Spectrum number of an ion label, e.g. ``"P XIV"`` -> 14."""
+    numeral = ion.split()[-1]
+    total = 0
+    for digit, following in zip(numeral, numeral[1:] + " "):
+        value = _ROMAN[digit]
+        total += -value if _ROMAN.get(following, 0) > value else value
+    return total
+
+
+class LineList:
+    """Spectral lines sorted by wavelength, with ions stored as integer codes."""
+
+    def __init__(self, wavelengths, ions, aki, lower_levels, upper_levels, references):
+        wavelengths = np.asarray(wavelengths, dtype=float)
+        order = np.argsort(wavelengths, kind="stable")
+        self.wavelengths = wavelengths[order]
+        self.aki = np.asarray(aki, dtype=float)[order]
+        self.lower_levels = np.asarray(lower_levels, dtype=object)[order]
+        self.upper_levels = np.asarray(upper_levels, dtype=object)[order]
+        self.references = np.asarray(references, dtype=object)[order]
+        ions = np.asarray(ions, dtype=object)[order]
+        self.ions = np.array(sorted(set(ions), key=ion_stage), dtype=object)
+        lookup = {ion: code for code, ion in enumerate(self.ions)}
+        self.codes = np.fromiter((lookup[ion] for ion in ions), dtype=np.int32, count=len(ions))
+
+    @classmethod
+    def from_table(cls, table):
+        return cls(
+            datastore.numbers(table, "wavelength_nm"),
+            table["ion"].to_pylist(),
+            datastore.numbers(table, "aki"),
+            table["lower_level"].to_pylist(),
+            table["upper_level"].to_pylist(),
+            table["reference"].to_pylist(),
+        )
+
+    def __len__(self):
+        return len(self.wavelengths)
+
+    @property
+    def wavelength_range(self):
+        return (float(self.wavelengths[0]), float(self.wavelengths[-1])) if len(self) else (0.0, 0.0)
+
+    def query(self, low, high, ions=None, with_probabilities=False):
+        """Positions of lines with low <= λ <= high, optionally filtered, in wavelength order."""
+        if low > high:
+            raise ValueError("The lower wavelength must not exceed the upper one")
+        start = np.searchsorted(self.wavelengths, low, side="left")
+        stop = np.searchsorted(self.wavelengths, high, side="right")
+        positions = np.arange(start, stop)
+        if ions is not None:
+            wanted = np.flatnonzero(np.isin(self.ions, list(ions)))
+            positions = positions[np.isin(self.codes[start:stop], wanted)]
+        if with_probabilities:
+            positions = positions[~np.isnan(self.aki[positions])]
+        return positions
+
+    def frame(self, positions):
+        positions = np.asarray(positions, dtype=np.intp)
+        return pd.DataFrame({
+            "Ion": self.ions[self.codes[positions]],
+            "Wavelength (nm)": self.wavelengths[positions],
+            "Aki (s⁻¹)": self.aki[positions],
+            "Lower Level": self.lower_levels[positions],
+            "Upper Level": self.upper_levels[positions],
+            "Reference": self.references[positions],
+        })
+
+
+@functools.lru_cache(maxsize=1)
+def load_lines():
+    """The process-wide line list built from the dataset."""
+    return LineList.from_table(datastore.load("line_lists"))
@@ -0,0 +1,119 @@
+"""Prometheus metrics for page renders, calculators, caches and sessions.
+
+``serve()`` starts the exporter once per process on 127.0.0.1, port
+``WEBBOOK_METRICS_PORT`` (default 9464; set it to 0 to disable), and
+``/metrics`` is then scraped from there. The metrics are:
+
+- webbook_page_render_seconds{page, option}: render latency per page and
+  sub-option (recorded by the page registry)
+- webbook_calculations_total{calculator}: calculator invocations
+- webbook_cache_lookups_total{cache, result}: hits and misses of the
+  ``st.cache_data`` functions wrapped with ``cached``
+- webbook_active_sessions and webbook_process_rss_bytes: gauges read at
+  scrape time
+"""
+
+import functools
+import logging
+import os
+import threading
+
+import streamlit as st
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 9464
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PAGE_RENDER_SECONDS = Histogram(
+    "webbook_page_render_seconds", "Page render latency", ["page", "option"], buckets=LATENCY_BUCKETS
+)
+CALCULATIONS = Counter("webbook_calculations_total", "Calculator invocations", ["calculator"])
+CACHE_LOOKUPS = Counter("webbook_cache_lookups_total", "Cached function lookups", ["cache", "result"])
+ACTIVE_SESSIONS = Gauge("webbook_active_sessions", "Browser sessions connected to this process")
+PROCESS_RSS = Gauge("webbook_process_rss_bytes", "Resident memory of this process")
+
+_local = threading.local()
+_server_lock = threading.Lock()
+_server_port = None
+
+
+def _active_sessions():
+    try:
+        from streamlit import runtime
+
+        return runtime.get_instance()._session_mgr.num_active_sessions()
+    except Exception:  # no runtime (bare mode) or internals changed
+        return float("nan")
+
+
+def _rss():
+    import psutil
+
+    return psutil.Process().memory_info().rss
+
+
+ACTIVE_SESSIONS.set_function(_active_sessions)
+PROCESS_RSS.set_function(_rss)
+
+
+def serve(port=None):
+    """Starts the /metrics endpoint unless this process already has one."""
+    global _server_port
+    if port is None:
+        port = int(os.environ.get("WEBBOOK_METRICS_PORT", DEFAULT_PORT))
+    with _server_lock:
+        if _server_port is not None or not port:
+            return _server_port
+        try:
+            start_http_server(port, addr="127.0.0.1")
+        except OSError as error:
+            logger.warning("Metrics endpoint not started on port %d: %s", port, error)
+            port = 0
+        _server_port = port
+        return port
+
+
+def begin_page():
+    _local.option = ""
+
+
+def record_option(option):
+    """Tags the current page render with the sub-option the page displays."""
+    _local.option = option or ""
+
+
+def observe_page(page, seconds):
+    PAGE_RENDER_SECONDS.labels(page, getattr(_local, "option", "")).observe(seconds)
+
+
+def calculation(calculator):
+    CALCULATIONS.labels(calculator).inc()
+
+
+def cached(name, cache=st.cache_data, **options):
+    """``cache(**options)`` that also counts hits and misses under ``name``.
+
+    The wrapped body only runs on a miss, so it flags the lookup in
+    thread-local state; the outer wrapper reads the flag after the call.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            _local.missed = True
+            return func(*args, **kwargs)
+
+        lookup_cached = cache(**options)(body)
+
+        @functools.wraps(func)
+        def lookup(*args, **kwargs):
+            _local.missed = False
+            try:
+                return lookup_cached(*args, **kwargs)
+            finally:
+                CACHE_LOOKUPS.labels(name, "miss" if _local.missed else "hit").inc()
+
+        lookup.clear = lookup_cached.clear
+        return lookup
+    return decorate
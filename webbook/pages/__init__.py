@@ -0,0 +1,5 @@
+"""One module per web book page, each exposing ``TITLE`` and ``render()``.
+
+Modules are imported on demand by ``webbook.registry`` the first time their
+page is selected.
+"""
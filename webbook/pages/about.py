@@ -0,0 +1,144 @@
+"""About the Element page."""
+
+import pandas as pd
+import streamlit as st
+
+from webbook.assets import image_html, show_image
+
+TITLE = "About the Element"
+
+
+def render():
+    st.divider()
+
+    st.markdown("### <u>Chemical Properties</u>", unsafe_allow_html=True)
+    table_html = """
+    <style>
+        table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        th, td {
+            border: 1px solid white;
+            padding: 10px;
+            text-align: left;
+        }
+        th {
+            display: none;
+        }
+    </style>
+    <table>
+        <tr><td><b>Formula</b></td><td>P</td></tr>
+        <tr><td><b>Molecular Weight</b></td><td>30.973762</td></tr>
+        <tr><td><b>Atomic Number</b></td><td>15</td></tr>
+        <tr><td><b>Classification</b></td><td>Pnictogen, Non-metal</td></tr>
+        <tr><td><b>Electronic Configuration</b></td><td>1s² 2s² 2p⁶ 3s² 3p³</td></tr>
+        <tr><td><b>Group</b></td><td>15</td></tr>
+        <tr><td><b>Period</b></td><td>3</td></tr>
+        <tr><td><b>Common Oxidation States</b></td><td>+5, +3, -3</td></tr>
+        <tr><td><b>Key Isotope</b></td><td>³¹P</td></tr>
+        <tr><td><b>State at 20°C</b></td><td>Solid</td></tr>
+    </table>
+    """
+
+    # Display table
+    st.markdown(table_html, unsafe_allow_html=True)
+
+    # Display image using markdown to ensure full width
+    st.markdown(
+        f"""
+        <div style="display: flex; justify-content: center;">
+            {image_html("images/9.jpg", style="width: 100vw; height: auto; border-radius: 0px;")}
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    st.divider()
+    with st.container():
+        st.markdown(
+            """
+            <div style="
+                background-color: #FFB6C1; 
+                padding: 20px; 
+                border-radius: 10px; 
+                text-align: center;
+            ">
+                <h2 style="color: #AA336A;">DID YOU KNOW?</h2>
+                <hr style="border: 2px solid #AA336A; width: 50%; margin: 10px auto;"> 
+                <p style="color: #AA336A; font-size: 18px;">
+                    <b>Violet phosphorus is a semiconducting allotrope of phosphorus with a layered crystalline structure, exhibiting unique electronic and optoelectronic properties, and is considered the most stable form of phosphorus</b>
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    st.divider()
+
+    st.markdown("### <u>Allotropes of Phosphorous</u>", unsafe_allow_html=True)
+
+    phosphorus_data = {
+    "White Phosphorus": {
+        "Name": "White Phosphorous",
+        "Structure": "Discrete P₄ tetrahedra",
+        "Diagram": "images/6.jpg",
+        "Colour": "White or yellow",
+        "Melting Point": "~44°C (317 K)",
+        "Stability": "Least stable, highly reactive",
+        "Reactivity": "Highly reactive, ignites spontaneously in air",
+        "Solubility": "Insoluble in water, soluble in carbon disulfide",
+        "Electrical Conductivity": "Non-conductive",
+        "Common Uses": "Fertilisers, pesticides, explosives, rat poison",
+    },
+    "Black Phosphorus": {
+        "Name": "Black Phosphorous",
+        "Structure": "Corrugated sheets, flaky crystals",
+        "Diagram": "images/7.jpg",
+        "Colour": "Black",
+        "Melting Point": "~44°C (317 K)",
+        "Stability": "Most stable of all allotropes",
+        "Reactivity": "Inert, does not ignite in air up to 673 K",
+        "Solubility": "Insoluble in water, carbon disulfide",
+        "Electrical Conductivity": "Conductive",
+        "Common Uses": "Biomedical applications, photothermal therapy",
+    },
+    "Red Phosphorus": {
+        "Name": "Red Phosphorous",
+        "Structure": "Polymeric chains of P₄ tetrahedra",
+        "Diagram": "images/8.jpg",
+        "Colour": "Iron-grey",
+        "Melting Point": "860 K",
+        "Stability": "More stable than white phosphorus",
+        "Reactivity": "Less reactive, does not ignite in air",
+        "Solubility": "Insoluble in water and carbon disulfide",
+        "Electrical Conductivity": "Non-conductive",
+        "Common Uses": "Matchsticks, flame retardants, smoke devices",
+    },
+    }
+
+    # Replace image paths with references to the pre-built thumbnails
+    for allotrope in phosphorus_data:
+        phosphorus_data[allotrope]["Diagram"] = image_html(phosphorus_data[allotrope]["Diagram"], "thumb", attributes='width="100"')
+
+    options = list(phosphorus_data.keys())
+    st.write("Select Phosphorus Allotropes for Comparison:")
+    selection = st.segmented_control(" ", options, selection_mode="multi")
+
+    # Display table if any selection is made
+    if selection:
+        selected_data = {key: phosphorus_data[key] for key in selection}
+
+        # Convert to DataFrame
+        df = pd.DataFrame(selected_data).rename_axis("Property").reset_index()
+
+        # Display table with embedded images
+        st.markdown(df.to_html(index=False, escape=False), unsafe_allow_html=True)
+
+    st.divider()
+    st.markdown("### <u>Phase Diagram</u>", unsafe_allow_html=True)
+    show_image("images/phase.png")
+    st.divider()
+    st.markdown("### <u>IUPAC Identifiers & Registry Information</u>", unsafe_allow_html=True)
+    st.write("IUPAC Standard InChI: InChI=1S/P")
+    st.write("IUPAC Standard InChIKey: OAICVXFJPJFONN-UHFFFAOYSA-N")
+    st.write("CAS Registry Number: 7723-14-0")
+    st.divider()
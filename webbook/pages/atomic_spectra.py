@@ -0,0 +1,114 @@
+"""Atomic Spectra Data page."""
+
+import math
+
+import numpy as np
+import streamlit as st
+
+from webbook import bulk, metrics
+from webbook.figures import saha_png
+from webbook.lines import load_lines
+from webbook.saha import load_balance
+from webbook.tables import tables
+from webbook.widgets import file_export
+
+TITLE = "Atomic Spectra Data"
+PAGE_SIZES = [50, 100, 500, 1000]
+MAX_GRID_POINTS = 1_000_000
+
+
+@st.fragment
+def _line_lists():
+    line_list = load_lines()
+    st.write("### Line Lists:")
+    low, high = line_list.wavelength_range
+    col1, col2 = st.columns(2)
+    start = col1.number_input("From (nm)", min_value=low, max_value=high, value=low, key="lines_from")
+    stop = col2.number_input("To (nm)", min_value=low, max_value=high, value=high, key="lines_to")
+    ions = st.multiselect("Ions", list(line_list.ions), default=list(line_list.ions), key="lines_ions")
+    with_probabilities = st.checkbox("Only lines with transition probabilities", key="lines_aki")
+    try:
+        metrics.calculation("line_query")
+        positions = line_list.query(start, stop, ions, with_probabilities)
+    except ValueError as error:
+        st.warning(str(error))
+        return
+
+    col1, col2 = st.columns(2)
+    page_size = col1.selectbox("Lines per page", PAGE_SIZES, key="lines_page_size")
+    pages = max(1, math.ceil(len(positions) / page_size))
+    page = col2.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key="lines_page")
+    shown = positions[(page - 1) * page_size:page * page_size]
+    st.caption(f"{len(positions):,} lines match; showing {len(shown):,}")
+    st.dataframe(line_list.frame(shown), hide_index=True)
+
+
+@st.fragment
+def _ionization_balance():
+    balance = load_balance()
+    st.write("### Ionization Balance (Saha Equation):")
+    st.caption(
+        f"Stage fractions {balance.ions[0]} … {balance.ions[-1]} from the ionization energies above, "
+        "with ground-level statistical weights as partition functions."
+    )
+    col1, col2, col3 = st.columns(3)
+    t_min = col1.number_input("Min temperature (K)", min_value=100.0, value=5000.0, step=1000.0, key="saha_t_min")
+    t_max = col2.number_input("Max temperature (K)", min_value=100.0, value=1_000_000.0, step=1000.0, key="saha_t_max")
+    t_points = col3.number_input("Temperature points", min_value=2, max_value=10_000, value=400, key="saha_t_points")
+    col1, col2, col3 = st.columns(3)
+    log_ne_min = col1.number_input("Min log₁₀ nₑ (cm⁻³)", value=8.0, step=1.0, key="saha_ne_min")
+    log_ne_max = col2.number_input("Max log₁₀ nₑ (cm⁻³)", value=22.0, step=1.0, key="saha_ne_max")
+    ne_points = col3.number_input("Density points", min_value=2, max_value=10_000, value=200, key="saha_ne_points")
+
+    if t_min >= t_max or log_ne_min >= log_ne_max:
+        st.warning("Each maximum must be larger than its minimum.")
+        return
+    points = t_points * ne_points
+    st.caption(f"{points:,} grid points")
+    if points > MAX_GRID_POINTS:
+        st.warning(f"Grids are limited to {MAX_GRID_POINTS:,} points.")
+        return
+
+    quantity = st.selectbox("Show", ["Mean Charge"] + balance.ions, key="saha_quantity")
+    grid = (float(t_min), float(t_max), int(t_points), float(log_ne_min), float(log_ne_max), int(ne_points))
+    metrics.calculation("saha")
+    st.image(saha_png(quantity, *grid), use_container_width=True)
+
+    temperatures = np.linspace(t_min, t_max, t_points)
+    densities = np.logspace(log_ne_min, log_ne_max, ne_points)
+    file_export(lambda: bulk.saha_frames(balance, temperatures, densities), "ionization_balance", "saha")
+
+
+def render():
+    popover = st.popover("Filter")
+    line = popover.checkbox("Line Holdings", True)
+    level = popover.checkbox("Level Holdings", True)
+    ground = popover.checkbox("Ground States & Ionization Energies", True)
+    # Offered only once data/source/line_lists.csv has rows (see webbook.lines)
+    lines = len(load_lines()) > 0 and popover.checkbox("Line Lists", True)
+    saha = popover.checkbox("Ionization Balance", True)
+
+    spectra_tables = tables(TITLE)
+
+    if line:
+        st.write("### Line Holdings:")
+        st.table(spectra_tables["line_holdings"])
+        st.divider()
+
+    if level:
+        st.write("### Level Holdings:")
+        st.table(spectra_tables["level_holdings"])
+        st.divider()
+
+    if ground:
+        st.write("### Ground States & Ionization Energies:")
+        st.table(spectra_tables["ground_states"])
+        st.info("**[Ne] = 1s²2s²2p⁶**")
+        st.divider()
+
+    if lines:
+        _line_lists()
+        st.divider()
+
+    if saha:
+        _ionization_balance()
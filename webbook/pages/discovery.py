@@ -0,0 +1,104 @@
+"""Discovery & History page."""
+
+import streamlit as st
+from streamlit_player import st_player
+
+from webbook.assets import image_html
+
+TITLE = "Discovery & History"
+
+
+def render():
+    st.divider()
+    # GUESSING THE DATE-----------------
+    @st.dialog(" Can you guess the year in which phosphorous was discovered?")
+    def guess_year_dialog():
+            st.write("Take a guess! In which year was phosphorus discovered?")
+
+            # Input for guessing the year
+            guess = st.number_input("Enter a year:", min_value=1000, max_value=2025, value=1800, step=1)
+
+            # Submit button
+            if st.button("Submit Guess"):
+                if guess == 1669:
+                    st.success("Correct! Phosphorus was discovered in 1669 by Hennig Brand.")
+                else:
+                    st.error(f"Oops! {int(guess)} is incorrect. Try again or check the correct answer below.")
+
+            # Reveal correct answer
+            if st.button("Reveal Correct Answer"):
+                st.info("Phosphorus was discovered in **1669** by **Hennig Brand**, a German alchemist.")
+
+        # Ask user if they want to guess
+    if st.button("TEST YOUR KNOWLEDGE: Do you think you can guess the discovery year of Phosphorous?"):
+            guess_year_dialog()
+
+
+    
+    st_player('https://www.youtube.com/watch?v=b5bXTAqep6s')
+    st.header("The Discovery of Phosphorus", divider="gray")
+    st.markdown("### <u>A Curious Accident</u>", unsafe_allow_html=True)
+    st.write(
+        "In 1669, a German alchemist named **Hennig Brand** was obsessed with finding the "
+        "**Philosopher’s Stone**, a legendary substance that could turn metals into gold. "
+        "Alchemy at the time was a mix of science and superstition, and Brand believed that "
+        "human urine, rich in mysterious substances, might hold the secret."
+    )
+
+    # Display image using markdown to ensure full width
+    st.markdown(
+        f"""
+        <div style="display: flex; justify-content: center;">
+            {image_html("images/2.jpg", style="width: 100vw; height: auto; border-radius: 0px;")}
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    st.write(
+        "So, he **collected gallons of urine**, let it rot for days, and boiled it down to a thick paste. "
+        "He then heated this paste until it glowed and, to his amazement, a strange, waxy substance appeared. "
+        "It **glowed eerily in the dark**—something never seen before. "
+        "This was **phosphorus**, though Brand had no idea of its true significance."
+    )
+
+    st.divider()
+    st.markdown("### <u>Phosphorus in History</u>", unsafe_allow_html=True)
+    st.write(
+        "Over time, scientists realized phosphorus was not a magical substance but a crucial element for life. "
+        "By the 18th century, it became famous for its **ability to catch fire**, leading to its use in early **matches**."
+    )
+
+    st.write(
+        "In the 19th and 20th centuries, phosphorus took on a darker role. It was used in **weapons** like incendiary bombs "
+        "during wars. But its most important use came in **agriculture**, where farmers learned that phosphorus was essential "
+        "for plant growth, leading to the development of **fertilizers** that revolutionized food production."
+    )
+    with st.container():
+        st.markdown(
+            """
+            <div style="
+                background-color: #FFB6C1; 
+                padding: 20px; 
+                border-radius: 10px; 
+                text-align: center;
+            ">
+                <h2 style="color: #AA336A;">DID YOU KNOW?</h2>
+                <hr style="border: 2px solid #AA336A; width: 50%; margin: 10px auto;"> 
+                <p style="color: #AA336A; font-size: 18px;">
+                    <b>In 1669, German alchemist <b>Hennig Brand</b> boiled 50 buckets of urine 
+                    while searching for gold—only to find a <b>glowing, waxy substance</b> instead.</b>
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+
+    st.divider()
+    st.markdown("### <u>The Element of Life and Destruction</u>", unsafe_allow_html=True)
+    st.write(
+        "Phosphorus is strange—it can **glow in the dark, burn intensely, sustain life, or destroy it**. "
+        "Today, it's essential for **DNA, bones, and energy in cells (ATP)**. "
+        "Ironically, in his quest for gold, Brand had actually discovered something far more valuable—the building block of life itself."
+    )
@@ -0,0 +1,55 @@
+"""Phosphorus in the Economy page."""
+
+import streamlit as st
+
+from webbook.assets import show_image
+
+TITLE = "Phosphorus in the Economy"
+
+
+def render():
+    st.divider()
+    st.write("Phosphorus plays a crucial role in global agriculture and industry, influencing food security, trade, and environmental policies. Its limited supply, concentrated in a few countries, has led to economic dependencies, price fluctuations, and regulatory interventions to manage its use and environmental effects.")
+    with st.container():
+        st.markdown(
+            """
+            <div style="
+                background-color: #FFB6C1; 
+                padding: 20px; 
+                border-radius: 10px; 
+                text-align: center;
+            ">
+                <h2 style="color: #AA336A;">DID YOU KNOW?</h2>
+                <hr style="border: 2px solid #AA336A; width: 50%; margin: 10px auto;"> 
+                <p style="color: #AA336A; font-size: 18px;">
+                    <b>Around 90% of mined phosphorus is used to make fertilizers that boost crop yields. Countries with large phosphate reserves, like Morocco, China, and the U.S., have significant control over the phosphorus supply, making it a critical element in the global economy.</b>
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    st.divider()
+    st.markdown("## <u>Phosphorus in Agriculture and Food Security </u>", unsafe_allow_html=True)
+    st.write("Phosphorus-based fertilizers are essential for maintaining soil fertility and ensuring high crop yields. Countries with high agricultural output, such as the U.S., China, and India, heavily rely on phosphate fertilizers. The rising cost of phosphorus-based fertilizers due to supply chain disruptions has led to government subsidies and incentives in some regions to support farmers. However, inefficient use and over-application have caused environmental concerns, prompting stricter regulations on phosphorus management.")
+    st.divider()
+    st.markdown("## <u>Bans and Restrictions on Phosphorus Use </u>", unsafe_allow_html=True)
+    st.subheader("1.Detergents and Cleaning Products")
+    st.write("Many countries, including the U.S., Canada, and members of the European Union, have banned or restricted phosphorus in household and industrial detergents. This was done to reduce water pollution and prevent eutrophication in lakes and rivers. The bans have led to the development of phosphate-free detergents.")
+    st.subheader("2.Agricultural Runoff Regulations")
+    st.write("In response to rising phosphorus pollution, certain regions have imposed restrictions on fertilizer use. For example, the European Union has introduced regulations on phosphorus application rates in agriculture, and some U.S. states, such as Minnesota and Wisconsin, have restricted phosphorus-based lawn fertilizers to limit water contamination.")
+    st.subheader("3.Phosphorus Recycling Initiatives")
+    st.write("Some countries, such as Germany and Sweden, have implemented policies to encourage phosphorus recovery from wastewater and agricultural runoff. Technologies such as struvite precipitation and bio-based phosphorus recycling are gaining traction as part of circular economy strategies.")
+    show_image("images/ban.jpg")
+    st.divider()
+    st.markdown("## <u>Economic Instruments and Incentives </u>", unsafe_allow_html=True)
+    st.write("Governments and international organizations are increasingly adopting economic tools to manage phosphorus sustainably:")
+    st.subheader("1.Subsidies for Sustainable Fertilizers")
+    st.write("Several governments provide financial incentives for using controlled-release and organic phosphorus fertilizers to reduce runoff and increase efficiency.")
+    st.subheader("2.Emissions Trading for Phosphorus Pollution")
+    st.write("Some regions have proposed market-based mechanisms where industries and farms trade phosphorus emissions permits to encourage efficient use and reduce environmental impact.")
+    st.subheader("3.Investment in Phosphorus Recycling")
+    st.write("Countries like Japan and the Netherlands are investing in technologies to extract phosphorus from wastewater and sewage sludge, reducing dependency on imported phosphate rock.")
+    st.divider()
+    st.markdown("## <u>Conclusion</u>", unsafe_allow_html=True)
+    st.write("Phosphorus remains a critical element in agriculture and industry, with significant economic and environmental implications. While bans and restrictions have helped mitigate its negative effects, global efforts are needed to enhance phosphorus efficiency, invest in recycling technologies, and create policies that balance agricultural productivity with environmental sustainability.")
+    st.divider()
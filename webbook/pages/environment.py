@@ -0,0 +1,52 @@
+"""Environment & Phosphorus page."""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+TITLE = "Environment & Phosphorus"
+
+
+def render():
+    st.divider()
+    st.markdown("### <u> Sources of Phosphorus Pollution</u>", unsafe_allow_html=True)
+    st.write("1. **Agricultural Runoff**: Fertilizers contribute to 38% of phosphorus pollution in water bodies.")
+    st.write("2. **Industrial Waste**: Mining and chemical industries add 8% to phosphorus emissions.")
+    st.write("3. **Urban Wastewater**: Domestic sewage and detergents account for 12% of phosphorus pollution.")
+    st.divider()
+    st.markdown("### <u>Phosphorus Use and Runoff Trends </u>", unsafe_allow_html=True)
+    years = np.arange(2000, 2030, 5)
+    phosphorus_use = [36, 40, 45, 51, 58, 65]
+    pollution_index = [50, 60, 75, 90, 110, 130]
+
+    data = pd.DataFrame({
+        "Year": years,
+        "Phosphorus Use (Million Metric Tons)": phosphorus_use,
+        "Water Pollution Index": pollution_index
+    })
+
+    st.line_chart(data.set_index("Year"))
+    with st.container():
+        st.markdown(
+            """
+            <div style="
+                background-color: #FFB6C1; 
+                padding: 20px; 
+                border-radius: 10px; 
+                text-align: center;
+            ">
+                <h2 style="color: #AA336A;">DID YOU KNOW?</h2>
+                <hr style="border: 2px solid #AA336A; width: 50%; margin: 10px auto;"> 
+                <p style="color: #AA336A; font-size: 18px;">
+                    <b>While phosphorus is essential for plant growth and used in fertilizers, excessive phosphorus runoff into water bodies causes eutrophication—leading to harmful algal blooms, oxygen depletion, and dead zones in lakes and oceans. This disrupts aquatic ecosystems and can harm marine life. </b>
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    st.divider()
+    st.markdown("### <u>Environmental Effects of Excess Phosphorus </u>", unsafe_allow_html=True)
+    st.write("1. **Eutrophication**: High phosphorus levels in water bodies lead to algal blooms, which deplete oxygen levels and cause aquatic dead zones.\n - Example: The Gulf of Mexico dead zone expanded to **16,400 sq. km in 2023**, mainly due to phosphorus runoff.")
+    st.write("2. **Water Quality Degradation**: Algal blooms increase water toxicity, affecting drinking water supply.\n - The cost of water treatment due to algal blooms is estimated at **$4.6 billion annually** in the U.S.")
+    st.write("3. **Biodiversity Loss**: Oxygen-deprived zones lead to the collapse of fish populations, affecting fisheries.")
+    st.divider()
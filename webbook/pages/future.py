@@ -0,0 +1,55 @@
+"""Future Prospects page."""
+
+import streamlit as st
+
+TITLE = "Future Prospects"
+
+
+def render():
+    st.divider()
+    st.write("Phosphorus is an essential element with widespread applications in agriculture, industry, and energy. However, its future availability and sustainability pose significant challenges and opportunities.")
+    st.divider()
+    st.markdown("### <u> 1. Growing Demand in Agriculture</u>", unsafe_allow_html=True)
+    st.write("- Phosphorus is a key nutrient for plant growth and a major component of fertilizers.")
+    st.write("- With increasing global food demand, phosphorus consumption is expected to rise, putting pressure on natural phosphate reserves.")
+    st.divider()
+    st.markdown("### <u>2. Phosphate Rock Depletion </u>", unsafe_allow_html=True)
+    st.write("- Phosphorus is mainly obtained from phosphate rock, which is a **finite resource**.")
+    st.write("- Some studies suggest that **high-quality phosphate reserves may be depleted within 50-100 years**.")
+    with st.container():
+        st.markdown(
+            """
+            <div style="
+                background-color: #FFB6C1; 
+                padding: 20px; 
+                border-radius: 10px; 
+                text-align: center;
+            ">
+                <h2 style="color: #AA336A;">DID YOU KNOW?</h2>
+                <hr style="border: 2px solid #AA336A; width: 50%; margin: 10px auto;"> 
+                <p style="color: #AA336A; font-size: 18px;">
+                    <b>Phosphorus might power the future of electric vehicles! Researchers are developing lithium iron phosphate (LFP) batteries, which use phosphorus and are safer, longer-lasting, and more sustainable than traditional lithium-ion batteries. These batteries are already used in Tesla's entry-level models and could dominate the EV market in the future!</b>
+                </p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    st.divider()
+    st.markdown("### <u>3. Sustainable Phosphorus Management </u>", unsafe_allow_html=True)
+    st.write("- Recycling phosphorus from wastewater, agricultural runoff, and food waste is gaining attention.")
+    st.write("- Technologies like **struvite precipitation** (recovering phosphorus from wastewater) and bio-based fertilizers offer sustainable alternatives.")
+    st.divider()
+    st.markdown("### <u>4. Environmental Regulations & Circular Economy </u>", unsafe_allow_html=True)
+    st.write("- Governments are implementing policies to reduce phosphorus pollution, such as limiting fertilizer runoff.")
+    st.write("- Circular economy approaches, like recovering phosphorus from sewage sludge and animal manure, are being explored.")
+    st.divider()
+    st.markdown("### <u>5. Innovation in Fertilizer Technology </u>", unsafe_allow_html=True)
+    st.write("- Researchers are developing **slow-release and precision fertilizers** to improve efficiency and reduce waste.")
+    st.write("- **Microbial biofertilizers** (using phosphorus-solubilizing bacteria) could enhance phosphorus availability in soil.")
+    st.divider()
+    st.markdown("### <u>6. Phosphorus in Energy & Industry </u>", unsafe_allow_html=True)
+    st.write("- Phosphorus is used in **lithium iron phosphate (LFP) batteries**, which are gaining popularity in **electric vehicles and renewable energy storage**.")
+    st.write("- It is also essential in semiconductor production, flame retardants, and metal refining.")
+    st.divider()
+    st.markdown("### <u>Conclusion </u>", unsafe_allow_html=True)
+    st.write("Phosphorus will remain **critical for agriculture, industry, and energy storage** in the future. Sustainable management strategies, innovative recovery methods, and regulatory policies will be key to balancing demand while mitigating environmental risks.")
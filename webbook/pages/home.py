@@ -0,0 +1,34 @@
+"""Home page."""
+
+import streamlit as st
+
+from webbook.assets import show_image
+
+TITLE = "Home"
+
+
+def render():
+    st.header("Phosphorus: From Alchemy to Agriculture")
+    st.divider()
+
+    st.write("""
+        Welcome to the web book on **Phosphorus**, an essential element that has shaped human history, 
+        from its mystical discovery by alchemists to its critical role in modern agriculture and industry.
+
+        This resource serves as a comprehensive guide to the **chemistry, history, applications, 
+        and environmental impact** of phosphorus.
+        """)
+    show_image("images/1.jpg")
+    st.divider()
+    st.subheader("About this Web Book")
+    st.write("""
+        Inspired by **NIST Chemistry WebBook**, this project aims to present structured and 
+        accessible data on phosphorus. Our sections cover:
+        - **Discovery & History**: How phosphorus was first isolated and studied.
+        - **Spectroscopic Data**: X-ray photoelectron and atomic spectra insights.
+        - **Uses & Applications**: From fertilizers to high-tech industries.
+        - **Economic & Environmental Impact**: The role of phosphorus in global markets and ecosystems.
+
+        Feel free to navigate through the sections using the sidebar!
+        """)
+    st.divider()
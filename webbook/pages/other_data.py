@@ -0,0 +1,623 @@
+"""Other Data page: thermochemistry, phase change and ion energetics."""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from webbook import bulk, curves, downsample, metrics
+from webbook.antoine import AntoineEquation
+from webbook.figures import phase_stability_png, solid_cp_png
+from webbook.fitting import BUILT_IN_ANTOINE, antoine_sets, fit_antoine, fit_shomate, register_antoine
+from webbook.phases import condensed_phases
+from webbook.quantity import CALORIE_FACTOR
+from webbook.reactions import ReactionSet, register_species, species_library
+from webbook.shomate import COEFFICIENT_NAMES, PiecewiseShomate, ShomateEngine, parse_range
+from webbook.tables import tables
+from webbook.uncertainty import dataset_sigmas, trc_uncertainty
+from webbook.widgets import (
+    antoine_batch,
+    antoine_uncertainty,
+    band_chart,
+    bulk_calculator,
+    curve_chart,
+    curve_resolution,
+    draw_count,
+    inverse_calculator,
+    parse_numbers,
+    shomate_uncertainty,
+)
+
+TITLE = "Other Data"
+
+
+# Calculators and charts run as fragments: changing one of their inputs
+# reruns only that block, not the LaTeX, tables and charts around it. The
+# sections with a calorie toggle are fragments as well, so switching units
+# reruns the section rather than the whole app.
+
+
+@st.fragment
+def _shomate_calculator(shomate, use_calories, show_temperature=False):
+    low, high = shomate.temperature_range
+    temp = st.number_input(f"Enter Temperature (K) between {low:.10g} and {high:.10g}:", min_value=low, max_value=high, step=0.1)
+
+    if temp:
+        metrics.calculation("shomate")
+        Cp, H_val, S_val = shomate.evaluate(temp)
+
+        if show_temperature:
+            st.write(f"**Computed Properties at** {temp} K")
+        st.write(f"**Heat Capacity (Cₚ):**  {Cp:.3f} {'cal/mol*K' if use_calories else 'J/mol*K'}")
+        st.write(f"**Enthalpy (H° - H°₂₉₈.₁₅):**  {H_val:.3f} {'kcal/mol' if use_calories else 'kJ/mol'}")
+        st.write(f"**Entropy (S°):**  {S_val:.3f} {'cal/mol*K' if use_calories else 'J/mol*K'}")
+        st.divider()
+
+
+@st.fragment
+def _cp_chart(shomate, use_calories, key):
+    points, method = curve_resolution(key)
+    curve = curves.shomate_cp_curve(
+        tuple(shomate.breakpoints), tuple(map(tuple, shomate.coefficients)), points, method
+    )
+
+    y_label = "Heat Capacity (cal/mol*K)" if use_calories else "Heat Capacity (J/mol*K)"
+    st.markdown(f"**X-axis:** Temperature (K)  |  **Y-axis:** {y_label}")
+    curve_chart(curve)
+
+
+@st.fragment
+def _gas_phase():
+    use_calories = st.checkbox("Show values in calorie-based units")
+    energy_units = ("cal/mol*K", "kcal/mol") if use_calories else ("J/mol*K", "kJ/mol")
+    gas_tables = tables(TITLE, "Gas phase thermochemistry data", use_calories)
+
+    st.markdown("### <u>Thermodynamic Properties Table</u>", unsafe_allow_html=True)
+
+    st.caption("These values are calculated by 2 different methods.")
+    st.dataframe(gas_tables["properties"], hide_index=True)
+    st.divider()
+
+    st.markdown("### <u>Gas Phase Heat Capacity (Shomate Equation)</u>", unsafe_allow_html=True)
+    st.latex(r"""
+        C_p^\circ = A + B*t + C*t^2 + D*t^3 + \frac{E}{t^2}
+    """)
+    st.latex(r"""
+        H^\circ - H^\circ_{298.15} = A*t + \frac{B*t^2}{2} + \frac{C*t^3}{3} + \frac{D*t^4}{4} - \frac{E}{t} + F - H
+    """)
+    st.latex(r"""
+        S^\circ = A\ln(t) + B*t + \frac{C*t^2}{2} + \frac{D*t^3}{3} - \frac{E}{(2*t^2)} + G
+    """)
+
+    st.write("#### Explanation of Variables")
+    st.write("- $C_p$ = heat capacity (J/mol*K)")
+    st.write("- $H^\circ$ = standard enthalpy (kJ/mol)")
+    st.write("- $S^\circ$ = standard entropy (J/mol*K)")
+    st.write("- $t$ = temperature (K) / 1000")
+    df_constants = gas_tables["shomate"]
+    gas_shomate = PiecewiseShomate.from_columns(df_constants, name="Gas")
+    st.write("#### Shomate Equation Constants")
+    st.dataframe(df_constants, hide_index=True)
+    st.divider()
+
+    st.markdown("### <u>Calculate Properties Based on Temperature</u>", unsafe_allow_html=True)
+    _shomate_calculator(gas_shomate, use_calories, show_temperature=True)
+
+    bulk_calculator(gas_shomate, units=energy_units, key="gas")
+    inverse_calculator(gas_shomate, units=energy_units, key="gas")
+    shomate_uncertainty(gas_shomate, energy_units, _entropy_sigma("P(g)", use_calories), key="gas")
+    st.divider()
+
+    st.markdown("### <u>Variation of Cₚ with Temperature</u>", unsafe_allow_html=True)
+    _cp_chart(gas_shomate, use_calories, "gas_curve")
+
+
+@st.fragment
+def _condensed_phase():
+    use_calories = st.checkbox("Show values in calorie-based units")
+    energy_units = ("cal/mol*K", "kcal/mol") if use_calories else ("J/mol*K", "kJ/mol")
+    condensed_tables = tables(TITLE, "Condensed phase thermochemistry data", use_calories)
+
+    st.markdown("### <u>Thermodynamic Properties Table</u>", unsafe_allow_html=True)
+    st.caption("Experimental values for different phases.")
+    st.dataframe(condensed_tables["properties"], hide_index=True)
+    st.divider()
+    option2 = st.selectbox(
+        "Choose the condensed phase:",
+        [
+            "Liquid phase",
+            "Solid Phase"
+        ]
+        )
+    if option2=="Liquid phase":
+        st.markdown("### <u>Liquid Phase Heat Capacity (Shomate Equation)</u>", unsafe_allow_html=True)
+        st.latex(r"""
+            C_p^\circ = A + B*t + C*t^2 + D*t^3 + \frac{E}{t^2}
+        """)
+        st.latex(r"""
+            H^\circ - H^\circ_{298.15} = A*t + \frac{B*t^2}{2} + \frac{C*t^3}{3} + \frac{D*t^4}{4} - \frac{E}{t} + F - H
+        """)
+        st.latex(r"""
+            S^\circ = A\ln(t) + B*t + \frac{C*t^2}{2} + \frac{D*t^3}{3} - \frac{E}{(2*t^2)} + G
+        """)
+
+        st.write("#### Explanation of Variables")
+        st.write("- $C_p^\circ$ = heat capacity (J/mol*K)")
+        st.write("- $H^\circ$ = standard enthalpy (kJ/mol)")
+        st.write("- $S^\circ$ = standard entropy (J/mol*K)")
+        st.write("- $t$ = temperature (K) / 1000")
+        st.divider()
+        df_constants = condensed_tables["liquid_shomate"]
+        st.write("#### Shomate Equation Constants")
+        st.dataframe(df_constants, hide_index=True)
+        st.divider()
+
+        liquid_shomate = PiecewiseShomate(parse_range(df_constants["Value"][0]), df_constants["Value"].iloc[1:9], name="Liquid")
+        st.markdown("### <u>Calculate Properties Based on Temperature</u>", unsafe_allow_html=True)
+        _shomate_calculator(liquid_shomate, use_calories)
+
+        st.markdown("### <u>Variation of Cₚ with Temperature</u>", unsafe_allow_html=True)
+        _cp_chart(liquid_shomate, use_calories, "liquid_curve")
+        st.divider()
+        bulk_calculator(liquid_shomate, units=energy_units, key="liquid")
+        inverse_calculator(liquid_shomate, units=energy_units, key="liquid")
+        shomate_uncertainty(liquid_shomate, energy_units, _entropy_sigma("P(l)", use_calories), key="liquid")
+
+    if option2 == "Solid Phase":
+        st.markdown("### <u>Solid Phase Heat Capacity (Shomate Equation)</u>", unsafe_allow_html=True)
+        st.latex(r"""
+            C_p^\circ = A + B*t + C*t^2 + D*t^3 + \frac{E}{t^2}
+        """)
+        st.latex(r"""
+            H^\circ - H^\circ_{298.15} = A*t + \frac{B*t^2}{2} + \frac{C*t^3}{3} + \frac{D*t^4}{4} - \frac{E}{t} + F - H
+        """)
+        st.latex(r"""
+            S^\circ = A\ln(t) + B*t + \frac{C*t^2}{2} + \frac{D*t^3}{3} - \frac{E}{(2*t^2)} + G
+        """)
+
+        st.write("#### Explanation of Variables")
+        st.write("- $C_p^\circ$ = heat capacity (J/mol*K)")
+        st.write("- $H^\circ$ = standard enthalpy (kJ/mol)")
+        st.write("- $S^\circ$ = standard entropy (J/mol*K)")
+        st.write("- $t$ = temperature (K) / 1000")
+        st.divider()
+        df_solid_constants = condensed_tables["solid_shomate"]
+        solid_engine = ShomateEngine.from_columns(df_solid_constants, names=df_solid_constants["Phase"])
+
+        # Display constants in Streamlit
+        st.write("#### Shomate Equation Constants for Solid Phases")
+        st.dataframe(df_solid_constants, hide_index=True)
+        st.divider()
+        st.markdown("### <u>Calculate Properties Based on Temperature</u>", unsafe_allow_html=True)
+        _solid_calculator(solid_engine, use_calories)
+
+        _solid_bulk(solid_engine, df_solid_constants["Temperature Range (K)"], energy_units, use_calories)
+        st.divider()
+
+        # Variation of Cp with Temperature for all phases
+        st.markdown("### <u>Variation of Cₚ with Temperature for All Phases</u>", unsafe_allow_html=True)
+        _solid_chart(solid_engine, df_solid_constants["Temperature Range (K)"], energy_units)
+        st.divider()
+
+    st.markdown("### <u>Phase Stability</u>", unsafe_allow_html=True)
+    st.caption(
+        "The stable phase is the one with the lowest Gibbs energy G = H° - T S° (at 1 bar). "
+        "Phases only compete within the temperature range of their Shomate constants."
+    )
+    _phase_stability(use_calories)
+
+
+@st.fragment
+def _solid_calculator(solid_engine, use_calories):
+    temp = st.number_input("Enter Temperature (K) between 298 and 317.3:", min_value=298.0, max_value=317.3, step=0.1)
+
+    if temp:
+        # One call evaluates every phase at once
+        metrics.calculation("shomate_solid")
+        Cp, H_val, S_val = solid_engine.evaluate(temp)
+
+        # Create DataFrame for calculated values
+        df_computed = pd.DataFrame({
+            "Phase": solid_engine.names,
+            f"Heat Capacity ({'cal/mol*K' if use_calories else 'J/mol*K'})": Cp,
+            f"Enthalpy ({'kCal/mol' if use_calories else 'kJ/mol'})": H_val,
+            f"Entropy ({'cal/mol*K' if use_calories else 'J/mol*K'})": S_val
+        })
+        st.dataframe(df_computed, hide_index=True)
+        st.divider()
+
+
+@st.fragment
+def _solid_bulk(solid_engine, temperature_ranges, energy_units, use_calories):
+    bulk_phase = st.selectbox("Phase for bulk calculation:", solid_engine.names)
+    bulk_row = solid_engine.names.index(bulk_phase)
+    solid_range = parse_range(temperature_ranges[bulk_row])
+    bulk_shomate = PiecewiseShomate(solid_range, solid_engine.coefficients[bulk_row], name=bulk_phase)
+    bulk_calculator(bulk_shomate, units=energy_units, key="solid")
+    inverse_calculator(bulk_shomate, units=energy_units, key="solid")
+    shomate_uncertainty(bulk_shomate, energy_units, _entropy_sigma(f"P(s, {bulk_phase})", use_calories), key="solid")
+
+
+def _entropy_sigma(label, use_calories):
+    """S° uncertainty of a species from the data tables, in the displayed unit."""
+    sigma_S = dataset_sigmas().get(label, (0.0, 0.0))[1]
+    return sigma_S * CALORIE_FACTOR if use_calories else sigma_S
+
+
+@st.fragment
+def _solid_chart(solid_engine, temperature_ranges, energy_units):
+    plot_phases = st.multiselect("Phases to plot:", solid_engine.names, default=solid_engine.names)
+    if plot_phases:
+        rows = [solid_engine.names.index(phase) for phase in plot_phases]
+        ranges = [parse_range(temperature_ranges[row]) for row in rows]
+        png = solid_cp_png(
+            tuple(plot_phases),
+            tuple(map(tuple, solid_engine.coefficients[rows])),
+            min(low for low, _ in ranges),
+            max(high for _, high in ranges),
+            100,
+            energy_units[0],
+        )
+        st.image(png, use_container_width=True)
+
+
+@st.fragment
+def _phase_stability(use_calories):
+    stability = condensed_phases()
+    low, high = stability.temperature_range
+    col1, col2 = st.columns(2)
+    t_min = col1.number_input("From (K):", min_value=low, max_value=high, value=low, step=1.0, key="stability_min")
+    t_max = col2.number_input("To (K):", min_value=low, max_value=high, value=high, step=1.0, key="stability_max")
+    if t_max <= t_min:
+        st.warning("The upper temperature must be above the lower one.")
+        return
+
+    metrics.calculation("phase_stability")
+    energy_unit, energy_factor = ("kcal/mol", CALORIE_FACTOR) if use_calories else ("kJ/mol", 1.0)
+    st.image(phase_stability_png(t_min, t_max, 1000, energy_unit, energy_factor), use_container_width=True)
+    transitions = stability.transitions(t_min, t_max)
+    if transitions:
+        st.dataframe(
+            pd.DataFrame({
+                "Temperature (K)": [transition["temperature"] for transition in transitions],
+                "From": [transition["from"] or "-" for transition in transitions],
+                "To": [transition["to"] or "-" for transition in transitions],
+                "Found by": [transition["kind"] for transition in transitions],
+            }),
+            hide_index=True,
+        )
+    else:
+        st.write("No phase change in this temperature range.")
+
+    with st.expander("Stable phase for a list of temperatures"):
+        text = st.text_area("Temperatures (K), separated by commas, spaces or new lines:", key="stability_text")
+        upload = st.file_uploader("...or a CSV with the temperatures in the first column", type=["csv", "txt"], key="stability_upload")
+        if upload is not None:
+            temperatures = np.concatenate(list(bulk.csv_chunks(upload)) or [np.empty(0)])
+        else:
+            temperatures = parse_numbers(text)
+        if not len(temperatures):
+            return
+        stable = stability.stable_phase(temperatures)
+        G = stability.gibbs(temperatures)
+        names = np.array([*stability.names, "-"], dtype=object)
+        df = pd.DataFrame({
+            "Temperature (K)": temperatures,
+            "Stable Phase": names[stable],
+            f"G ({energy_unit})": np.where(stable >= 0, G[stable, np.arange(len(temperatures))], np.nan) * energy_factor,
+        })
+        if (stable < 0).any():
+            st.warning(f"{int((stable < 0).sum()):,} temperature(s) fall outside {low} - {high} K.")
+        st.dataframe(df, hide_index=True)
+        st.download_button("Download CSV", df.to_csv(index=False), file_name="phase_stability.csv", mime="text/csv", key="stability_download")
+
+
+def _phase_change():
+    st.write("### Phase change data")
+    phase_change_tables = tables(TITLE, "Phase change data")
+    df = phase_change_tables["properties"]
+    st.dataframe(df, hide_index=True)
+    st.divider()
+    st.markdown("### <u>Antoine Equation for Vapor Pressure</u>", unsafe_allow_html=True)
+    st.latex(r"\log_{10}(P) = A - \frac{B}{T + C}")
+    st.write("Where:")
+    st.latex(r"P = \text{vapor pressure (atm)}")
+    st.latex(r"T = \text{temperature (K)}")
+    df = phase_change_tables["antoine"]
+    A, B, C = df.loc[0, ["A", "B", "C"]]
+    antoine = AntoineEquation(A, B, C, *parse_range(df.loc[0, "Temperature (K)"]))
+    st.write("### Antoine Equation Constants Table")
+    st.dataframe(df, hide_index=True)
+    antoine_choices = antoine_sets()
+    if len(antoine_choices) > 1:
+        choice = st.selectbox("Coefficient set:", list(antoine_choices), key="antoine_set")
+        if choice != BUILT_IN_ANTOINE:
+            antoine = antoine_choices[choice]
+            A, B, C = antoine.A, antoine.B, antoine.C
+            st.caption(f"Fitted constants: A = {A:.6g}, B = {B:.6g}, C = {C:.6g} ({antoine.t_min:g} - {antoine.t_max:g} K)")
+    _antoine_calculator(antoine)
+    st.divider()
+    st.markdown("### <u> Vapor Pressure vs. Temperature Graph </u>", unsafe_allow_html=True)
+    _vapor_pressure_chart(float(A), float(B), float(C), antoine.temperature_range)
+
+
+@st.fragment
+def _antoine_calculator(antoine):
+    option = st.segmented_control("What do you want to calculate?", ["P from T", "T from P"])
+    low, high = antoine.temperature_range
+
+    if option == "P from T":
+        T = st.number_input("Enter Temperature (K):", min_value=low, max_value=high, step=0.1)
+
+        if T:
+            metrics.calculation("antoine")
+            P = antoine.pressure(T)
+            st.write(f"**Vapor Pressure (P):** {P:.5f} atm")
+        antoine_batch(antoine, option, key="antoine_p")
+
+    elif option == "T from P":
+        P = st.number_input("Enter Vapor Pressure (atm):", min_value=0.001, step=0.001)
+
+        if P > 0:
+            metrics.calculation("antoine")
+            T = antoine.temperature(P)
+            if not np.isnan(T):
+                st.write(f"**Temperature (T):** {T:.2f} K")
+            else:
+                st.write(f"⚠️ Temperature is out of the valid range ({low} - {high} K).")
+        antoine_batch(antoine, option, key="antoine_t")
+
+
+@st.fragment
+def _vapor_pressure_chart(A, B, C, temperature_range):
+    points, method = curve_resolution("antoine_curve")
+    curve = curves.antoine_curve(A, B, C, *temperature_range, points, method)
+    st.markdown("**X-axis:** Temperature (K)  |  **Y-axis:** Vapor Pressure (atm)")
+    curve_chart(curve)
+    antoine_uncertainty(AntoineEquation(A, B, C, *temperature_range), trc_uncertainty("T(boil)"), key="antoine")
+
+
+@st.fragment
+def _reactions():
+    use_calories = st.checkbox("Show values in calorie-based units")
+    st.write("### Individual Reactions:")
+    reactions = [
+        "HP⁻ + P₂ → HP⁻",
+        "P₂H⁻ + P → P₂H⁻",
+        "OP⁻ + P₂ → OP⁻",
+        "P₂O⁻ + P → P₂O⁻"
+    ]
+    for rxn in reactions:
+        st.latex(rxn)
+    st.divider()
+    df = tables(TITLE, "Reaction thermochemistry data", use_calories)["reactions"]
+    st.dataframe(df)
+    st.divider()
+
+    st.markdown("### <u>Reaction Gibbs Energy and Equilibrium Constants</u>", unsafe_allow_html=True)
+    st.latex(r"\Delta_r G^\circ(T) = \Delta_r H^\circ(T) - T\,\Delta_r S^\circ(T), \qquad \log_{10} K = -\frac{\Delta_r G^\circ}{R\,T \ln 10}")
+    _reaction_screening(use_calories)
+
+
+EXAMPLE_REACTIONS = pd.DataFrame({
+    "Reaction": ["White → Black", "White → Black", "White → Red V", "White → Red V"],
+    "Species": ["P(s, White Phase)", "P(s, Black Phase)", "P(s, White Phase)", "P(s, Red, V Phase)"],
+    "ν": [-1.0, 1.0, -1.0, 1.0],
+})
+
+
+@st.fragment
+def _reaction_screening(use_calories):
+    library = species_library()
+    st.caption("One row per species; ν is negative for reactants and positive for products. Rows with the same reaction name form one reaction.")
+    rows = st.data_editor(
+        EXAMPLE_REACTIONS,
+        num_rows="dynamic",
+        hide_index=True,
+        column_config={
+            "Species": st.column_config.SelectboxColumn("Species", options=list(library), required=True),
+            "ν": st.column_config.NumberColumn("ν", step=0.5, required=True),
+        },
+        key="reaction_rows",
+    )
+    rows = rows.dropna()
+    if rows.empty:
+        return
+    equations = {}
+    for name, species, nu in rows.itertuples(index=False):
+        equations.setdefault(name, {})
+        equations[name][species] = equations[name].get(species, 0.0) + nu
+    reaction_set = ReactionSet(equations, library)
+
+    col1, col2, col3 = st.columns(3)
+    t_min = col1.number_input("Min temperature (K)", min_value=1.0, value=298.0, key="reaction_t_min")
+    t_max = col2.number_input("Max temperature (K)", min_value=1.0, value=6000.0, key="reaction_t_max")
+    points = col3.number_input("Temperature points", min_value=2, max_value=100_000, value=500, key="reaction_points")
+    if t_min >= t_max:
+        st.warning("The maximum temperature must be larger than the minimum.")
+        return
+    low, high = reaction_set.temperature_range
+    if low < high:
+        st.caption(f"All species have coefficients between {low:g} and {high:g} K; results elsewhere are left empty.")
+    else:
+        st.caption("The selected species share no temperature range, so some reactions have no results.")
+
+    metrics.calculation("reactions")
+    temperatures = np.linspace(t_min, t_max, points)
+    results = reaction_set.evaluate(temperatures)
+    factor = CALORIE_FACTOR if use_calories else 1.0
+    units = {
+        "ΔrH": "kcal/mol" if use_calories else "kJ/mol",
+        "ΔrS": "cal/mol*K" if use_calories else "J/mol*K",
+        "ΔrG": "kcal/mol" if use_calories else "kJ/mol",
+        "log K": "",
+    }
+    quantity = st.radio("Show", list(units), index=2, horizontal=True, key="reaction_quantity")
+    values = results[quantity] * (1.0 if quantity == "log K" else factor)
+    chart = pd.DataFrame(values.T, columns=reaction_set.names)
+    chart.insert(0, "Temperature (K)", temperatures)
+    st.markdown(f"**X-axis:** Temperature (K)  |  **Y-axis:** {quantity} {units[quantity]}")
+    st.line_chart(chart.set_index("Temperature (K)"), use_container_width=True)
+
+    export = pd.DataFrame({
+        "Reaction": np.repeat(reaction_set.names, len(temperatures)),
+        "Temperature (K)": np.tile(temperatures, len(reaction_set.names)),
+    })
+    for key, unit in units.items():
+        scale = 1.0 if key == "log K" else factor
+        export[f"{key} ({unit})" if unit else key] = results[key].ravel() * scale
+    st.download_button("Download CSV", export.to_csv(index=False), file_name="reactions.csv", mime="text/csv", key="reaction_download")
+
+    with st.expander("Uncertainty (Monte Carlo)"):
+        sigmas = {label: dataset_sigmas()[label] for label in reaction_set.species if label in dataset_sigmas()}
+        if not sigmas:
+            st.caption("None of these species has a ± value in the data tables.")
+            return
+        st.caption("Sampled from the data tables: " + "; ".join(
+            f"{label}: σΔfH° = {sigma_H * factor:.4g} {units['ΔrH']}, σS° = {sigma_S * factor:.4g} {units['ΔrS']}"
+            for label, (sigma_H, sigma_S) in sigmas.items()
+        ))
+        reaction = st.selectbox("Reaction:", reaction_set.names, key="reaction_band_name")
+        draws = draw_count("reaction")
+        if not st.checkbox("Compute confidence bands", key="reaction_bands"):
+            return
+        metrics.calculation("reaction_uncertainty")
+        frame = curves.reaction_bands(equations, t_min, t_max, min(points, 50), draws, use_calories)
+        st.markdown(f"**X-axis:** Temperature (K)  |  **Y-axis:** {quantity} {units[quantity]}, 95% band")
+        band_chart(frame, f"{reaction}: {quantity}", "reaction")
+
+
+@st.fragment
+def _ion_energetics():
+    use_calories = st.checkbox("Show values in calorie-based units")
+    energetics_tables = tables(TITLE, "Gas phase ion energetics data", use_calories)
+
+    #table 1
+    df1 = energetics_tables["energetics"]
+    st.table(df1)
+    st.divider()
+    #table 2
+    st.write("### Electron Affinity Determinations:")
+    df2 = energetics_tables["electron_affinity"]
+    st.table(df2)
+    st.divider()
+
+    #table 3
+    st.write("### Ionization Energy Determinations:")
+    df3 = energetics_tables["ionization_energy"]
+    st.table(df3) 
+    st.divider()       
+
+
+@st.fragment
+def _ion_clustering():
+    use_calories = st.checkbox("Show values in calorie-based units")
+    clustering_tables = tables(TITLE, "Ion clustering data", use_calories)
+    st.write("### Clustering Reactions:")
+
+    st.latex(r"( \text{HP}^- \cdot P_2 ) + P \rightarrow \text{HP}^-")
+    df1 = clustering_tables["hp_cluster"]
+    st.table(df1)
+    st.divider()
+    st.latex(r"( \text{OP}^- \cdot P_2 ) + P \rightarrow \text{OP}^-")
+    df2 = clustering_tables["op_cluster"]
+    st.table(df2)
+
+
+FIT_MODELS = {"Antoine: T (K), vapor pressure": "antoine", "Shomate: T (K), Cp (J/mol*K)": "shomate"}
+
+
+@st.fragment
+def _coefficient_fitting():
+    st.markdown("### <u>Fit Coefficients to Measurements</u>", unsafe_allow_html=True)
+    st.caption(
+        "Upload a CSV with temperatures in the first column and the measured values in the second. "
+        "Non-numeric rows such as a header are skipped."
+    )
+    model = FIT_MODELS[st.radio("Data:", list(FIT_MODELS), horizontal=True, key="fit_model")]
+    upload = st.file_uploader("Measurements", type=["csv", "txt"], key="fit_upload")
+    if upload is None:
+        return
+    temperatures, measured = bulk.csv_pairs(upload)
+    if not len(temperatures):
+        st.warning("The file has no rows with two numeric columns.")
+        return
+    st.caption(f"{len(temperatures):,} points between {temperatures.min():g} and {temperatures.max():g} K.")
+
+    if model == "shomate":
+        breakpoints_text = st.text_input("Inner segment breakpoints (K), e.g. 2200:", key="fit_breakpoints")
+        col1, col2 = st.columns(2)
+        formation_enthalpy = col1.number_input("ΔfH°298 (kJ/mol)", value=0.0, key="fit_enthalpy")
+        entropy = col2.number_input("S°298 (J/mol*K)", value=0.0, key="fit_entropy")
+        inner = sorted(value for value in parse_numbers(breakpoints_text) if temperatures.min() < value < temperatures.max())
+        breakpoints = [temperatures.min(), *inner, temperatures.max()]
+
+    if st.button("Fit", key="fit_run"):
+        metrics.calculation(f"fit_{model}")
+        try:
+            with st.spinner("Fitting..."):
+                if model == "antoine":
+                    st.session_state["fit_result"] = (model, fit_antoine(temperatures, measured))
+                else:
+                    result = fit_shomate(temperatures, measured, breakpoints, formation_enthalpy, entropy)
+                    st.session_state["fit_result"] = (model, result)
+        except ValueError as error:
+            st.error(str(error))
+            return
+
+    stored = st.session_state.get("fit_result")
+    if not stored or stored[0] != model:
+        return
+    _, result = stored
+    if not result.success:
+        st.warning(f"The optimizer did not converge: {result.message}")
+    fitted = result.model
+    if model == "antoine":
+        st.dataframe(pd.DataFrame({"Constant": ["A", "B", "C"], "Value": [fitted.A, fitted.B, fitted.C]}), hide_index=True)
+        residual_label = "Residual (log₁₀ P)"
+    else:
+        constants = pd.DataFrame(fitted.coefficients, columns=list(COEFFICIENT_NAMES))
+        constants.insert(0, "Temperature Range (K)", [f"{low:g} - {high:g}" for low, high in zip(fitted.breakpoints[:-1], fitted.breakpoints[1:])])
+        st.dataframe(constants, hide_index=True)
+        residual_label = "Residual (J/mol*K)"
+    st.write(f"RMS residual: {result.rms:.4g}  |  Max |residual|: {result.max_abs:.4g}")
+
+    temperatures = result.temperatures
+    order = np.argsort(temperatures, kind="stable")
+    keep = order[downsample.minmax(temperatures[order], result.residuals[order])]
+    residuals = pd.DataFrame({"Temperature (K)": temperatures[keep], residual_label: result.residuals[keep]})
+    st.scatter_chart(residuals, x="Temperature (K)", y=residual_label, use_container_width=True)
+    st.download_button(
+        "Download residuals (CSV)",
+        pd.DataFrame({"Temperature (K)": temperatures, residual_label: result.residuals}).to_csv(index=False),
+        file_name=f"{model}_residuals.csv",
+        mime="text/csv",
+        key="fit_residuals_download",
+    )
+
+    label = st.text_input("Register as:", value="P (fitted)" if model == "antoine" else "P(fitted)", key="fit_label")
+    if st.button("Register", key="fit_register") and label:
+        if model == "antoine":
+            register_antoine(label, fitted)
+            st.success(f"{label} is now available in the vapor-pressure calculator.")
+        else:
+            register_species(label, fitted)
+            st.success(f"{label} is now available in the reaction screening.")
+
+
+SECTIONS = {
+    "Gas phase thermochemistry data": _gas_phase,
+    "Condensed phase thermochemistry data": _condensed_phase,
+    "Phase change data": _phase_change,
+    "Reaction thermochemistry data": _reactions,
+    "Gas phase ion energetics data": _ion_energetics,
+    "Ion clustering data": _ion_clustering,
+    "Coefficient fitting": _coefficient_fitting,
+}
+
+
+def render():
+    option = st.selectbox("Select an option:", list(SECTIONS))
+    metrics.record_option(option)
+    st.divider()
+
+    SECTIONS[option]()
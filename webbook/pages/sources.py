@@ -0,0 +1,17 @@
+"""Sources page."""
+
+import streamlit as st
+
+TITLE = "Sources"
+
+
+def render():
+    st.divider()
+    st.markdown("[NIST WebBook - Phosphorus Data](https://webbook.nist.gov/cgi/inchi?ID=C7723140&Units=SI&Mask=20)")
+    st.markdown("[NIST XPS Spectral Data](https://srdata.nist.gov/xps/SpectralByCompdDd/3164)")
+    st.markdown("[RSC Periodic Table - Phosphorus](https://periodic-table.rsc.org/element/15/phosphorus)")
+    st.markdown("[Lithium Iron Phosphate (LFP) Battery Market Report](https://www.globenewswire.com/news-release/2024/05/08/2877971/0/en/Lithium-Iron-Phosphate-Battery-Market-Surges-to-USD-51-5-Billion-by-2031-Propelled-by-19-4-CAGR-Verified-Market-Research.html)")
+    st.markdown("[Wikipedia - Applications of Phosphorus](https://en.wikipedia.org/wiki/Phosphorus#Other_applications)")
+    st.markdown("[NIH Fact Sheet on Phosphorus](https://ods.od.nih.gov/factsheets/Phosphorus-HealthProfessional/#:~:text=Phosphorus%2C%20an%20essential%20mineral%2C%20is,%2C%20and%20RNA%20%5B1%5D.)")
+    st.caption("..and more")
+    st.divider()
@@ -0,0 +1,180 @@
+"""Uses page."""
+
+import streamlit as st
+
+from webbook.assets import show_image
+
+TITLE = "Uses"
+
+
+def render():
+    st.divider()
+    show_image("images/uses.png")
+    st.divider()
+
+    st.header("1. Agriculture")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        show_image("images/fertilizer.jpg", "column")
+
+    with col2:
+        st.markdown("""
+        Phosphorus is a vital nutrient in agriculture, primarily used in fertilizers to enhance crop growth and soil fertility. 
+        It plays a crucial role in **energy transfer (ATP), root development, and flowering**. Phosphorus-based fertilizers such as 
+        **superphosphate, triple superphosphate (TSP), diammonium phosphate (DAP), monoammonium phosphate (MAP), and rock phosphate** 
+        are commonly used to improve yields. These fertilizers provide essential nutrients that support strong root systems, enhance 
+        flowering and seed production, and improve plant resistance to diseases and environmental stress. However, excessive use can 
+        lead to **soil imbalance and water pollution through eutrophication**. To ensure sustainable agriculture, farmers are encouraged 
+        to adopt **precision farming techniques and controlled-release fertilizers**, optimizing phosphorus use while maintaining 
+        long-term soil health.
+        """)
+
+    st.divider()
+
+    # Animal Feed Supplements Section
+    st.header("2. Animal Feed Supplements")
+    col1, col2 = st.columns(2)
+
+    with col2:
+        show_image("images/animal.jpg", "column")
+
+    with col1:
+        st.markdown("""
+        Phosphorus is a crucial mineral in animal nutrition, essential for **bone formation, energy metabolism, and overall growth**. 
+        It plays a key role in **DNA synthesis, enzyme activation, and maintaining acid-base balance** in livestock. To meet dietary 
+        requirements, phosphorus is often added to animal feed in the form of supplements such as **dicalcium phosphate (DCP) and 
+        monocalcium phosphate (MCP)**. These supplements enhance **skeletal strength, improve reproductive performance, and support 
+        muscle development** in poultry, cattle, and swine. However, excessive phosphorus intake can lead to **environmental concerns**, 
+        such as water pollution from animal waste runoff. Therefore, balanced supplementation and efficient phosphorus utilization 
+        strategies are essential to promote animal health while minimizing ecological impact.
+        """)
+
+    st.divider()
+
+    # Detergents and Cleaning Products Section
+    st.header("3. Detergents and Cleaning Products")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        show_image("images/detergenet.jpeg", "column")
+
+    with col2:
+        st.markdown("""
+        Phosphorus compounds, particularly **phosphates**, are widely used in **detergents and cleaning products** due to their 
+        ability to **soften water and enhance cleaning efficiency**. Phosphates help **break down grease, remove stains, and prevent 
+        dirt from redepositing** on clothes or surfaces. They are especially useful in laundry and dishwashing detergents. However, 
+        excessive phosphorus runoff from wastewater can lead to **eutrophication**, causing harmful algal blooms in water bodies. 
+        To address this, many regions have implemented **restrictions on phosphate-based detergents**, promoting the use of 
+        environmentally friendly alternatives.
+        """)
+
+    st.divider()
+
+    # Food and Drink Additives Section
+    st.header("4. Food and Drink Additives")
+    col1, col2 = st.columns(2)
+
+    with col2:
+        show_image("images/food.jpg", "column")
+
+    with col1:
+        st.markdown("""
+        Phosphorus is a key ingredient in many **food and drink additives**, where it serves as a **preservative, acidity regulator, 
+        and texture enhancer**. **Phosphates** are commonly added to processed meats, dairy products, and carbonated beverages to 
+        **maintain freshness, improve texture, and extend shelf life**. They also play a role in **enhancing the baking properties 
+        of flour and stabilizing emulsions in processed foods**. While phosphorus is essential for human health, excessive intake 
+        from processed foods has raised concerns about **potential health risks, such as kidney disease and cardiovascular issues**, 
+        prompting discussions on dietary balance.
+        """)
+
+    st.divider()
+
+    # Uses in Metal Production Section
+    st.header("5. Uses in Metal Production")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        show_image("images/metal.jpeg", "column")
+
+    with col2:
+        st.markdown("""
+        Phosphorus is used in **metal production**, particularly in the **steel and aluminum industries**, to improve mechanical 
+        properties. In steelmaking, **phosphorus is added to enhance strength, hardness, and corrosion resistance**, making it 
+        essential for manufacturing **automobile parts, structural components, and high-strength alloys**. However, excessive 
+        phosphorus in steel can lead to **brittleness**, so its concentration must be carefully controlled. Additionally, 
+        phosphorus-based chemicals are used in metal surface treatments, such as **phosphating**, to **prevent rust and improve 
+        paint adhesion** in industrial applications.
+        """)
+
+    st.divider()
+
+    # Water Treatment Section
+    st.header("6. Water Treatment")
+    col1, col2 = st.columns(2)
+
+    with col2:
+        show_image("images/water.jpeg", "column")
+
+    with col1:
+        st.markdown("""
+        Phosphorus compounds play a crucial role in **water treatment processes**, particularly in **corrosion control and 
+        wastewater management**. **Phosphates** are added to municipal water supplies to prevent **pipe corrosion and reduce 
+        lead contamination**. In wastewater treatment, phosphorus removal techniques are used to **minimize nutrient pollution** 
+        and prevent **eutrophication** in natural water bodies. While phosphorus is essential for life, controlling its levels 
+        in water systems is crucial for maintaining environmental balance and protecting aquatic ecosystems.
+        """)
+
+    st.divider()
+
+    # Specialized Fertilizers Section
+    st.header("7. Specialized Fertilizers")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        show_image("images/special.jpeg", "column")
+
+    with col2:
+        st.markdown("""
+        Besides conventional phosphorus fertilizers, **specialized fertilizers** are formulated for **specific crops, soil 
+        conditions, and precision agriculture techniques**. These include **slow-release phosphorus fertilizers, biofertilizers, 
+        and customized blends** tailored to optimize nutrient uptake and **minimize environmental impact**. Advances in 
+        fertilizer technology are helping farmers achieve **higher efficiency while reducing phosphorus runoff**, ensuring 
+        **sustainable agricultural practices**.
+        """)
+
+    st.divider()
+
+    # Toothpaste Section
+    st.header("8. Toothpaste")
+    col1, col2 = st.columns(2)
+
+    with col2:
+        show_image("images/toothpaste.jpeg", "column")
+
+    with col1:
+        st.markdown("""
+        Phosphorus compounds, particularly **calcium phosphate and dicalcium phosphate**, are key ingredients in **toothpaste**, 
+        where they help **strengthen enamel and prevent cavities**. These compounds act as **abrasives** that aid in the removal 
+        of plaque while **promoting remineralization** of teeth. Phosphates also help in maintaining the **pH balance** of 
+        toothpaste, ensuring effective cleaning without damaging the enamel.
+        """)
+
+    st.divider()
+
+    # Other Uses Section
+    st.header("9. Other Uses")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        show_image("images/fireworks.jpeg", "column")
+
+    with col2:
+        st.markdown("""
+        Phosphorus finds applications in **numerous other industries**, including **fireworks, matches, pharmaceuticals, 
+        and electronics**. **Red phosphorus** is commonly used in the production of **safety matches and flame retardants**, 
+        while **phosphorus compounds** are essential in making **lithium-ion batteries and LED lighting**. As research continues, 
+        new and innovative uses for phosphorus are emerging in modern technology and sustainable development.
+        """)
+
+    st.divider()
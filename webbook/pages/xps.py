@@ -0,0 +1,46 @@
+"""X-ray Photoelectron Spectroscopy Database page."""
+
+import streamlit as st
+
+from webbook import metrics
+from webbook.tables import tables
+from webbook.xps import load_index
+
+TITLE = "X-ray Photoelectron Spectroscopy Database"
+
+
+@st.fragment
+def _energy_search():
+    index = load_index()
+    st.write("### Search by Binding Energy")
+    col1, col2 = st.columns(2)
+    energy = col1.number_input("Binding energy (eV)", value=130.0, step=0.05, format="%.2f", key="xps_energy")
+    delta = col2.number_input("Window ±δ (eV)", min_value=0.0, value=1.0, step=0.05, format="%.2f", key="xps_delta")
+    compounds = st.multiselect("Compounds", list(index.compounds), default=list(index.compounds), key="xps_compounds")
+    if not compounds:
+        st.info("Select at least one compound.")
+        return
+
+    index = index.subset(compounds)
+    metrics.calculation("xps_search")
+    nearest = int(index.nearest(energy))
+    peak = index.frame([nearest], reference=energy).iloc[0]
+    st.write(
+        f"**Nearest peak:** {peak['Spectral Line']} of {peak['Compound']} at {peak['Energy (eV)']:.2f} eV "
+        f"(ΔE = {peak['ΔE (eV)']:+.2f} eV)"
+    )
+
+    matches = index.window(energy, delta)
+    st.caption(f"{len(matches):,} of {len(index):,} lines within ±{delta:g} eV of {energy:g} eV")
+    if len(matches):
+        st.dataframe(index.frame(matches, reference=energy), hide_index=True)
+
+
+def render():
+    option3 = ["White Phosphorus", "Red Phosphorus", "Black Phosphorus"]
+    selected_option3 = st.radio("Choose one:", option3)
+    metrics.record_option(selected_option3)
+    st.dataframe(tables(TITLE, selected_option3)["xps"])
+
+    st.divider()
+    _energy_search()
@@ -0,0 +1,119 @@
+"""Stable condensed phase versus temperature from Gibbs-energy crossings.
+
+Every phase gets G(T) = H°(T) - T S°(T) on the formation-enthalpy scale
+(see ``webbook.reactions.formation_scale``), so the phase with the lowest G
+is the stable one. Pressure is not taken into account. Phases only compete
+inside their coefficient ranges, and outside them G is NaN.
+
+Transitions are found in two steps. A coarse grid gives the brackets where
+the stable phase changes. Then every bracket is bisected at the same time
+on G_a - G_b, using array operations. When a phase's coefficient range
+simply ends inside a bracket (solid coefficients stop at 317.3 K, where the
+liquid set starts), the transition is reported at that range limit.
+"""
+
+import functools
+
+import numpy as np
+
+from webbook import datastore
+from webbook.reactions import formation_scale
+
+BISECTION_STEPS = 60
+
+
+class PhaseStability:
+    """Competing phases, given as ``{label: PiecewiseShomate}``."""
+
+    def __init__(self, phases):
+        self.names = list(phases)
+        self.shomates = [formation_scale(shomate) for shomate in phases.values()]
+
+    @property
+    def temperature_range(self):
+        return (
+            min(shomate.temperature_range[0] for shomate in self.shomates),
+            max(shomate.temperature_range[1] for shomate in self.shomates),
+        )
+
+    def gibbs(self, temperatures):
+        """G(T) in kJ/mol with shape (phases, len(temperatures)); NaN outside a phase's range."""
+        T = np.asarray(temperatures, dtype=float).reshape(-1)
+        G = np.empty((len(self.shomates), len(T)))
+        for row, shomate in enumerate(self.shomates):
+            _, H_val, S_val = shomate.evaluate(T)
+            G[row] = H_val - T * S_val / 1000.0
+        return G
+
+    def stable_phase(self, temperatures):
+        """Index of the lowest-G phase at each temperature (-1 where no phase has data)."""
+        G = self.gibbs(temperatures)
+        missing = np.isnan(G).all(axis=0)
+        index = np.argmin(np.where(np.isnan(G), np.inf, G), axis=0)
+        return np.where(missing, -1, index)
+
+    def _bisect(self, low, high, first, second):
+        """Roots of G_first - G_second inside [low, high] for all brackets at once."""
+        columns = np.arange(len(low))
+        f_low = self._difference(low, first, second, columns)
+        for _ in range(BISECTION_STEPS):
+            middle = 0.5 * (low + high)
+            f_middle = self._difference(middle, first, second, columns)
+            left = np.sign(f_middle) == np.sign(f_low)
+            low = np.where(left, middle, low)
+            f_low = np.where(left, f_middle, f_low)
+            high = np.where(left, high, middle)
+        return 0.5 * (low + high)
+
+    def _difference(self, temperatures, first, second, columns):
+        G = self.gibbs(temperatures)
+        return G[first, columns] - G[second, columns]
+
+    def transitions(self, t_min=None, t_max=None, points=4000):
+        """Phase changes in [t_min, t_max] as a list of dicts (temperature, from, to, kind)."""
+        low, high = self.temperature_range
+        t_min = low if t_min is None else t_min
+        t_max = high if t_max is None else t_max
+        grid = np.linspace(t_min, t_max, points)
+        stable = self.stable_phase(grid)
+        changes = np.flatnonzero(stable[1:] != stable[:-1])
+        if not len(changes):
+            return []
+
+        first, second = stable[changes], stable[changes + 1]
+        lower, upper = grid[changes], grid[changes + 1]
+        # A true crossing needs both phases defined on both sides of the bracket.
+        columns = np.arange(len(changes))
+        crossing = (first >= 0) & (second >= 0)
+        for G in (self.gibbs(lower), self.gibbs(upper)):
+            for phase in (first, second):
+                crossing &= ~np.isnan(G[np.maximum(phase, 0), columns])
+
+        temperatures = np.empty(len(changes))
+        if crossing.any():
+            temperatures[crossing] = self._bisect(lower[crossing], upper[crossing], first[crossing], second[crossing])
+        for k in np.flatnonzero(~crossing):
+            # The outgoing phase's range ends (or the incoming one's starts) inside the bracket.
+            edges = [self.shomates[first[k]].temperature_range[1]] if first[k] >= 0 else []
+            edges += [self.shomates[second[k]].temperature_range[0]] if second[k] >= 0 else []
+            inside = [edge for edge in edges if lower[k] <= edge <= upper[k]]
+            temperatures[k] = inside[0] if inside else 0.5 * (lower[k] + upper[k])
+
+        return [
+            {
+                "temperature": float(temperatures[k]),
+                "from": self.names[first[k]] if first[k] >= 0 else None,
+                "to": self.names[second[k]] if second[k] >= 0 else None,
+                "kind": "Gibbs crossing" if crossing[k] else "range limit",
+            }
+            for k in range(len(changes))
+        ]
+
+
+@functools.lru_cache(maxsize=1)
+def condensed_phases():
+    """Liquid and solid phases of phosphorus from the dataset."""
+    phases = {"Liquid": datastore.shomate("P", "liquid")}
+    for phase in datastore.select("shomate", species="P", state="solid")["phase"].to_pylist():
+        phases[phase] = datastore.shomate("P", "solid", phase)
+    return PhaseStability(phases)
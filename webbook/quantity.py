@@ -0,0 +1,151 @@
+"""Numeric quantity columns: values, uncertainties and units as arrays.
+
+Tabulated values such as "316.5 ± 1.0" are parsed once into a
+``QuantityColumn``. Unit conversion is then a single vectorized multiply
+over the whole column, and text is produced only when a table is displayed.
+"""
+
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+# Factor used throughout the web book for J -> cal and kJ -> kcal.
+CALORIE_FACTOR = 0.239006
+AVOGADRO_EV = 96485.33212  # J/mol per eV
+
+# unit -> (dimension, size of the unit in the dimension's SI unit)
+UNITS = {
+    "J/mol": ("molar energy", 1.0),
+    "kJ/mol": ("molar energy", 1000.0),
+    "cal/mol": ("molar energy", 1.0 / CALORIE_FACTOR),
+    "kcal/mol": ("molar energy", 1000.0 / CALORIE_FACTOR),
+    "eV": ("molar energy", AVOGADRO_EV),
+    "J/mol*K": ("molar entropy", 1.0),
+    "cal/mol*K": ("molar entropy", 1.0 / CALORIE_FACTOR),
+    "K": ("temperature", 1.0),
+}
+
+# Units not listed stay as they are in that system.
+UNIT_SYSTEMS = {
+    "SI": {"cal/mol": "J/mol", "kcal/mol": "kJ/mol", "cal/mol*K": "J/mol*K"},
+    "calorie": {"J/mol": "cal/mol", "kJ/mol": "kcal/mol", "J/mol*K": "cal/mol*K"},
+}
+
+CONVERTED_DECIMALS = 4
+
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_QUANTITY = re.compile(rf"^\s*({_NUMBER})\s*(?:±\s*({_NUMBER}))?\s*$")
+
+
+def conversion_factor(from_unit, to_unit):
+    """Multiplier taking a value in ``from_unit`` to ``to_unit``."""
+    if from_unit == to_unit:
+        return 1.0
+    try:
+        from_dimension, from_size = UNITS[from_unit]
+        to_dimension, to_size = UNITS[to_unit]
+    except KeyError as error:
+        raise ValueError(f"Unknown unit {error.args[0]!r}") from None
+    if from_dimension != to_dimension:
+        raise ValueError(f"Cannot convert {from_unit} ({from_dimension}) to {to_unit} ({to_dimension})")
+    return from_size / to_size
+
+
+def _decimals(number_text):
+    """Digits after the decimal point, and whether the text ends with a bare point ("550.")."""
+    mantissa, _, exponent = number_text.lower().partition("e")
+    fraction = mantissa.partition(".")[2]
+    decimals = max(0, len(fraction) - int(exponent or 0))
+    return decimals, mantissa.endswith(".") and not exponent
+
+
+def _format_number(value, decimals, trailing_point):
+    return f"{value:.{decimals}f}" + ("." if trailing_point else "")
+
+
+@dataclass(frozen=True)
+class QuantityColumn:
+    """A column of values with optional uncertainties and per-row units.
+
+    ``uncertainties`` is NaN where none was given. ``decimals`` and
+    ``trailing_point`` remember the source precision so unconverted values
+    display exactly as tabulated; converted values use
+    ``CONVERTED_DECIMALS``.
+    """
+
+    values: np.ndarray
+    uncertainties: np.ndarray
+    units: np.ndarray
+    decimals: np.ndarray
+    trailing_point: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, values, units, uncertainties=None, decimals=CONVERTED_DECIMALS):
+        values = np.asarray(values, dtype=float)
+        n = len(values)
+        if uncertainties is None:
+            uncertainties = np.full(n, np.nan)
+        return cls(
+            values=values,
+            uncertainties=np.asarray(uncertainties, dtype=float),
+            units=np.broadcast_to(np.asarray(units, dtype=object), (n,)).copy(),
+            decimals=np.broadcast_to(np.asarray(decimals, dtype=int), (n,)).copy(),
+            trailing_point=np.zeros(n, dtype=bool),
+        )
+
+    @classmethod
+    def parse(cls, texts, units):
+        """Parses strings like "316.5 ± 1.0", "550." or "325. ± 35.".
+
+        Raises ValueError naming the first entry that is not a number.
+        """
+        values, uncertainties, decimals, points = [], [], [], []
+        for text in texts:
+            match = _QUANTITY.match(str(text))
+            if not match:
+                raise ValueError(f"Cannot parse quantity {text!r}")
+            value_text, uncertainty_text = match.groups()
+            values.append(float(value_text))
+            uncertainties.append(float(uncertainty_text) if uncertainty_text else np.nan)
+            # Uncertainty precision follows the value, as in the source tables.
+            value_decimals, point = _decimals(value_text)
+            if uncertainty_text:
+                value_decimals = max(value_decimals, _decimals(uncertainty_text)[0])
+            decimals.append(value_decimals)
+            points.append(point)
+        column = cls.from_arrays(values, units, uncertainties)
+        return cls(column.values, column.uncertainties, column.units, np.array(decimals, dtype=int), np.array(points, dtype=bool))
+
+    def __len__(self):
+        return len(self.values)
+
+    def to(self, units):
+        """Converts every row to ``units`` (one unit or one per row)."""
+        targets = np.broadcast_to(np.asarray(units, dtype=object), self.units.shape)
+        pairs = np.char.add(self.units.astype(str), np.char.add("->", targets.astype(str)))
+        unique_pairs, inverse = np.unique(pairs, return_inverse=True)
+        factors = np.array([conversion_factor(*pair.split("->")) for pair in unique_pairs])[inverse]
+        unchanged = factors == 1.0
+        return QuantityColumn(
+            values=self.values * factors,
+            uncertainties=self.uncertainties * factors,
+            units=targets.copy(),
+            decimals=np.where(unchanged, self.decimals, CONVERTED_DECIMALS),
+            trailing_point=self.trailing_point & unchanged,
+        )
+
+    def to_system(self, system):
+        """Converts to the "SI" or "calorie" unit system."""
+        mapping = UNIT_SYSTEMS[system]
+        return self.to([mapping.get(unit, unit) for unit in self.units])
+
+    def format(self):
+        """Display strings, e.g. "75.6454 ± 0.2390"."""
+        texts = []
+        for value, uncertainty, decimals, point in zip(self.values, self.uncertainties, self.decimals, self.trailing_point):
+            text = _format_number(value, decimals, point)
+            if not np.isnan(uncertainty):
+                text += " ± " + _format_number(uncertainty, decimals, point)
+            texts.append(text)
+        return texts
@@ -0,0 +1,110 @@
+"""Reaction thermochemistry from per-species Shomate data.
+
+Each species contributes its standard enthalpy on the formation scale,
+H°(T) = ΔfH°298 + (H° - H°298) = A*t + B*t^2/2 + C*t^3/3 + D*t^4/4 - E/t + F
+(the Shomate set with H dropped), and its absolute entropy S°(T). For any
+number of reactions, with stoichiometric coefficients ν (negative for
+reactants), one matrix product per property gives
+
+    ΔrH(T) = ν · H°(T)      ΔrS(T) = ν · S°(T)
+    ΔrG(T) = ΔrH - T ΔrS    log10 K(T) = -ΔrG / (R T ln 10)
+
+for every reaction and temperature at once. A reaction is NaN wherever one
+of its species is outside its coefficient range.
+"""
+
+import functools
+import threading
+
+import numpy as np
+
+from webbook import datastore
+from webbook.shomate import PiecewiseShomate
+
+GAS_CONSTANT = 8.314462618  # J/(mol K)
+STATE_SYMBOLS = {"gas": "g", "liquid": "l", "solid": "s"}
+
+_lock = threading.Lock()
+_registered = {}
+
+
+def formation_scale(shomate):
+    """Copy of a piecewise set whose enthalpy is H°(T) rather than H° - H°298."""
+    coefficients = shomate.coefficients.copy()
+    coefficients[:, 7] = 0.0
+    return PiecewiseShomate(shomate.breakpoints, coefficients, name=shomate.name, out_of_range="nan")
+
+
+@functools.lru_cache(maxsize=1)
+def _dataset_species():
+    table = datastore.load("shomate")
+    keys = list(dict.fromkeys(zip(
+        table["species"].to_pylist(), table["state"].to_pylist(), table["phase"].to_pylist()
+    )))
+    library = {}
+    for species, state, phase in keys:
+        phases = {p for s, st_, p in keys if s == species and st_ == state}
+        symbol = STATE_SYMBOLS.get(state, state)
+        label = f"{species}({symbol})" if len(phases) == 1 else f"{species}({symbol}, {phase})"
+        library[label] = formation_scale(datastore.shomate(species, state, phase))
+    return library
+
+
+def register_species(label, shomate):
+    """Adds (or replaces) a species, e.g. a fitted Shomate set, for all sessions."""
+    with _lock:
+        _registered[label] = formation_scale(shomate)
+
+
+def species_library():
+    """Species label -> PiecewiseShomate on the formation-enthalpy scale."""
+    with _lock:
+        return {**_dataset_species(), **_registered}
+
+
+class ReactionSet:
+    """Many reactions over a shared species list, evaluated together.
+
+    ``reactions`` maps a reaction name to ``{species label: ν}`` with
+    negative ν for reactants and positive ν for products.
+    """
+
+    def __init__(self, reactions, library=None):
+        library = species_library() if library is None else library
+        self.names = list(reactions)
+        self.species = list(dict.fromkeys(label for equation in reactions.values() for label in equation))
+        unknown = [label for label in self.species if label not in library]
+        if unknown:
+            raise KeyError(f"No Shomate data for {', '.join(unknown)}")
+        self.shomates = [library[label] for label in self.species]
+        self.stoichiometry = np.zeros((len(self.names), len(self.species)))
+        for row, equation in enumerate(reactions.values()):
+            for label, nu in equation.items():
+                self.stoichiometry[row, self.species.index(label)] += nu
+
+    @property
+    def temperature_range(self):
+        """Temperatures where every species of every reaction has coefficients."""
+        return (
+            max(shomate.temperature_range[0] for shomate in self.shomates),
+            min(shomate.temperature_range[1] for shomate in self.shomates),
+        )
+
+    def evaluate(self, temperatures):
+        """Dict of (reactions x temperatures) arrays: ΔrH (kJ/mol), ΔrS (J/mol K), ΔrG (kJ/mol) and log10 K."""
+        T = np.asarray(temperatures, dtype=float).reshape(-1)
+        enthalpy = np.empty((len(self.species), len(T)))
+        entropy = np.empty_like(enthalpy)
+        for row, shomate in enumerate(self.shomates):
+            _, enthalpy[row], entropy[row] = shomate.evaluate(T)
+
+        # A reaction is invalid where any species it uses has no data.
+        missing = np.isnan(enthalpy)
+        invalid = (self.stoichiometry != 0).astype(float) @ missing.astype(float) > 0
+        dH = self.stoichiometry @ np.where(missing, 0.0, enthalpy)
+        dS = self.stoichiometry @ np.where(missing, 0.0, entropy)
+        dH[invalid] = np.nan
+        dS[invalid] = np.nan
+        dG = dH - T * dS / 1000.0
+        log_k = -dG * 1000.0 / (GAS_CONSTANT * T * np.log(10))
+        return {"ΔrH": dH, "ΔrS": dS, "ΔrG": dG, "log K": log_k}
@@ -0,0 +1,89 @@
+"""Page registry: loads page modules on demand and times every render.
+
+Each page lives in ``webbook/pages/<module>.py`` and exposes ``render()``.
+The module is imported the first time the page is selected, so a session
+that never opens "Other Data" never pays for numpy, pandas or the
+calculation engines. Render times are kept per page for every rerun;
+open the app with ``?report=pages`` to see them in the sidebar. They are
+also exported to Prometheus per page and sub-option (see webbook.metrics).
+"""
+
+import collections
+import importlib
+import threading
+import time
+
+import streamlit as st
+
+from webbook import metrics, startup
+
+# Sidebar order; values are module names under webbook.pages.
+PAGES = {
+    "Home": "home",
+    "About the Element": "about",
+    "Discovery & History": "discovery",
+    "X-ray Photoelectron Spectroscopy Database": "xps",
+    "Atomic Spectra Data": "atomic_spectra",
+    "Other Data": "other_data",
+    "Uses": "uses",
+    "Phosphorus in the Economy": "economy",
+    "Environment & Phosphorus": "environment",
+    "Future Prospects": "future",
+    "Sources": "sources",
+}
+
+TIMING_WINDOW = 1000
+
+_lock = threading.Lock()
+_timings = collections.defaultdict(lambda: collections.deque(maxlen=TIMING_WINDOW))
+
+
+def page_titles():
+    return list(PAGES)
+
+
+def load(title):
+    """Imports (once per process) and returns the module for a page."""
+    module_name = f"webbook.pages.{PAGES[title]}"
+    with startup.page_imports(title):
+        return importlib.import_module(module_name)
+
+
+def render(title):
+    """Renders a page and records how long the render took."""
+    module = load(title)
+    startup.begin_render(title)
+    metrics.begin_page()
+    start = time.perf_counter()
+    try:
+        module.render()
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            _timings[title].append(elapsed)
+        metrics.observe_page(title, elapsed)
+    startup.end_render(title)
+    return elapsed
+
+
+def timings():
+    """Render-time summary per page over the last ``TIMING_WINDOW`` renders."""
+    with _lock:
+        samples = {title: sorted(values) for title, values in _timings.items()}
+    rows = []
+    for title, values in samples.items():
+        rows.append({
+            "Page": title,
+            "Renders": len(values),
+            "Mean (ms)": 1000 * sum(values) / len(values),
+            "p95 (ms)": 1000 * values[min(len(values) - 1, int(0.95 * len(values)))],
+            "Max (ms)": 1000 * values[-1],
+        })
+    return sorted(rows, key=lambda row: row["Mean (ms)"], reverse=True)
+
+
+def render_report():
+    if st.query_params.get("report") != "pages":
+        return
+    with st.sidebar.expander("Page render times", expanded=True):
+        st.dataframe(timings(), hide_index=True)
@@ -0,0 +1,114 @@
+"""Saha ionization balance over temperature x electron-density grids.
+
+Stage populations follow the Saha equation
+
+    n(i+1) ne / n(i) = 2 U(i+1)/U(i) (2 pi m_e k T / h^2)^(3/2) exp(-chi_i / kT)
+
+with each partition function U approximated by the ground-level statistical
+weight 2J + 1 and no ionization-potential lowering. Working with
+log-populations relative to the neutral atom, every stage is a linear
+combination of ln T, 1/T and ln ne. A full grid is therefore a single
+broadcast over (stages, temperatures, densities), followed by a normalising
+softmax along the stage axis.
+"""
+
+import functools
+
+import numpy as np
+
+from webbook import datastore
+from webbook.lines import ion_stage
+
+BOLTZMANN_EV = 8.617333262e-5  # eV/K
+# (2 pi m_e k / h^2)^(3/2) in cm^-3 K^-3/2
+SAHA_CONSTANT = (2 * np.pi * 9.1093837015e-31 * 1.380649e-23 / 6.62607015e-34 ** 2) ** 1.5 * 1e-6
+# The stage after the last tabulated ion (P XV, hydrogen-like 1s 2S1/2) has g = 2.
+HYDROGENIC_WEIGHT = 2.0
+
+_SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+_NUMERALS = [(10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I")]
+
+
+def statistical_weight(level):
+    """2J + 1 for a ground-level term such as ``"⁴S°₃/₂"`` or ``"³P₀"``."""
+    tail = ""
+    for char in reversed(level):
+        if char not in "₀₁₂₃₄₅₆₇₈₉/":
+            break
+        tail = char + tail
+    numerator, _, denominator = tail.translate(_SUBSCRIPTS).partition("/")
+    if not numerator:
+        raise ValueError(f"No J value in level {level!r}")
+    return 2 * int(numerator) / int(denominator or 1) + 1
+
+
+def ion_label(element, stage):
+    """Spectroscopic label for a stage number, e.g. ("P", 15) -> "P XV"."""
+    numeral = ""
+    for value, digits in _NUMERALS:
+        while stage >= value:
+            numeral += digits
+            stage -= value
+    return f"{element} {numeral}"
+
+
+class SahaBalance:
+    """Ionization-stage fractions from ionization energies and ground-level weights."""
+
+    def __init__(self, energies_ev, weights, ions):
+        self.energies = np.asarray(energies_ev, dtype=float)
+        self.weights = np.asarray(weights, dtype=float)
+        self.ions = list(ions)
+        if not len(self.weights) == len(self.ions) == len(self.energies) + 1:
+            raise ValueError("Need one weight and label per stage and one energy per transition")
+        # ln n_j/n_0 = offset_j - cumulative_j / kT + j * (ln(C T^1.5) - ln ne)
+        ratios = np.log(2 * self.weights[1:] / self.weights[:-1])
+        self._offsets = np.concatenate([[0.0], np.cumsum(ratios)])
+        self._cumulative = np.concatenate([[0.0], np.cumsum(self.energies)])
+        self._charges = np.arange(len(self.ions), dtype=float)
+
+    @property
+    def charges(self):
+        return self._charges
+
+    def fractions(self, temperatures, densities):
+        """Stage fractions with shape (stages, len(temperatures), len(densities)).
+
+        ``temperatures`` are in K and ``densities`` (electron densities) in cm^-3.
+        """
+        temperatures = np.asarray(temperatures, dtype=float)
+        densities = np.asarray(densities, dtype=float)
+        if np.any(temperatures <= 0) or np.any(densities <= 0):
+            raise ValueError("Temperatures and electron densities must be positive")
+        beta = 1.0 / (BOLTZMANN_EV * temperatures)
+        log_thermal = np.log(SAHA_CONSTANT) + 1.5 * np.log(temperatures)
+        # (T, ne) term shared by every stage
+        drive = log_thermal[:, None] - np.log(densities)[None, :]
+
+        stages = self._charges[:, None, None]
+        log_pop = stages * drive[None]
+        log_pop -= (self._cumulative[:, None] * beta[None, :])[:, :, None]
+        log_pop += self._offsets[:, None, None]
+
+        log_pop -= log_pop.max(axis=0, keepdims=True)
+        np.exp(log_pop, out=log_pop)
+        log_pop /= log_pop.sum(axis=0, keepdims=True)
+        return log_pop
+
+    def mean_charge(self, fractions):
+        """Average ion charge (0 for neutral atoms) from stage fractions."""
+        return np.tensordot(self._charges, fractions, axes=1)
+
+
+@functools.lru_cache(maxsize=1)
+def load_balance():
+    """Saha balance for phosphorus built from the dataset's ionization energies."""
+    table = datastore.load("ionization_energies")
+    ions = table["ion"].to_pylist()
+    weights = [statistical_weight(level) for level in table["ground_level"].to_pylist()]
+    element = ions[-1].split()[0]
+    return SahaBalance(
+        datastore.numbers(table, "ionization_energy_ev"),
+        weights + [HYDROGENIC_WEIGHT],
+        ions + [ion_label(element, ion_stage(ions[-1]) + 1)],
+    )
@@ -0,0 +1,270 @@
+"""Vectorized Shomate equation evaluation.
+
+All three properties use the NIST form with t = T / 1000:
+
+    Cp°          = A + B*t + C*t^2 + D*t^3 + E/t^2
+    H° - H°298   = A*t + B*t^2/2 + C*t^3/3 + D*t^4/4 - E/t + F - H
+    S°           = A*ln(t) + B*t + C*t^2/2 + D*t^3/3 - E/(2*t^2) + G
+"""
+
+import re
+
+import numpy as np
+
+COEFFICIENT_NAMES = ("A", "B", "C", "D", "E", "F", "G", "H")
+
+
+def _basis(temperatures):
+    """Returns t = T/1000 flattened to 1-D together with the original shape."""
+    T = np.asarray(temperatures, dtype=float)
+    return T.reshape(-1) / 1000.0, T.shape
+
+
+class ShomateEngine:
+    """Evaluates Cp, H° - H°298 and S° for many phases over temperature arrays.
+
+    ``coefficients`` is a (phases x 8) array in A..H order. Every method
+    returns an array of shape ``(phases,) + np.shape(temperatures)``, so a
+    single call covers all phases and the whole temperature grid.
+    """
+
+    def __init__(self, coefficients, names=None):
+        coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+        if coefficients.shape[1] != len(COEFFICIENT_NAMES):
+            raise ValueError(f"Expected 8 Shomate coefficients per phase, got {coefficients.shape[1]}")
+        self.coefficients = coefficients
+        self.names = list(names) if names is not None else [str(i) for i in range(len(coefficients))]
+
+    @classmethod
+    def from_columns(cls, table, names=None):
+        """Builds an engine from a dict or DataFrame holding A..H columns."""
+        columns = [np.atleast_1d(np.asarray(table[key], dtype=float)) for key in COEFFICIENT_NAMES]
+        return cls(np.column_stack(columns), names=names)
+
+    def __len__(self):
+        return len(self.coefficients)
+
+    def _cp(self, t, t2, t3, inv_t2):
+        basis = np.vstack([np.ones_like(t), t, t2, t3, inv_t2])
+        return self.coefficients[:, :5] @ basis
+
+    def _enthalpy(self, t, t2, t3, inv_t2):
+        basis = np.vstack([t, t2 / 2, t3 / 3, t2 * t2 / 4, -t * inv_t2, np.ones_like(t)])
+        return self.coefficients[:, :6] @ basis - self.coefficients[:, 7:8]
+
+    def _entropy(self, t, t2, t3, inv_t2):
+        basis = np.vstack([np.log(t), t, t2 / 2, t3 / 3, -inv_t2 / 2])
+        return self.coefficients[:, :5] @ basis + self.coefficients[:, 6:7]
+
+    def _run(self, kernels, temperatures):
+        t, shape = _basis(temperatures)
+        t2 = t * t
+        powers = (t, t2, t2 * t, 1.0 / t2)
+        return tuple(kernel(*powers).reshape((len(self),) + shape) for kernel in kernels)
+
+    def cp(self, temperatures):
+        return self._run((self._cp,), temperatures)[0]
+
+    def enthalpy(self, temperatures):
+        return self._run((self._enthalpy,), temperatures)[0]
+
+    def entropy(self, temperatures):
+        return self._run((self._entropy,), temperatures)[0]
+
+    def evaluate(self, temperatures):
+        """Returns (Cp, H° - H°298, S°) for every phase, sharing the powers of t."""
+        return self._run((self._cp, self._enthalpy, self._entropy), temperatures)
+
+
+OUT_OF_RANGE_MODES = ("raise", "clip", "nan")
+NEWTON_STEPS = 60
+NEWTON_TOLERANCE = 1e-13
+
+
+def parse_range(text):
+    """Parses temperature ranges written as "298 to 317.3" or "1180.008 - 2200"."""
+    low, high = re.split(r"\s+(?:to|-)\s+", text.strip())
+    return float(low), float(high)
+
+
+class PiecewiseShomate:
+    """Shomate coefficients for one species/phase split into temperature segments.
+
+    ``breakpoints`` holds the sorted segment edges (one more than the number
+    of coefficient rows). Segments are closed on the right, so a temperature
+    equal to an inner breakpoint uses the lower segment, matching the NIST
+    tables (e.g. the gas phase switches sets above 2200 K).
+
+    ``out_of_range`` controls temperatures outside the outer edges:
+    ``"raise"`` raises ValueError, ``"clip"`` uses the nearest segment and
+    ``"nan"`` returns NaN for those points.
+    """
+
+    def __init__(self, breakpoints, coefficients, name=None, out_of_range="raise"):
+        self.breakpoints = np.asarray(breakpoints, dtype=float)
+        self.coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+        if self.breakpoints.ndim != 1 or len(self.breakpoints) != len(self.coefficients) + 1:
+            raise ValueError("Need exactly one more breakpoint than coefficient rows")
+        if np.any(np.diff(self.breakpoints) <= 0):
+            raise ValueError("Breakpoints must be strictly increasing")
+        if out_of_range not in OUT_OF_RANGE_MODES:
+            raise ValueError(f"out_of_range must be one of {OUT_OF_RANGE_MODES}")
+        self.name = name
+        self.out_of_range = out_of_range
+
+    @classmethod
+    def from_columns(cls, table, range_key="Temperature Range (K)", name=None, out_of_range="raise"):
+        """Builds a piecewise set from rows of contiguous ranges plus A..H columns."""
+        ranges = [parse_range(text) for text in table[range_key]]
+        breakpoints = [ranges[0][0]] + [high for _, high in ranges]
+        engine = ShomateEngine.from_columns(table)
+        return cls(breakpoints, engine.coefficients, name=name, out_of_range=out_of_range)
+
+    @property
+    def temperature_range(self):
+        return float(self.breakpoints[0]), float(self.breakpoints[-1])
+
+    def segment_index(self, temperatures, out_of_range=None):
+        """Maps every temperature to its segment with one searchsorted call.
+
+        Out-of-range points get index -1 in ``"nan"`` mode.
+        """
+        mode = out_of_range or self.out_of_range
+        T = np.asarray(temperatures, dtype=float)
+        idx = np.searchsorted(self.breakpoints[1:-1], T, side="left")
+        outside = (T < self.breakpoints[0]) | (T > self.breakpoints[-1]) | np.isnan(T)
+        if np.any(outside):
+            if mode == "raise":
+                low, high = self.temperature_range
+                raise ValueError(f"Temperature outside the valid range ({low} - {high} K)")
+            if mode == "nan":
+                idx = np.where(outside, -1, idx)
+        return idx
+
+    def _properties(self, T, idx):
+        """(Cp, H° - H°298, S°) at ``T`` using the coefficient rows ``idx``."""
+        A, B, C, D, E, F, G, H = np.moveaxis(self.coefficients[idx], -1, 0)
+        t = T / 1000.0
+        t2 = t * t
+        t3 = t2 * t
+        inv_t2 = 1.0 / t2
+        Cp = A + B * t + C * t2 + D * t3 + E * inv_t2
+        H_val = A * t + B * t2 / 2 + C * t3 / 3 + D * t2 * t2 / 4 - E * t * inv_t2 + F - H
+        S_val = A * np.log(t) + B * t + C * t2 / 2 + D * t3 / 3 - E * inv_t2 / 2 + G
+        return Cp, H_val, S_val
+
+    def evaluate(self, temperatures, out_of_range=None):
+        """Returns (Cp, H° - H°298, S°) with the shape of ``temperatures``."""
+        T = np.asarray(temperatures, dtype=float)
+        idx = self.segment_index(T, out_of_range)
+        Cp, H_val, S_val = self._properties(T, np.maximum(idx, 0))
+        if np.any(idx < 0):
+            missing = idx < 0
+            Cp, H_val, S_val = (np.where(missing, np.nan, values) for values in (Cp, H_val, S_val))
+        return Cp, H_val, S_val
+
+    def cp(self, temperatures, out_of_range=None):
+        return self.evaluate(temperatures, out_of_range)[0]
+
+    def enthalpy(self, temperatures, out_of_range=None):
+        return self.evaluate(temperatures, out_of_range)[1]
+
+    def entropy(self, temperatures, out_of_range=None):
+        return self.evaluate(temperatures, out_of_range)[2]
+
+    def _invert(self, targets, prop, out_of_range):
+        """Temperatures at which property ``prop`` (1 = H° - H°298, 2 = S°) equals ``targets``.
+
+        Both properties rise with T wherever Cp > 0. Each target is first
+        matched to the segment whose end value it does not exceed. Newton
+        steps on that segment's polynomial are then kept inside the segment's
+        shrinking bracket, and any step that leaves the bracket is replaced by
+        bisection. A target in a jump between two segments resolves to the
+        shared breakpoint.
+        """
+        mode = out_of_range or self.out_of_range
+        target = np.asarray(targets, dtype=float)
+        shape = target.shape
+        target = target.reshape(-1)
+
+        segments = np.arange(len(self.coefficients))
+        lows, highs = self.breakpoints[:-1], self.breakpoints[1:]
+        start_values = self._properties(lows, segments)[prop]
+        end_values = self._properties(highs, segments)[prop]
+        missing = np.isnan(target)
+        outside = (target < start_values[0]) | (target > end_values[-1]) | missing
+        if np.any(outside) and mode == "raise":
+            raise ValueError(f"Target outside the attainable range ({start_values[0]:.6g} - {end_values[-1]:.6g})")
+
+        idx = np.minimum(np.searchsorted(end_values, target, side="left"), len(segments) - 1)
+        goal = np.clip(target, start_values[idx], end_values[idx])
+        low, high = lows[idx].copy(), highs[idx].copy()
+        span = end_values[idx] - start_values[idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            T = low + (high - low) * np.where(span > 0, (goal - start_values[idx]) / span, 0.5)
+        # Targets beyond a segment's values (out of range, in a jump or NaN) sit on a segment
+        # edge from the start and take no part in the iteration.
+        pinned = missing | (goal != target)
+        T = np.where(pinned, np.where(target < start_values[idx], low, high), T)
+        for _ in range(NEWTON_STEPS):
+            properties = self._properties(T, idx)
+            residual = properties[prop] - goal
+            slope = properties[0] / 1000.0 if prop == 1 else properties[0] / T
+            low = np.where(residual < 0, T, low)
+            high = np.where(residual > 0, T, high)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step = T - residual / slope
+            step = np.where((step > low) & (step < high), step, 0.5 * (low + high))
+            step = np.where(pinned, T, step)
+            converged = np.abs(step - T) <= NEWTON_TOLERANCE * T
+            T = step
+            if np.all(converged):
+                break
+
+        if np.any(outside) and mode == "nan":
+            T = np.where(outside, np.nan, T)
+        elif np.any(missing):
+            T = np.where(missing, np.nan, T)
+        return T.reshape(shape)
+
+    def temperature_from_enthalpy(self, targets, out_of_range=None):
+        """Temperature at which H° - H°298 reaches each target (same units as the coefficients).
+
+        Targets beyond the enthalpy range follow ``out_of_range``, and in
+        ``"clip"`` mode they map to the nearest range edge.
+        """
+        return self._invert(targets, 1, out_of_range)
+
+    def temperature_from_entropy(self, targets, out_of_range=None):
+        """Temperature at which S° reaches each target; see ``temperature_from_enthalpy``."""
+        return self._invert(targets, 2, out_of_range)
+
+
+class ShomateTable:
+    """Named collection of piecewise coefficient sets, one per species/phase."""
+
+    def __init__(self, sets=()):
+        self._sets = {}
+        for piecewise in sets:
+            self.add(piecewise)
+
+    def add(self, piecewise):
+        if piecewise.name is None:
+            raise ValueError("Coefficient sets in a table need a name")
+        self._sets[piecewise.name] = piecewise
+        return piecewise
+
+    def __getitem__(self, name):
+        return self._sets[name]
+
+    def __contains__(self, name):
+        return name in self._sets
+
+    def __iter__(self):
+        return iter(self._sets)
+
+    def __len__(self):
+        return len(self._sets)
+
+    def evaluate(self, name, temperatures, out_of_range=None):
+        return self._sets[name].evaluate(temperatures, out_of_range)
@@ -0,0 +1,80 @@
+"""Cold-start timing report: import cost and first-render time of each page.
+
+The page registry imports each page module inside ``page_imports(page)`` and
+brackets its render with ``begin_render``/``end_render``.
+Only the first occurrence per process is kept, which is what a freshly
+restarted replica pays. Open the app with ``?report=startup`` to see the
+report in the sidebar.
+"""
+
+import contextlib
+import logging
+import sys
+import threading
+import time
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_imports = {}
+_first_render = {}
+_render_started = threading.local()
+
+
+def _process_age():
+    import psutil
+
+    return time.time() - psutil.Process().create_time()
+
+
+@contextlib.contextmanager
+def page_imports(page):
+    """Times the imports made in the block the first time ``page`` runs."""
+    before = len(sys.modules)
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    with _lock:
+        if page not in _imports:
+            _imports[page] = (elapsed, len(sys.modules) - before)
+            logger.info("%s: imports took %.3f s (%d new modules)", page, elapsed, len(sys.modules) - before)
+
+
+def begin_render(page):
+    _render_started.value = (page, time.perf_counter())
+
+
+def end_render(page):
+    started = getattr(_render_started, "value", None)
+    if started is None or started[0] != page:
+        return
+    elapsed = time.perf_counter() - started[1]
+    with _lock:
+        if page not in _first_render:
+            _first_render[page] = (elapsed, _process_age())
+            logger.info("%s: first render took %.3f s", page, elapsed)
+
+
+def report():
+    """One row per page rendered so far in this process."""
+    with _lock:
+        pages = list(dict.fromkeys(list(_first_render) + list(_imports)))
+        return [
+            {
+                "Page": page,
+                "Import time (s)": _imports.get(page, (None, None))[0],
+                "New modules": _imports.get(page, (None, None))[1],
+                "First render (s)": _first_render.get(page, (None, None))[0],
+                "Process age at first render (s)": _first_render.get(page, (None, None))[1],
+            }
+            for page in pages
+        ]
+
+
+def render_report():
+    if st.query_params.get("report") != "startup":
+        return
+    with st.sidebar.expander("Startup report", expanded=True):
+        st.dataframe(report(), hide_index=True)
@@ -0,0 +1,257 @@
+"""Display tables for the reference data, built once per process and unit system.
+
+Pages ask for their tables with ``tables(page, option, use_calories)``. The
+builders read the memory-mapped dataset in ``webbook.datastore`` and lay it
+out for display; the result is memoized with ``st.cache_data``, so every
+(page, sub-option, unit system) variant is converted once and then shared by
+all sessions.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from webbook import datastore, metrics
+from webbook.quantity import CALORIE_FACTOR, QuantityColumn
+from webbook.shomate import COEFFICIENT_NAMES
+
+J_to_cal = CALORIE_FACTOR
+kJ_to_kcal = CALORIE_FACTOR
+
+TABLE_BUILDERS = {}
+
+
+def _builder(page, option=None, unit_aware=False):
+    def register(func):
+        TABLE_BUILDERS[(page, option)] = (func, unit_aware)
+        return func
+    return register
+
+
+def tables(page, option=None, use_calories=False):
+    """Returns a dict of DataFrames for the page/sub-option in the requested units."""
+    _, unit_aware = TABLE_BUILDERS[(page, option)]
+    return _build(page, option, bool(use_calories) and unit_aware)
+
+
+@metrics.cached("tables", show_spinner=False)
+def _build(page, option, use_calories):
+    func, _ = TABLE_BUILDERS[(page, option)]
+    return func(use_calories)
+
+
+def _quantities(table, use_calories):
+    """Formatted values and units of a table's quantity columns in the requested unit system."""
+    column = datastore.quantities(table)
+    if use_calories:
+        column = column.to_system("calorie")
+    return column.format(), list(column.units)
+
+
+def _text(table, key):
+    return table[key].to_pylist()
+
+
+def _properties(section, use_calories, comments=False):
+    table = datastore.select("thermo_properties", section=section)
+    values, units = _quantities(table, use_calories)
+    data = {"Quantity": _text(table, "quantity"), "Value": values, "Units": units}
+    if comments:
+        data["Comment"] = _text(table, "comment")
+    return pd.DataFrame(data)
+
+
+def _shomate_constants(table, use_calories):
+    """Shomate coefficients by key, scaled to calories when requested."""
+    constants = {key: datastore.numbers(table, key) for key in COEFFICIENT_NAMES}
+    if use_calories:
+        for key in ["A", "B", "C", "D", "E", "G"]:
+            constants[key] = constants[key] * J_to_cal
+        for key in ["F", "H"]:
+            constants[key] = constants[key] * kJ_to_kcal
+    return constants
+
+
+def _shomate_frame(table, use_calories, label="Temperature Range (K)"):
+    data = {label: _text(table, "temperature_range")}
+    data.update(_shomate_constants(table, use_calories))
+    return pd.DataFrame(data)
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+
+
+@_builder("Other Data", "Gas phase thermochemistry data", unit_aware=True)
+def _gas_phase(use_calories):
+    return {
+        "properties": _properties("gas", use_calories),
+        "shomate": _shomate_frame(datastore.select("shomate", species="P", state="gas"), use_calories),
+    }
+
+
+@_builder("Other Data", "Condensed phase thermochemistry data", unit_aware=True)
+def _condensed_phase(use_calories):
+    liquid = datastore.select("shomate", species="P", state="liquid")
+    constants = _shomate_constants(liquid, use_calories)
+    liquid_constants = {
+        "Parameter": ["Temperature (K)", *COEFFICIENT_NAMES],
+        "Value": [liquid["temperature_range"][0].as_py()] + [float(constants[key][0]) for key in COEFFICIENT_NAMES],
+    }
+
+    solids = datastore.select("shomate", species="P", state="solid")
+    solid_phase_constants = pd.concat(
+        [pd.DataFrame({"Phase": _text(solids, "phase")}), _shomate_frame(solids, use_calories)], axis=1
+    )
+    return {
+        "properties": _properties("condensed", use_calories),
+        "liquid_shomate": pd.DataFrame(liquid_constants),
+        "solid_shomate": solid_phase_constants,
+    }
+
+
+@_builder("Other Data", "Phase change data")
+def _phase_change(use_calories):
+    antoine = datastore.select("antoine", species="P")
+    data = {"Temperature (K)": _text(antoine, "temperature_range")}
+    data.update({key: datastore.numbers(antoine, key) for key in ["A", "B", "C"]})
+    return {
+        "properties": _properties("phase change", use_calories, comments=True),
+        "antoine": pd.DataFrame(data),
+    }
+
+
+@_builder("Other Data", "Reaction thermochemistry data", unit_aware=True)
+def _reactions(use_calories):
+    enthalpy_key = "Enthalpy Change (ΔrH°) [Kcal/mol]" if use_calories else "Enthalpy Change (ΔrH°) [kJ/mol]"
+    table = datastore.select("reaction_enthalpies", kind="reaction")
+    enthalpy = datastore.quantities(table)
+    if use_calories:
+        enthalpy = enthalpy.to("kcal/mol")
+    data = {
+        "Reaction": _text(table, "reaction"),
+        enthalpy_key: enthalpy.format(),
+        "Reference": _text(table, "reference"),
+        "Comments": _text(table, "comment"),
+    }
+    return {"reactions": pd.DataFrame(data)}
+
+
+@_builder("Other Data", "Gas phase ion energetics data", unit_aware=True)
+def _ion_energetics(use_calories):
+    table = datastore.load("ion_energetics")
+    data1 = {
+        "Quantity": _text(table, "quantity"),
+        "Value": datastore.numbers(table, "value"),
+        "Units": _text(table, "unit"),
+        "Reference": _text(table, "reference"),
+    }
+
+    # IE stays in eV; only the molar energies switch unit system.
+    energies = QuantityColumn.from_arrays(data1["Value"], data1["Units"])
+    if use_calories:
+        converted = energies.to_system("calorie")
+        data1["Value"] = np.where(converted.units != energies.units, converted.values.round(4), energies.values)
+        data1["Units"] = list(converted.units)
+
+    affinities = datastore.load("electron_affinities")
+    determinations = datastore.load("ionization_energy_determinations")
+    return {
+        "energetics": pd.DataFrame(data1),
+        "electron_affinity": pd.DataFrame({
+            "EA (eV)": datastore.quantities(affinities).format(),
+            "Reference": _text(affinities, "reference"),
+        }),
+        "ionization_energy": pd.DataFrame({
+            "IE (eV)": datastore.quantities(determinations).format(),
+            "Reference": _text(determinations, "reference"),
+        }),
+    }
+
+
+def _cluster(reaction, use_calories):
+    table = datastore.select("reaction_enthalpies", kind="clustering", reaction=reaction)
+    values, units = _quantities(table, use_calories)
+    return pd.DataFrame({
+        "Quantity": _text(table, "quantity"),
+        "Value": values,
+        "Units": units,
+        "Reference": _text(table, "reference"),
+        "Comment": _text(table, "comment"),
+    })
+
+
+@_builder("Other Data", "Ion clustering data", unit_aware=True)
+def _ion_clustering(use_calories):
+    return {
+        "hp_cluster": _cluster("(HP⁻ · P₂) + P → HP⁻", use_calories),
+        "op_cluster": _cluster("(OP⁻ · P₂) + P → OP⁻", use_calories),
+    }
+
+
+# -----------------------------------------------------------------------------------------------------------------------------------
+
+
+@_builder("Atomic Spectra Data")
+def _atomic_spectra(use_calories):
+    table = datastore.load("line_holdings")
+    lines = pd.DataFrame({
+        "Ion": _text(table, "ion"),
+        "No. of lines": datastore.numbers(table, "lines"),
+        "Lines with transition probabilities": datastore.numbers(table, "lines_with_transition_probabilities"),
+        "Lines with level designations": datastore.numbers(table, "lines_with_level_designations"),
+    })
+    total_row = pd.DataFrame({
+        "Ion": ["**Total**"],
+        "No. of lines": [lines["No. of lines"].sum()],
+        "Lines with transition probabilities": [lines["Lines with transition probabilities"].sum()],
+        "Lines with level designations": [lines["Lines with level designations"].sum()]
+    })
+    lines = pd.concat([lines, total_row], ignore_index=True)
+
+    table = datastore.load("level_holdings")
+    levels = pd.DataFrame({"Ion": _text(table, "ion"), "No. of levels": datastore.numbers(table, "levels")})
+    total_row = pd.DataFrame({
+        "Ion": ["**Total for P:**"],
+        "No. of levels": [levels["No. of levels"].sum()]  # Sum levels dynamically
+    })
+    levels = pd.concat([levels, total_row], ignore_index=True)
+
+    table = datastore.load("ionization_energies")
+    data = {
+        "At. Num.": datastore.numbers(table, "atomic_number"),
+        "El. name": _text(table, "element"),
+        "Isoel. Seq.": _text(table, "isoelectronic_sequence"),
+        "Ground Shells": _text(table, "ground_shells"),
+        "Ground Level": _text(table, "ground_level"),
+        "Ionization Energy (eV)": datastore.numbers(table, "ionization_energy_ev"),
+        "Uncertainty (eV)": datastore.numbers(table, "uncertainty_ev"),
+        "References": _text(table, "references"),
+    }
+    return {
+        "line_holdings": lines.set_index("Ion"),
+        "level_holdings": levels.set_index("Ion"),
+        "ground_states": pd.DataFrame(data),
+    }
+
+
+def _xps(compound):
+    table = datastore.select("xps", compound=compound)
+    return {"xps": pd.DataFrame({
+        "Spectral Line": _text(table, "spectral_line"),
+        "Energy (eV)": datastore.numbers(table, "binding_energy_ev"),
+    })}
+
+
+@_builder("X-ray Photoelectron Spectroscopy Database", "Black Phosphorus")
+def _xps_black(use_calories):
+    return _xps("Black Phosphorus")
+
+
+@_builder("X-ray Photoelectron Spectroscopy Database", "Red Phosphorus")
+def _xps_red(use_calories):
+    return _xps("Red Phosphorus")
+
+
+@_builder("X-ray Photoelectron Spectroscopy Database", "White Phosphorus")
+def _xps_white(use_calories):
+    return _xps("White Phosphorus")
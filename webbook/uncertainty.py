@@ -0,0 +1,237 @@
+"""Monte Carlo uncertainty propagation through the property calculators.
+
+A model is a callable ``model(rng, draws)``. Each call samples its inputs
+and returns one array of outputs per draw, with shape ``(draws, *shape)``.
+``propagate`` calls the model in chunks and feeds every chunk to a
+``StreamingQuantiles`` estimator, so memory depends on the chunk size and
+not on the total number of draws. For every output point the estimator
+keeps a running mean and variance (merged chunk by chunk, as in Chan et
+al.), together with quantiles averaged over the chunks with weights equal
+to their valid draw counts. With chunks of thousands of draws, the bias of
+that average is far below the Monte Carlo error itself. Draws where a
+sampled temperature leaves the coefficient range are NaN and are skipped.
+
+The dataset's own uncertainties are the defaults:
+- the ± values on ΔfH° and S° (``dataset_sigmas``);
+- the TRC-assigned uncertainties in the phase-change comments
+  (``trc_uncertainty``).
+Anything else (temperature noise, a relative Cp error) is entered by the
+user.
+"""
+
+import functools
+import re
+
+import numpy as np
+
+from webbook import datastore
+from webbook.reactions import GAS_CONSTANT, STATE_SYMBOLS, species_library
+
+DEFAULT_QUANTILES = (0.025, 0.5, 0.975)
+CHUNK_ELEMENTS = 2_000_000
+MAX_DRAWS = 5_000_000
+REFERENCE_TEMPERATURE = 298.15
+REACTION_QUANTITIES = ("ΔrH", "ΔrS", "ΔrG", "log K")
+
+
+class StreamingQuantiles:
+    """Mean, standard deviation and quantiles per output point, updated chunk by chunk."""
+
+    def __init__(self, quantiles=DEFAULT_QUANTILES):
+        self.quantiles = np.asarray(quantiles, dtype=float)
+        self.count = None
+
+    def update(self, samples):
+        """Adds a ``(draws, *shape)`` chunk; NaN draws are ignored per point."""
+        shape = samples.shape[1:]
+        # One contiguous row per output point makes the partial sorts cheap.
+        rows = np.ascontiguousarray(samples.reshape(len(samples), -1).T)
+        missing = np.isnan(rows)
+        if missing.any():
+            count = len(samples) - missing.sum(axis=1)
+            rows = np.sort(rows, axis=1)  # NaN sorts last
+        else:
+            count = np.full(len(rows), len(samples))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(rows, axis=1) / count
+            m2 = np.nansum((rows - mean[:, None]) ** 2, axis=1)
+        quantiles = self._chunk_quantiles(rows, count, sorted_rows=missing.any())
+        mean, m2, quantiles = (np.nan_to_num(values.reshape(values.shape[:-1] + shape)) for values in (mean, m2, quantiles))
+        count = count.reshape(shape)
+
+        if self.count is None:
+            self.count, self.mean, self.m2, self.weighted = count, mean, m2, quantiles * count
+            return
+        total = self.count + count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - self.mean
+            share = np.where(total > 0, count / total, 0.0)
+        self.mean = self.mean + delta * share
+        self.m2 = self.m2 + m2 + delta**2 * self.count * share
+        self.weighted = self.weighted + quantiles * count
+        self.count = total
+
+    def _chunk_quantiles(self, rows, count, sorted_rows):
+        """Linear-interpolated quantiles of every row, shape (quantiles, rows).
+
+        Rows with NaN arrive sorted and use their own valid count. Without
+        NaN only the ranks that are needed get partitioned into place.
+        """
+        last = np.maximum(count - 1, 0)
+        position = self.quantiles[:, None] * last
+        below = np.floor(position).astype(int)
+        above = np.minimum(below + 1, last)
+        if not sorted_rows:
+            rows = np.partition(rows, np.unique(np.concatenate([below[:, 0], above[:, 0]])), axis=1)
+        lower = np.take_along_axis(rows, below.T, axis=1).T
+        upper = np.take_along_axis(rows, above.T, axis=1).T
+        values = lower + (upper - lower) * (position - below)
+        return np.where(count > 0, values, np.nan)
+
+    def result(self):
+        """Dict with "draws", "mean", "std" and "quantiles" (one leading row per quantile)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            valid = self.count > 0
+            std = np.sqrt(self.m2 / (self.count - 1))
+            return {
+                "draws": self.count,
+                "mean": np.where(valid, self.mean, np.nan),
+                "std": np.where(self.count > 1, std, np.nan),
+                "quantiles": np.where(valid, self.weighted / self.count, np.nan),
+            }
+
+
+def propagate(model, draws, output_size, quantiles=DEFAULT_QUANTILES, seed=0, chunk_elements=CHUNK_ELEMENTS):
+    """Runs ``draws`` samples of ``model`` in chunks of about ``chunk_elements`` outputs.
+
+    ``output_size`` is the number of values one draw produces (and sets the
+    chunk length). Returns ``StreamingQuantiles.result()``.
+    """
+    if not 0 < draws <= MAX_DRAWS:
+        raise ValueError(f"Number of draws must be between 1 and {MAX_DRAWS:,}")
+    rng = np.random.default_rng(seed)
+    estimator = StreamingQuantiles(quantiles)
+    chunk = max(1, chunk_elements // max(1, output_size))
+    for start in range(0, draws, chunk):
+        estimator.update(model(rng, min(chunk, draws - start)))
+    return estimator.result()
+
+
+def shomate_model(shomate, temperatures, sigma_T=0.0, cp_rel=0.0, sigma_S=0.0):
+    """Draws of (Cp, H° - H°298, S°) at each temperature, shape (draws, 3, len(temperatures)).
+
+    Three inputs are sampled:
+    - the temperature, independently per point with standard deviation
+      ``sigma_T``;
+    - one Cp scale factor per draw, with relative standard deviation
+      ``cp_rel``. It scales Cp and the parts of H° and S° that change from
+      298.15 K;
+    - an S°298 offset with standard deviation ``sigma_S``.
+    """
+    T = np.asarray(temperatures, dtype=float)
+    reference = np.array(shomate.evaluate(REFERENCE_TEMPERATURE, out_of_range="clip"))[:, None, None]
+
+    def model(rng, draws):
+        T_draw = T + sigma_T * rng.standard_normal((draws, len(T))) if sigma_T else np.broadcast_to(T, (draws, len(T)))
+        Cp, H_val, S_val = shomate.evaluate(T_draw, out_of_range="nan")
+        scale = 1.0 + cp_rel * rng.standard_normal((draws, 1))
+        Cp = Cp * scale
+        H_val = reference[1] + (H_val - reference[1]) * scale
+        S_val = reference[2] + (S_val - reference[2]) * scale + sigma_S * rng.standard_normal((draws, 1))
+        return np.stack([Cp, H_val, S_val], axis=1)
+
+    return model
+
+
+def antoine_model(antoine, values, direction="P from T", sigma_input=0.0, sigma_C=0.0):
+    """Draws of Antoine pressures (or temperatures), shape (draws, len(values)).
+
+    The input (a temperature or a pressure) is sampled independently per
+    point with standard deviation ``sigma_input``. C is sampled once per
+    draw with standard deviation ``sigma_C``. A change in C moves every T(P)
+    by the same amount, so the TRC boiling-point uncertainty is the natural
+    value for ``sigma_C``.
+    """
+    x = np.asarray(values, dtype=float)
+    low, high = antoine.temperature_range
+
+    def model(rng, draws):
+        x_draw = x + sigma_input * rng.standard_normal((draws, len(x))) if sigma_input else np.broadcast_to(x, (draws, len(x)))
+        C = antoine.C + sigma_C * rng.standard_normal((draws, 1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if direction == "P from T":
+                result = 10 ** (antoine.A - antoine.B / (x_draw + C))
+                valid = (x_draw >= low) & (x_draw <= high)
+            else:
+                result = antoine.B / (antoine.A - np.log10(np.where(x_draw > 0, x_draw, np.nan))) - C
+                valid = (result >= low) & (result <= high)
+        return np.where(valid, result, np.nan)
+
+    return model
+
+
+def reaction_model(reaction_set, temperatures, sigmas):
+    """Draws of ``REACTION_QUANTITIES``, shape (draws, 4, reactions, len(temperatures)).
+
+    ``sigmas`` maps species labels to (σ ΔfH° in kJ/mol, σ S° in J/mol K).
+    Each draw shifts every species' H° and S° by one normal offset, which
+    is then carried through the stoichiometry. The Shomate curves are
+    evaluated only once.
+    """
+    T = np.asarray(temperatures, dtype=float)
+    base = reaction_set.evaluate(T)
+    sigma_H = np.array([sigmas.get(label, (0.0, 0.0))[0] for label in reaction_set.species])
+    sigma_S = np.array([sigmas.get(label, (0.0, 0.0))[1] for label in reaction_set.species])
+    nu = reaction_set.stoichiometry
+
+    def model(rng, draws):
+        dH = base["ΔrH"] + ((rng.standard_normal((draws, len(sigma_H))) * sigma_H) @ nu.T)[:, :, None]
+        dS = base["ΔrS"] + ((rng.standard_normal((draws, len(sigma_S))) * sigma_S) @ nu.T)[:, :, None]
+        dG = dH - T * dS / 1000.0
+        log_k = -dG * 1000.0 / (GAS_CONSTANT * T * np.log(10))
+        return np.stack([dH, dS, dG, log_k], axis=1)
+
+    return model
+
+
+@functools.lru_cache(maxsize=1)
+def dataset_sigmas():
+    """Species label -> (σ ΔfH°, σ S°) from the ± values in the thermochemistry tables.
+
+    The tables only name the state. When a state has several phases
+    (solids), the ± value is assigned to the phase whose ΔfH°(298.15 K) is
+    closest to the tabulated ΔfH°.
+    """
+    table = datastore.load("thermo_properties")
+    quantities = table["quantity"].to_pylist()
+    values = datastore.numbers(table, "value")
+    uncertainties = np.nan_to_num(datastore.numbers(table, "uncertainty"))
+    library = species_library()
+
+    sigmas = {}
+    for state, symbol in STATE_SYMBOLS.items():
+        rows = [row for row, quantity in enumerate(quantities) if state in quantity]
+        enthalpy_rows = [row for row in rows if quantities[row].startswith("ΔfH")]
+        entropy_rows = [row for row in rows if quantities[row].startswith("S°")]
+        labels = [label for label in library if label.startswith(f"P({symbol}")]
+        if not labels or not rows:
+            continue
+        label = labels[0]
+        if len(labels) > 1 and enthalpy_rows:
+            formation = values[enthalpy_rows[0]]
+            label = min(labels, key=lambda name: abs(library[name].enthalpy(REFERENCE_TEMPERATURE, out_of_range="clip") - formation))
+        sigma_H = max((uncertainties[row] for row in enthalpy_rows), default=0.0)
+        sigma_S = max((uncertainties[row] for row in entropy_rows), default=0.0)
+        if sigma_H or sigma_S:
+            sigmas[label] = (float(sigma_H), float(sigma_S))
+    return sigmas
+
+
+def trc_uncertainty(quantity):
+    """TRC-assigned uncertainty (K) from the phase-change comments for e.g. "T(boil)", or 0.0."""
+    table = datastore.select("thermo_properties", section="phase change", quantity=quantity)
+    for comment in table["comment"].to_pylist():
+        match = re.search(r"Uncertainty assigned by TRC = ([\d.]+)", comment or "")
+        if match:
+            return float(match.group(1))
+    return 0.0
@@ -0,0 +1,287 @@
+"""Streamlit building blocks shared by several pages."""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from webbook import bulk, curves, downsample, metrics
+
+EXPORT_PREFIX = "phosphorus_"
+EXPORT_TTL = 3600  # seconds an export file is kept after it was written
+
+
+def _replace_export(key, path):
+    old = st.session_state.get(key)
+    if old and old["path"] != path and os.path.exists(old["path"]):
+        os.remove(old["path"])
+
+
+def _sweep_exports(max_age=EXPORT_TTL):
+    """Deletes export files older than ``max_age``, e.g. those of sessions that have ended."""
+    cutoff = time.time() - max_age
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            if not entry.name.startswith(EXPORT_PREFIX) or not entry.is_file():
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                pass  # removed by another session or process
+
+
+@st.fragment
+def bulk_calculator(shomate, units, key):
+    """Bulk Cp/H/S export for a temperature grid or an uploaded column of temperatures.
+
+    Results are computed in chunks and written straight to a temporary file,
+    which is then offered for download. Grids and uploads are limited to
+    ``bulk.MAX_POINTS`` rows, because the download holds the finished file in
+    memory (see ``file_export``).
+    """
+    low, high = shomate.temperature_range
+    with st.expander("Bulk calculation (temperature grid or uploaded column)"):
+        source = st.radio("Temperatures from:", ["Start/stop/step", "Uploaded CSV column"], horizontal=True, key=f"{key}_source")
+        if source == "Start/stop/step":
+            col1, col2, col3 = st.columns(3)
+            start = col1.number_input("Start (K)", min_value=low, max_value=high, value=low, key=f"{key}_start")
+            stop = col2.number_input("Stop (K)", min_value=low, max_value=high, value=high, key=f"{key}_stop")
+            step = col3.number_input("Step (K)", min_value=1e-6, value=1.0, format="%.6f", key=f"{key}_step")
+            try:
+                st.caption(f"{bulk.count_range_points(start, stop, step):,} temperatures")
+            except ValueError as error:
+                st.warning(str(error))
+                return
+            chunks = lambda: bulk.range_chunks(start, stop, step)
+        else:
+            upload = st.file_uploader("CSV with temperatures (K) in the first column", type=["csv", "txt"], key=f"{key}_upload")
+            if upload is None:
+                return
+            st.caption(f"Temperatures outside {low} - {high} K are reported as empty values.")
+            chunks = lambda: bulk.csv_chunks(upload, limit=bulk.MAX_POINTS)
+
+        file_export(lambda: bulk.property_frames(shomate, chunks(), units), f"{key}_properties", key)
+
+
+@st.fragment
+def inverse_calculator(shomate, units, key):
+    """Temperatures reaching pasted or uploaded targets of H° - H°298 or S° (inverse Shomate).
+
+    ``units`` is the same (heat capacity, enthalpy) label pair as for
+    ``bulk_calculator``. Targets outside the attainable range come back empty.
+    """
+    cp_unit, h_unit = units
+    with st.expander("Temperature from enthalpy or entropy (inverse calculation)"):
+        quantity = st.radio(
+            "Target property:", [f"Enthalpy ({h_unit})", f"Entropy ({cp_unit})"], horizontal=True, key=f"{key}_inverse_quantity"
+        )
+        text = st.text_area("Target values, separated by commas, spaces or new lines:", key=f"{key}_inverse_text")
+        upload = st.file_uploader("...or a CSV with the targets in the first column", type=["csv", "txt"], key=f"{key}_inverse_upload")
+        if upload is not None:
+            targets = np.concatenate(list(bulk.csv_chunks(upload)) or [np.empty(0)])
+        else:
+            targets = parse_numbers(text)
+        if not len(targets):
+            return
+
+        metrics.calculation("shomate_inverse")
+        if quantity.startswith("Enthalpy"):
+            temperatures = shomate.temperature_from_enthalpy(targets, out_of_range="nan")
+        else:
+            temperatures = shomate.temperature_from_entropy(targets, out_of_range="nan")
+        df = pd.DataFrame({quantity: targets, "Temperature (K)": temperatures})
+        invalid = int(np.isnan(temperatures).sum())
+        if invalid:
+            low, high = shomate.temperature_range
+            st.warning(f"{invalid:,} target(s) are not reached between {low} and {high} K.")
+        st.dataframe(df, hide_index=True)
+        st.download_button(
+            "Download CSV", df.to_csv(index=False), file_name=f"{key}_inverse.csv", mime="text/csv", key=f"{key}_inverse_download"
+        )
+
+
+def file_export(make_frames, file_stem, key):
+    """File-format choice, a "Generate file" button and the download of the result.
+
+    ``make_frames`` returns the DataFrame chunks to write; they are streamed
+    to a temporary file whose path is kept in session state. The file is
+    deleted when the session generates a replacement, or by the sweep that
+    runs on every "Generate file" once it is older than ``EXPORT_TTL``.
+    ``st.download_button`` reads the whole file into Streamlit's in-memory
+    media store on every rerun, so callers keep exports to ``bulk.MAX_POINTS``
+    rows.
+    """
+    file_format = st.radio("File format:", list(bulk.WRITERS), horizontal=True, key=f"{key}_format")
+    writer, extension, mime = bulk.WRITERS[file_format]
+
+    if st.button("Generate file", key=f"{key}_generate"):
+        _sweep_exports()
+        handle, path = tempfile.mkstemp(suffix=f".{extension}", prefix=EXPORT_PREFIX)
+        os.close(handle)
+        try:
+            with st.spinner("Calculating..."):
+                metrics.calculation(f"{key}_export")
+                rows = writer(make_frames(), path)
+        except ValueError as error:
+            os.remove(path)
+            st.error(str(error))
+            return
+        _replace_export(f"{key}_export", path)
+        st.session_state[f"{key}_export"] = {"path": path, "rows": rows, "extension": extension, "mime": mime}
+
+    export = st.session_state.get(f"{key}_export")
+    if not export:
+        return
+    try:
+        handle = open(export["path"], "rb")
+    except FileNotFoundError:
+        st.info("The generated file has expired; generate it again.")
+        return
+    st.write(f"{export['rows']:,} rows ready.")
+    with handle:
+        st.download_button(
+            "Download results",
+            handle,
+            file_name=f"{file_stem}.{export['extension']}",
+            mime=export["mime"],
+            key=f"{key}_download",
+        )
+
+
+def parse_numbers(text):
+    values = []
+    for token in text.replace(",", " ").split():
+        try:
+            values.append(float(token))
+        except ValueError:
+            pass
+    return np.array(values, dtype=float)
+
+
+@st.fragment
+def antoine_batch(antoine, direction, key):
+    """Batch Antoine evaluation for pasted or uploaded values.
+
+    ``direction`` is "P from T" or "T from P". Values outside the valid range
+    are kept in the output with an empty result.
+    """
+    source_label, result_label = (
+        ("Temperature (K)", "Vapor Pressure (atm)") if direction == "P from T"
+        else ("Vapor Pressure (atm)", "Temperature (K)")
+    )
+    with st.expander(f"Batch calculation ({direction})"):
+        text = st.text_area(f"{source_label} values, separated by commas, spaces or new lines:", key=f"{key}_text")
+        upload = st.file_uploader("...or a CSV with the values in the first column", type=["csv", "txt"], key=f"{key}_upload")
+        if upload is not None:
+            values = np.concatenate(list(bulk.csv_chunks(upload)) or [np.empty(0)])
+        else:
+            values = parse_numbers(text)
+        if not len(values):
+            return
+
+        solve = antoine.pressure if direction == "P from T" else antoine.temperature
+        metrics.calculation("antoine_batch")
+        results = solve(values, out_of_range="nan")
+        df = pd.DataFrame({source_label: values, result_label: results})
+        invalid = int(np.isnan(results).sum())
+        if invalid:
+            low, high = antoine.temperature_range
+            st.warning(f"{invalid:,} value(s) fall outside the valid range ({low} - {high} K).")
+        st.dataframe(df, hide_index=True)
+        st.download_button("Download CSV", df.to_csv(index=False), file_name="antoine.csv", mime="text/csv", key=f"{key}_download")
+
+
+DRAW_OPTIONS = [10_000, 100_000, 1_000_000, 5_000_000]
+
+
+def draw_count(key):
+    """Number of Monte Carlo draws."""
+    return st.select_slider(
+        "Monte Carlo draws", DRAW_OPTIONS, value=100_000, format_func="{:,}".format, key=f"{key}_draws"
+    )
+
+
+def band_chart(frame, label, key):
+    """Mean and 2.5/50/97.5% quantile lines for one output of a ``curves.*_bands`` frame, plus its CSV."""
+    x_label = frame.columns[0]
+    columns = [f"{label} 2.5%", f"{label} 50%", f"{label} 97.5%", f"{label} mean"]
+    st.line_chart(frame.set_index(x_label)[columns], use_container_width=True)
+    st.download_button(
+        "Download bands (CSV)", frame.to_csv(index=False), file_name=f"{key}_uncertainty.csv", mime="text/csv", key=f"{key}_bands_download"
+    )
+
+
+@st.fragment
+def shomate_uncertainty(shomate, units, sigma_S, key):
+    """Monte Carlo confidence bands for Cp, H° - H°298 and S° over the coefficient range.
+
+    ``sigma_S`` is the S° uncertainty from the data (in the displayed unit),
+    and it is the default for the entropy input.
+    """
+    cp_unit, h_unit = units
+    with st.expander("Uncertainty (Monte Carlo)"):
+        col1, col2, col3 = st.columns(3)
+        sigma_T = col1.number_input("σ Temperature (K)", min_value=0.0, value=0.0, key=f"{key}_sigma_t")
+        cp_rel = col2.number_input("σ Cp (%)", min_value=0.0, value=0.0, key=f"{key}_sigma_cp") / 100
+        sigma_S = col3.number_input(f"σ S°298 ({cp_unit})", min_value=0.0, value=float(sigma_S), format="%.4f", key=f"{key}_sigma_s")
+        draws = draw_count(key)
+        quantity = st.radio(
+            "Show:", ["Heat Capacity", "Enthalpy", "Entropy"], horizontal=True, key=f"{key}_band_quantity"
+        )
+        if not st.checkbox("Compute confidence bands", key=f"{key}_bands"):
+            return
+        if not (sigma_T or cp_rel or sigma_S):
+            st.caption("Enter at least one non-zero uncertainty to sample.")
+            return
+
+        metrics.calculation("shomate_uncertainty")
+        frame = curves.shomate_bands(
+            tuple(shomate.breakpoints), tuple(map(tuple, shomate.coefficients)), 50, draws, sigma_T, cp_rel, sigma_S
+        )
+        unit = h_unit if quantity == "Enthalpy" else cp_unit
+        st.markdown(f"**X-axis:** Temperature (K)  |  **Y-axis:** {quantity} ({unit}), 95% band")
+        band_chart(frame, quantity, key)
+
+
+@st.fragment
+def antoine_uncertainty(antoine, sigma_C, key):
+    """Monte Carlo confidence band for the vapor pressure; ``sigma_C`` defaults to the TRC T(boil) uncertainty."""
+    with st.expander("Uncertainty (Monte Carlo)"):
+        col1, col2 = st.columns(2)
+        sigma_T = col1.number_input("σ Temperature (K)", min_value=0.0, value=0.0, key=f"{key}_sigma_t")
+        sigma_C = col2.number_input(
+            "σ C (K)", min_value=0.0, value=float(sigma_C), key=f"{key}_sigma_c",
+            help="Shifts T(P) uniformly; the default is the TRC uncertainty of the boiling point.",
+        )
+        draws = draw_count(key)
+        if not st.checkbox("Compute confidence band", key=f"{key}_bands"):
+            return
+        if not (sigma_T or sigma_C):
+            st.caption("Enter at least one non-zero uncertainty to sample.")
+            return
+
+        metrics.calculation("antoine_uncertainty")
+        frame = curves.antoine_bands(antoine.A, antoine.B, antoine.C, *antoine.temperature_range, 50, draws, sigma_T, sigma_C)
+        st.markdown("**X-axis:** Temperature (K)  |  **Y-axis:** Vapor Pressure (atm), 95% band")
+        band_chart(frame, "Vapor Pressure", key)
+
+
+def curve_resolution(key):
+    """Grid size and downsampling method for a property curve."""
+    col1, col2 = st.columns(2)
+    points = col1.select_slider(
+        "Grid points", curves.RESOLUTIONS, value=10_000, format_func="{:,}".format, key=f"{key}_points"
+    )
+    method = col2.radio("Downsampling", list(downsample.METHODS), horizontal=True, key=f"{key}_method")
+    return points, method
+
+
+def curve_chart(curve):
+    """Line chart of a downsampled ``(frame, grid_size)`` curve, indexed by its first column."""
+    frame, grid_size = curve
+    st.line_chart(frame.set_index(frame.columns[0]), use_container_width=True)
+    st.caption(f"{grid_size:,} points computed, {len(frame):,} plotted")
@@ -0,0 +1,90 @@
+"""Energy-window queries over XPS lines of every compound at once.
+
+``XPSIndex`` keeps the binding energies sorted, so "all lines within ±δ eV
+of E" is two binary searches and nearest-peak lookups are one, regardless of
+how many records are loaded. The records come from the ``xps`` table of the
+memory-mapped dataset (``data/source/xps.csv``); larger exports of the NIST
+XPS database only need to be added there and rebuilt.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+from webbook import datastore
+
+SUBSET_CACHE_SIZE = 64  # compound selections kept across all sessions
+
+
+class XPSIndex:
+    """XPS lines sorted by binding energy, with compounds stored as integer codes."""
+
+    def __init__(self, energies, lines, compounds):
+        energies = np.asarray(energies, dtype=float)
+        order = np.argsort(energies, kind="stable")
+        self.energies = energies[order]
+        self.lines = np.asarray(lines, dtype=object)[order]
+        self.compounds, codes = np.unique(np.asarray(compounds, dtype=object)[order], return_inverse=True)
+        self.codes = codes.astype(np.int32)
+
+    @classmethod
+    def from_table(cls, table):
+        return cls(
+            datastore.numbers(table, "binding_energy_ev"),
+            table["spectral_line"].to_pylist(),
+            table["compound"].to_pylist(),
+        )
+
+    def __len__(self):
+        return len(self.energies)
+
+    def subset(self, compounds):
+        """Index restricted to some compounds; recent selections are reused (see ``_subset``)."""
+        key = frozenset(compounds)
+        if key == frozenset(self.compounds):
+            return self
+        return _subset(self, key)
+
+    def window(self, energy, delta):
+        """Positions of the lines with |E_b - energy| <= delta, in energy order."""
+        if delta < 0:
+            raise ValueError("The energy window must be non-negative")
+        start = np.searchsorted(self.energies, energy - delta, side="left")
+        stop = np.searchsorted(self.energies, energy + delta, side="right")
+        return np.arange(start, stop)
+
+    def nearest(self, energies):
+        """Position of the closest line to each query energy (vectorized)."""
+        if not len(self):
+            raise ValueError("The index is empty")
+        energies = np.asarray(energies, dtype=float)
+        right = np.clip(np.searchsorted(self.energies, energies), 0, len(self) - 1)
+        left = np.clip(right - 1, 0, len(self) - 1)
+        closer_left = np.abs(energies - self.energies[left]) <= np.abs(self.energies[right] - energies)
+        return np.where(closer_left, left, right)
+
+    def frame(self, positions, reference=None):
+        """Lines at ``positions`` as a DataFrame, with the offset from ``reference`` when given."""
+        positions = np.asarray(positions, dtype=np.intp)
+        data = {
+            "Compound": self.compounds[self.codes[positions]],
+            "Spectral Line": self.lines[positions],
+            "Energy (eV)": self.energies[positions],
+        }
+        if reference is not None:
+            data["ΔE (eV)"] = self.energies[positions] - reference
+        return pd.DataFrame(data)
+
+
+@functools.lru_cache(maxsize=SUBSET_CACHE_SIZE)
+def _subset(index, compounds):
+    """Index over a frozenset of compounds; bounded, so memory stays fixed for the life of the server."""
+    mask = np.isin(index.compounds[index.codes], list(compounds))
+    return XPSIndex(index.energies[mask], index.lines[mask], index.compounds[index.codes[mask]])
+
+
+@functools.lru_cache(maxsize=1)
+def load_index():
+    """The process-wide index over the dataset's XPS table."""
+    return XPSIndex.from_table(datastore.load("xps"))